@@ -1,25 +1,41 @@
-"""Alembic env.py — async SQLAlchemy support."""
+"""Alembic env.py — sync SQLAlchemy engine for migrations."""
 
-import asyncio
 from logging.config import fileConfig
 
 from alembic import context
-from sqlalchemy.ext.asyncio import async_engine_from_config
-from sqlalchemy import pool
+from pymysql.constants import CLIENT
+from sqlalchemy import create_engine, pool
 
 config = context.config
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
-# Import all models so Alembic can detect them
-from angie.db.session import Base  # noqa: E402
-from angie.models import *  # noqa: E402, F401, F403
 
-target_metadata = Base.metadata
+def _load_metadata():
+    """Import every ORM model and return the metadata — autogenerate only.
+
+    ``target_metadata`` is only consulted when comparing the models against
+    the database (``revision --autogenerate`` / ``check``).  Plain upgrades,
+    downgrades and ``current`` skip importing the whole model layer.
+    Programmatic invocations (no ``cmd_opts``) load it to stay safe.
+    """
+    cmd_opts = config.cmd_opts
+    if cmd_opts is not None:
+        command = cmd_opts.cmd[0].__name__
+        if not getattr(cmd_opts, "autogenerate", False) and command != "check":
+            return None
+
+    # Import all models so Alembic can detect them
+    import angie.models  # noqa: F401
+    from angie.db.session import Base
+
+    return Base.metadata
 
 
 def get_url() -> str:
+    """Resolve the sync database URL — the only place env.py reads settings."""
     from angie.config import get_settings
+
     return get_settings().database_url_sync
 
 
@@ -27,7 +43,7 @@ def run_migrations_offline() -> None:
     url = get_url()
     context.configure(
         url=url,
-        target_metadata=target_metadata,
+        target_metadata=_load_metadata(),
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -36,26 +52,27 @@ def run_migrations_offline() -> None:
 
 
 def do_run_migrations(connection):
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(connection=connection, target_metadata=_load_metadata())
     with context.begin_transaction():
         context.run_migrations()
 
 
-async def run_migrations_online() -> None:
-    from angie.config import get_settings
-    settings = get_settings()
-
-    connectable = async_engine_from_config(
-        {"sqlalchemy.url": settings.database_url},
-        prefix="sqlalchemy.",
+def run_migrations_online() -> None:
+    # Alembic drives a single connection serially, so the async engine only
+    # added a greenlet hop per statement; use the sync driver directly.
+    connectable = create_engine(
+        get_url(),
         poolclass=pool.NullPool,
+        # Migrations ship batched DDL scripts in one round-trip; FOUND_ROWS
+        # mirrors the flag SQLAlchemy sets by default for MySQL drivers.
+        connect_args={"client_flag": CLIENT.MULTI_STATEMENTS | CLIENT.FOUND_ROWS},
     )
-    async with connectable.connect() as connection:
-        await connection.run_sync(do_run_migrations)
-    await connectable.dispose()
+    with connectable.connect() as connection:
+        do_run_migrations(connection)
+    connectable.dispose()
 
 
 if context.is_offline_mode():
     run_migrations_offline()
 else:
-    asyncio.run(run_migrations_online())
+    run_migrations_online()
@@ -7,7 +7,8 @@ Create Date: 2025-01-01 00:00:00.000000
 from typing import Sequence, Union
 
 import sqlalchemy as sa
-from alembic import op
+from alembic import context, op
+from sqlalchemy.schema import CreateIndex, CreateTable, DropTable
 
 revision: str = "0001_initial"
 down_revision: Union[str, None] = None
@@ -15,9 +16,44 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
+def _exec_batch(stmts: list) -> None:
+    """Ship a list of DDL constructs to the server in a single submission.
+
+    Online, the statements are compiled for the bound dialect and sent as one
+    ``;``-joined script (the migration connection enables MySQL
+    multi-statements, see ``env.py``), then every result set is drained so an
+    error in any statement surfaces here.  Offline (``--sql``) mode emits the
+    statements one by one to keep the generated script readable.
+    """
+    if context.is_offline_mode():
+        for stmt in stmts:
+            op.execute(stmt)
+        return
+
+    bind = op.get_bind()
+    script = ";\n".join(str(stmt.compile(dialect=bind.dialect)).strip() for stmt in stmts)
+    cursor = bind.connection.cursor()
+    try:
+        cursor.execute(script)
+        while cursor.nextset():
+            pass
+    finally:
+        cursor.close()
+
+
+def _create_statements(table: sa.Table) -> list:
+    """Return the CREATE TABLE statement followed by the table's own indexes."""
+    indexes = sorted(table.indexes, key=lambda index: index.name)
+    return [CreateTable(table), *(CreateIndex(index) for index in indexes)]
+
+
 def upgrade() -> None:
-    op.create_table(
+    metadata = sa.MetaData()
+    stmts: list = []
+
+    users = sa.Table(
         "users",
+        metadata,
         sa.Column("id", sa.String(36), primary_key=True),
         sa.Column("email", sa.String(255), nullable=False),
         sa.Column("username", sa.String(100), nullable=False),
@@ -31,12 +67,14 @@ def upgrade() -> None:
         sa.Column("updated_at", sa.DateTime(), server_default=sa.text("CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP"), nullable=False),
         sa.UniqueConstraint("email"),
         sa.UniqueConstraint("username"),
+        sa.Index("ix_users_email", "email"),
+        sa.Index("ix_users_username", "username"),
     )
-    op.create_index("ix_users_email", "users", ["email"])
-    op.create_index("ix_users_username", "users", ["username"])
+    stmts.extend(_create_statements(users))
 
-    op.create_table(
+    agents = sa.Table(
         "agents",
+        metadata,
         sa.Column("id", sa.String(36), primary_key=True),
         sa.Column("name", sa.String(100), nullable=False),
         sa.Column("slug", sa.String(100), nullable=False),
@@ -49,12 +87,14 @@ def upgrade() -> None:
         sa.Column("updated_at", sa.DateTime(), server_default=sa.text("CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP"), nullable=False),
         sa.UniqueConstraint("name"),
         sa.UniqueConstraint("slug"),
+        sa.Index("ix_agents_name", "name"),
+        sa.Index("ix_agents_slug", "slug"),
     )
-    op.create_index("ix_agents_name", "agents", ["name"])
-    op.create_index("ix_agents_slug", "agents", ["slug"])
+    stmts.extend(_create_statements(agents))
 
-    op.create_table(
+    teams = sa.Table(
         "teams",
+        metadata,
         sa.Column("id", sa.String(36), primary_key=True),
         sa.Column("name", sa.String(100), nullable=False),
         sa.Column("slug", sa.String(100), nullable=False),
@@ -64,19 +104,23 @@ def upgrade() -> None:
         sa.Column("updated_at", sa.DateTime(), server_default=sa.text("CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP"), nullable=False),
         sa.UniqueConstraint("name"),
         sa.UniqueConstraint("slug"),
+        sa.Index("ix_teams_name", "name"),
+        sa.Index("ix_teams_slug", "slug"),
     )
-    op.create_index("ix_teams_name", "teams", ["name"])
-    op.create_index("ix_teams_slug", "teams", ["slug"])
+    stmts.extend(_create_statements(teams))
 
-    op.create_table(
+    team_agents = sa.Table(
         "team_agents",
+        metadata,
         sa.Column("team_id", sa.String(36), sa.ForeignKey("teams.id"), primary_key=True),
         sa.Column("agent_id", sa.String(36), sa.ForeignKey("agents.id"), primary_key=True),
         sa.Column("role", sa.String(100), nullable=True),
     )
+    stmts.extend(_create_statements(team_agents))
 
-    op.create_table(
+    workflows = sa.Table(
         "workflows",
+        metadata,
         sa.Column("id", sa.String(36), primary_key=True),
         sa.Column("name", sa.String(100), nullable=False),
         sa.Column("slug", sa.String(100), nullable=False),
@@ -88,12 +132,14 @@ def upgrade() -> None:
         sa.Column("updated_at", sa.DateTime(), server_default=sa.text("CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP"), nullable=False),
         sa.UniqueConstraint("name"),
         sa.UniqueConstraint("slug"),
+        sa.Index("ix_workflows_name", "name"),
+        sa.Index("ix_workflows_slug", "slug"),
     )
-    op.create_index("ix_workflows_name", "workflows", ["name"])
-    op.create_index("ix_workflows_slug", "workflows", ["slug"])
+    stmts.extend(_create_statements(workflows))
 
-    op.create_table(
+    tasks = sa.Table(
         "tasks",
+        metadata,
         sa.Column("id", sa.String(36), primary_key=True),
         sa.Column("user_id", sa.String(36), sa.ForeignKey("users.id"), nullable=False),
         sa.Column("agent_id", sa.String(36), sa.ForeignKey("agents.id"), nullable=True),
@@ -113,12 +159,14 @@ def upgrade() -> None:
         sa.Column("retry_count", sa.Integer(), default=0),
         sa.Column("created_at", sa.DateTime(), server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False),
         sa.Column("updated_at", sa.DateTime(), server_default=sa.text("CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP"), nullable=False),
+        sa.Index("ix_tasks_celery_task_id", "celery_task_id"),
+        sa.Index("ix_tasks_status", "status"),
     )
-    op.create_index("ix_tasks_celery_task_id", "tasks", ["celery_task_id"])
-    op.create_index("ix_tasks_status", "tasks", ["status"])
+    stmts.extend(_create_statements(tasks))
 
-    op.create_table(
+    workflow_steps = sa.Table(
         "workflow_steps",
+        metadata,
         sa.Column("id", sa.String(36), primary_key=True),
         sa.Column("workflow_id", sa.String(36), sa.ForeignKey("workflows.id"), nullable=False),
         sa.Column("agent_id", sa.String(36), sa.ForeignKey("agents.id"), nullable=True),
@@ -130,9 +178,11 @@ def upgrade() -> None:
         sa.Column("created_at", sa.DateTime(), server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False),
         sa.Column("updated_at", sa.DateTime(), server_default=sa.text("CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP"), nullable=False),
     )
+    stmts.extend(_create_statements(workflow_steps))
 
-    op.create_table(
+    events = sa.Table(
         "events",
+        metadata,
         sa.Column("id", sa.String(36), primary_key=True),
         sa.Column(
             "type",
@@ -149,12 +199,14 @@ def upgrade() -> None:
         sa.Column("task_id", sa.String(36), sa.ForeignKey("tasks.id"), nullable=True),
         sa.Column("created_at", sa.DateTime(), server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False),
         sa.Column("updated_at", sa.DateTime(), server_default=sa.text("CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP"), nullable=False),
+        sa.Index("ix_events_type", "type"),
+        sa.Index("ix_events_processed", "processed"),
     )
-    op.create_index("ix_events_type", "events", ["type"])
-    op.create_index("ix_events_processed", "events", ["processed"])
+    stmts.extend(_create_statements(events))
 
-    op.create_table(
+    prompts = sa.Table(
         "prompts",
+        metadata,
         sa.Column("id", sa.String(36), primary_key=True),
         sa.Column("user_id", sa.String(36), sa.ForeignKey("users.id"), nullable=True),
         sa.Column("agent_id", sa.String(36), sa.ForeignKey("agents.id"), nullable=True),
@@ -169,11 +221,13 @@ def upgrade() -> None:
         sa.Column("version", sa.Integer(), default=1),
         sa.Column("created_at", sa.DateTime(), server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False),
         sa.Column("updated_at", sa.DateTime(), server_default=sa.text("CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP"), nullable=False),
+        sa.Index("ix_prompts_type", "type"),
     )
-    op.create_index("ix_prompts_type", "prompts", ["type"])
+    stmts.extend(_create_statements(prompts))
 
-    op.create_table(
+    channel_configs = sa.Table(
         "channel_configs",
+        metadata,
         sa.Column("id", sa.String(36), primary_key=True),
         sa.Column("user_id", sa.String(36), sa.ForeignKey("users.id"), nullable=False),
         sa.Column(
@@ -185,18 +239,29 @@ def upgrade() -> None:
         sa.Column("config", sa.JSON(), default=dict),
         sa.Column("created_at", sa.DateTime(), server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False),
         sa.Column("updated_at", sa.DateTime(), server_default=sa.text("CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP"), nullable=False),
+        sa.Index("ix_channel_configs_type", "type"),
     )
-    op.create_index("ix_channel_configs_type", "channel_configs", ["type"])
+    stmts.extend(_create_statements(channel_configs))
+
+    _exec_batch(stmts)
 
 
 def downgrade() -> None:
-    op.drop_table("channel_configs")
-    op.drop_table("prompts")
-    op.drop_table("events")
-    op.drop_table("workflow_steps")
-    op.drop_table("tasks")
-    op.drop_table("workflows")
-    op.drop_table("team_agents")
-    op.drop_table("teams")
-    op.drop_table("agents")
-    op.drop_table("users")
+    metadata = sa.MetaData()
+    _exec_batch(
+        [
+            DropTable(sa.Table(name, metadata))
+            for name in (
+                "channel_configs",
+                "prompts",
+                "events",
+                "workflow_steps",
+                "tasks",
+                "workflows",
+                "team_agents",
+                "teams",
+                "agents",
+                "users",
+            )
+        ]
+    )
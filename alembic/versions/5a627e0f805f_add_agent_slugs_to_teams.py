@@ -17,9 +17,20 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    op.add_column("teams", sa.Column("agent_slugs", sa.JSON(), nullable=True))
-    op.execute("UPDATE teams SET agent_slugs = '[]' WHERE agent_slugs IS NULL")
-    op.alter_column("teams", "agent_slugs", nullable=False, existing_type=sa.JSON)
+    # The server default backfills existing rows as part of the ADD COLUMN
+    # (MySQL only accepts JSON defaults as expressions, hence the parens),
+    # then it is dropped again so the column has no default going forward.
+    op.add_column(
+        "teams",
+        sa.Column("agent_slugs", sa.JSON(), nullable=False, server_default=sa.text("('[]')")),
+    )
+    op.alter_column(
+        "teams",
+        "agent_slugs",
+        server_default=None,
+        existing_type=sa.JSON(),
+        existing_nullable=False,
+    )
 
 
 def downgrade() -> None:
@@ -48,19 +48,19 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
         sa.PrimaryKeyConstraint("id"),
     )
-    op.create_index(op.f("ix_token_usage_user_id"), "token_usage", ["user_id"])
-    op.create_index(op.f("ix_token_usage_agent_slug"), "token_usage", ["agent_slug"])
-    op.create_index(op.f("ix_token_usage_task_id"), "token_usage", ["task_id"])
-    op.create_index(
-        op.f("ix_token_usage_conversation_id"), "token_usage", ["conversation_id"]
+    # One ALTER builds all five secondary indexes in a single pass over the
+    # table; INPLACE/LOCK=NONE keeps it an online (non-blocking) build.
+    op.execute(
+        "ALTER TABLE token_usage"
+        " ADD INDEX ix_token_usage_user_id (user_id),"
+        " ADD INDEX ix_token_usage_agent_slug (agent_slug),"
+        " ADD INDEX ix_token_usage_task_id (task_id),"
+        " ADD INDEX ix_token_usage_conversation_id (conversation_id),"
+        " ADD INDEX ix_token_usage_created_at (created_at),"
+        " ALGORITHM=INPLACE, LOCK=NONE"
     )
-    op.create_index(op.f("ix_token_usage_created_at"), "token_usage", ["created_at"])
 
 
 def downgrade() -> None:
-    op.drop_index(op.f("ix_token_usage_created_at"), table_name="token_usage")
-    op.drop_index(op.f("ix_token_usage_conversation_id"), table_name="token_usage")
-    op.drop_index(op.f("ix_token_usage_task_id"), table_name="token_usage")
-    op.drop_index(op.f("ix_token_usage_agent_slug"), table_name="token_usage")
-    op.drop_index(op.f("ix_token_usage_user_id"), table_name="token_usage")
+    # Dropping the table drops its indexes with it.
     op.drop_table("token_usage")
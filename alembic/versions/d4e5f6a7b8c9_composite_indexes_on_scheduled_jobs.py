@@ -0,0 +1,39 @@
+"""composite indexes on scheduled_jobs
+
+Revision ID: d4e5f6a7b8c9
+Revises: c3d4e5f6a7b8
+Create Date: 2026-10-16 12:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "d4e5f6a7b8c9"
+down_revision: Union[str, None] = "c3d4e5f6a7b8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Replace the single-column indexes with ones matching the scheduler's
+    # access paths: enabled jobs ordered by due time, and a user's jobs
+    # filtered by enabled state.  Both changes go in one ALTER so the
+    # user_id FK is backed by an index throughout.
+    op.execute(
+        "ALTER TABLE scheduled_jobs"
+        " ADD INDEX ix_scheduled_jobs_due (is_enabled, next_run_at),"
+        " ADD INDEX ix_scheduled_jobs_user_enabled (user_id, is_enabled),"
+        " DROP INDEX ix_scheduled_jobs_is_enabled,"
+        " DROP INDEX ix_scheduled_jobs_user_id"
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER TABLE scheduled_jobs"
+        " ADD INDEX ix_scheduled_jobs_is_enabled (is_enabled),"
+        " ADD INDEX ix_scheduled_jobs_user_id (user_id),"
+        " DROP INDEX ix_scheduled_jobs_due,"
+        " DROP INDEX ix_scheduled_jobs_user_enabled"
+    )
@@ -0,0 +1,50 @@
+"""server defaults for initial columns
+
+Revision ID: e5f6a7b8c9d0
+Revises: d4e5f6a7b8c9
+Create Date: 2026-10-16 12:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "e5f6a7b8c9d0"
+down_revision: Union[str, None] = "d4e5f6a7b8c9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# table -> [(column, default)] for the columns 0001_initial gave only
+# Python-side defaults.  MySQL 8 only accepts JSON defaults as expressions,
+# hence ('{}') / ('[]').
+_DEFAULTS: dict[str, list[tuple[str, str]]] = {
+    "users": [("is_active", "1"), ("is_superuser", "0"), ("timezone", "'UTC'")],
+    "agents": [("is_enabled", "1"), ("capabilities", "('[]')"), ("config", "('{}')")],
+    "workflows": [("is_enabled", "1")],
+    "tasks": [
+        ("status", "'pending'"),
+        ("input_data", "('{}')"),
+        ("output_data", "('{}')"),
+        ("retry_count", "0"),
+    ],
+    "workflow_steps": [("config", "('{}')"), ("on_failure", "'stop'")],
+    "events": [("payload", "('{}')"), ("processed", "0")],
+    "prompts": [("is_active", "1"), ("version", "1")],
+    "channel_configs": [("is_enabled", "1"), ("config", "('{}')")],
+}
+
+
+def upgrade() -> None:
+    # Rows inserted outside the ORM (bulk loads, raw SQL) get the same
+    # values the models fill in.  One ALTER per table.
+    for table, columns in _DEFAULTS.items():
+        clauses = ", ".join(
+            f"ALTER COLUMN {column} SET DEFAULT {default}" for column, default in columns
+        )
+        op.execute(f"ALTER TABLE {table} {clauses}")
+
+
+def downgrade() -> None:
+    for table, columns in _DEFAULTS.items():
+        clauses = ", ".join(f"ALTER COLUMN {column} DROP DEFAULT" for column, _ in columns)
+        op.execute(f"ALTER TABLE {table} {clauses}")
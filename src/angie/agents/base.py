@@ -2,18 +2,71 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
+import re
+import sys
+import time
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from functools import cached_property
+from types import ModuleType
 from typing import TYPE_CHECKING, Any, ClassVar
 
 from angie.config import get_settings
 from angie.core.prompts import get_prompt_manager
 
 if TYPE_CHECKING:
+    from collections.abc import Container
+
     from pydantic_ai import Agent
 
 logger = logging.getLogger(__name__)
 
+# Heavy LLM modules, imported once on the first ask_llm() call
+_pydantic_ai: ModuleType | None = None
+_llm: ModuleType | None = None
+
+
+# ask_llm() responses keyed by blake2b(system, prompt, model), oldest first
+_llm_responses: dict[bytes, tuple[float, str]] = {}
+# Cache misses currently being answered, so concurrent duplicates share them
+_llm_inflight: dict[bytes, asyncio.Future[str]] = {}
+
+
+@dataclass(frozen=True)
+class CachingConfig:
+    """Response caching policy for ``BaseAgent.ask_llm()``."""
+
+    enabled: bool = True
+    ttl: float = 3600.0
+    maxsize: int = 1024
+
+
+def _resolve_llm() -> None:
+    """Import pydantic-ai and the LLM factory once and memoize the modules.
+
+    The modules (not their attributes) are kept so ``pydantic_ai.Agent`` and
+    ``angie.llm.get_llm_model`` are still resolved at call time.
+    """
+    global _pydantic_ai, _llm
+    import pydantic_ai
+
+    from angie import llm
+
+    _pydantic_ai, _llm = pydantic_ai, llm
+
+
+# Fixed segments of _build_context_prompt()
+_CONTEXT_HEADER = "## Conversation Context"
+_TASK_HEADER = "---\n## Your Task"
+
+
+def _response_key(system: str, prompt: str, model: Any) -> bytes:
+    model_id = str(getattr(model, "model_name", type(model).__name__))
+    return hashlib.blake2b(f"{system}\x00{prompt}\x00{model_id}".encode()).digest()
+
 
 class BaseAgent(ABC):
     """
@@ -37,12 +90,44 @@ class BaseAgent(ABC):
     capabilities: ClassVar[list[str]] = []
     instructions: ClassVar[str] = ""
     category: ClassVar[str] = "General"
+    # Mark the system prompt and tool schemas as a cacheable prefix
+    use_prompt_caching: ClassVar[bool] = True
+    # Reuse identical non-personalized ask_llm() answers; off unless the
+    # agent's ask_llm() prompts are pure functions of their text
+    response_cache: ClassVar[CachingConfig] = CachingConfig(enabled=False)
+    # Seconds to reuse execute() results for a repeated intent (0 = off)
+    intent_cache_ttl: ClassVar[float] = 0.0
+
+    # Bound once per subclass in __init_subclass__
+    _cached_logger: ClassVar[logging.Logger | None] = None
+    _caps_lower: ClassVar[tuple[str, ...]] = ()
+    _caps_re: ClassVar[re.Pattern[str] | None] = None
+    # Model-less pydantic-ai Agents used by ask_llm(), keyed by system prompt
+    _llm_agents: ClassVar[dict[str, Agent]] = {}
+    _llm_agents_max: ClassVar[int] = 32
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        slug = cls.__dict__.get("slug")
+        if slug is not None:
+            cls._cached_logger = logging.getLogger(f"angie.agents.{slug}")
+        # Lowercase capability keywords once and fold them into a single
+        # alternation so keyword checks are one linear scan of the text.
+        cls._caps_lower = tuple(cap.lower() for cap in cls.capabilities)
+        cls._caps_re = (
+            re.compile("|".join(re.escape(cap) for cap in cls._caps_lower))
+            if cls._caps_lower
+            else None
+        )
+        cls._llm_agents = {}
 
     def __init__(self) -> None:
+        # Both are process-wide singletons; the per-slug logger is resolved
+        # once per subclass rather than on every instantiation.
         self.settings = get_settings()
         self.prompt_manager = get_prompt_manager()
         self._pydantic_agent: Agent | None = None
-        self.logger = logging.getLogger(f"angie.agents.{self.slug}")
+        self.logger = type(self)._cached_logger or logging.getLogger(f"angie.agents.{self.slug}")
 
     @abstractmethod
     async def execute(self, task: dict[str, Any]) -> dict[str, Any]:
@@ -91,15 +176,18 @@ class BaseAgent(ABC):
 
         Returns the full AgentRunResult so callers can extract ``.output``.
         """
-        from angie.core.token_usage import record_usage
+        from angie.core.token_usage import track_usage
 
         kwargs: dict[str, Any] = {"model": model}
         if deps is not None:
             kwargs["deps"] = deps
+        model_settings = self._model_settings()
+        if model_settings is not None:
+            kwargs["model_settings"] = model_settings
 
         result = await self._get_agent().run(prompt, **kwargs)
 
-        await record_usage(
+        await track_usage(
             user_id=user_id,
             agent_slug=self.slug,
             usage=result.usage(),
@@ -110,6 +198,14 @@ class BaseAgent(ABC):
 
         return result
 
+    def _model_settings(self) -> dict[str, Any] | None:
+        """Return per-run model settings (provider prompt caching), if any."""
+        if not self.use_prompt_caching:
+            return None
+        if _llm is None:
+            _resolve_llm()
+        return _llm.prompt_cache_settings()
+
     # ------------------------------------------------------------------
     # Confidence scoring (for smart routing)
     # ------------------------------------------------------------------
@@ -126,15 +222,18 @@ class BaseAgent(ABC):
         if task_slug:
             return 0.0  # Different agent explicitly requested
 
-        title = task.get("title", "").lower()
-        text = task.get("input_data", {}).get("text", "").lower()
-        combined = f"{title} {text}"
+        return self._keyword_confidence(self._match_text(task))
 
-        if not self.capabilities:
-            return 0.0
+    def _keyword_confidence(self, matched: Container[str]) -> float:
+        """Score the capability keywords found in *matched*.
 
-        matches = sum(1 for cap in self.capabilities if cap.lower() in combined)
-        return min(matches / len(self.capabilities), 1.0) * 0.8  # Cap at 0.8 for keyword
+        *matched* is the task's lowercased text, or the set of keywords the
+        registry already found in it (see ``AgentRegistry._candidates``).
+        """
+        if not self._caps_lower:
+            return 0.0
+        matches = sum(1 for cap in self._caps_lower if cap in matched)
+        return min(matches / len(self._caps_lower), 1.0) * 0.8  # Cap at 0.8 for keyword
 
     # ------------------------------------------------------------------
     # Autonomous capabilities
@@ -163,36 +262,61 @@ class BaseAgent(ABC):
         Creates a one-shot scheduled job in the DB that fires after delay_seconds.
         Returns the scheduled job ID on success, or ``None`` if the DB write failed.
         """
+        job_ids = await self.schedule_followups(
+            [
+                {
+                    "user_id": user_id,
+                    "delay_seconds": delay_seconds,
+                    "title": title,
+                    "intent": intent,
+                    "agent_slug": agent_slug,
+                    "conversation_id": conversation_id,
+                }
+            ]
+        )
+        return job_ids[0] if job_ids else None
+
+    async def schedule_followups(self, followups: list[dict[str, Any]]) -> list[str] | None:
+        """Schedule several follow-ups with one session and a single commit.
+
+        Each entry takes the keyword arguments of ``schedule_followup()``.
+        Returns the job IDs in order, or ``None`` if the DB write failed (in
+        which case none of the jobs were created).
+        """
         import uuid
         from datetime import UTC, datetime, timedelta
 
         from angie.db.session import get_session_factory
         from angie.models.schedule import ScheduledJob
 
-        job_id = str(uuid.uuid4())
-        run_at = datetime.now(UTC) + timedelta(seconds=delay_seconds)
+        now = datetime.now(UTC)
+        jobs = [
+            ScheduledJob(
+                id=str(uuid.uuid4()),
+                user_id=f["user_id"],
+                name=f["title"],
+                description=f"Follow-up: {f['intent']}",
+                cron_expression="@once",
+                agent_slug=f.get("agent_slug") or self.slug,
+                task_payload={"intent": f["intent"], "title": f["title"]},
+                is_enabled=True,
+                next_run_at=now + timedelta(seconds=f["delay_seconds"]),
+                conversation_id=f.get("conversation_id"),
+            )
+            for f in followups
+        ]
 
         try:
             async with get_session_factory()() as session:
-                job = ScheduledJob(
-                    id=job_id,
-                    user_id=user_id,
-                    name=title,
-                    description=f"Follow-up: {intent}",
-                    cron_expression="@once",
-                    agent_slug=agent_slug or self.slug,
-                    task_payload={"intent": intent, "title": title},
-                    is_enabled=True,
-                    next_run_at=run_at,
-                    conversation_id=conversation_id,
-                )
-                session.add(job)
+                for job in jobs:
+                    session.add(job)
                 await session.commit()
-            self.logger.info("Scheduled follow-up %s in %ds", job_id, delay_seconds)
-            return job_id
         except Exception as exc:
             self.logger.warning("Failed to schedule follow-up: %s", exc)
             return None
+        for f, job in zip(followups, jobs, strict=True):
+            self.logger.info("Scheduled follow-up %s in %ds", job.id, f["delay_seconds"])
+        return [job.id for job in jobs]
 
     # ------------------------------------------------------------------
     # Auto-notify / should_respond
@@ -211,7 +335,8 @@ class BaseAgent(ABC):
         if not params.get("auto_notify"):
             return False
 
-        if not self.capabilities:
+        caps_re = self._caps_re
+        if caps_re is None:
             return False
 
         # Extract the user message text to evaluate relevance
@@ -219,12 +344,9 @@ class BaseAgent(ABC):
         if not intent:
             return False
 
-        text = intent.lower()
-
         # Check if any capability keyword appears in the message
-        for cap in self.capabilities:
-            if cap.lower() in text:
-                return True
+        if caps_re.search(intent.lower()):
+            return True
 
         # Check conversation history for recent context relevance
         conversation_id = task.get("input_data", {}).get("conversation_id")
@@ -237,10 +359,7 @@ class BaseAgent(ABC):
                 if m.get("role") == "USER" or m.get("role") == "user"
             ]
             # Only check the 2 most recent user messages
-            for msg_text in recent_user_msgs[-2:]:
-                for cap in self.capabilities:
-                    if cap.lower() in msg_text:
-                        return True
+            return any(caps_re.search(msg_text) for msg_text in recent_user_msgs[-2:])
 
         return False
 
@@ -249,13 +368,26 @@ class BaseAgent(ABC):
     # ------------------------------------------------------------------
 
     async def get_conversation_history(
-        self, conversation_id: str, limit: int = 20
+        self, conversation_id: str | None, limit: int = 20
     ) -> list[dict[str, str]]:
         """Query recent messages from a conversation for context.
 
         Returns a list of dicts with ``role``, ``content``, and ``agent_slug`` keys,
-        ordered by creation time (oldest first).
+        ordered by creation time (oldest first).  Within a request scope the
+        query is shared with every other agent asking for the same slice.
+        Without a *conversation_id* (or with ``limit <= 0``) there is nothing
+        to fetch and no query is issued.
         """
+        if not conversation_id or limit <= 0:
+            return []
+
+        from angie.core.request_cache import get_history_cached
+
+        return await get_history_cached(conversation_id, limit, self._load_conversation_history)
+
+    async def _load_conversation_history(
+        self, conversation_id: str, limit: int
+    ) -> list[dict[str, str]]:
         try:
             from sqlalchemy import select
 
@@ -264,22 +396,19 @@ class BaseAgent(ABC):
 
             factory = get_session_factory()
             async with factory() as session:
+                # Only the three columns are needed, so select them as plain
+                # rows and skip ORM hydration and the identity map.
                 result = await session.execute(
-                    select(ChatMessage)
+                    select(ChatMessage.role, ChatMessage.content, ChatMessage.agent_slug)
                     .where(ChatMessage.conversation_id == conversation_id)
                     .order_by(ChatMessage.created_at.desc())
                     .limit(limit)
                 )
                 # Fetch newest-first so LIMIT keeps recent messages,
                 # then reverse to return them in chronological (oldest→newest) order.
-                messages = list(reversed(result.scalars().all()))
                 return [
-                    {
-                        "role": msg.role.value,
-                        "content": msg.content,
-                        "agent_slug": msg.agent_slug or "",
-                    }
-                    for msg in messages
+                    {"role": role.value, "content": content, "agent_slug": agent_slug or ""}
+                    for role, content, agent_slug in result.all()[::-1]
                 ]
         except Exception as exc:
             self.logger.warning("Failed to load conversation history: %s", exc)
@@ -293,20 +422,16 @@ class BaseAgent(ABC):
         if not history:
             return intent
 
-        lines = ["## Conversation Context"]
+        # History comes first and grows at the end, so earlier turns stay a
+        # byte-identical prefix across calls (provider prompt caching).
+        lines = [_CONTEXT_HEADER]
         for msg in history:
-            role = msg.get("role", "user")
-            agent = msg.get("agent_slug", "")
-            if role == "user":
+            if msg.get("role", "user") == "user":
                 label = "USER"
-            elif agent:
-                label = agent
             else:
-                label = "ASSISTANT"
-            lines.append(f"[{label}]: {msg['content']}")
-
-        lines.append("---")
-        lines.append("## Your Task")
+                label = msg.get("agent_slug") or "ASSISTANT"
+            lines.append(f"[{label}]: {msg['content'].rstrip()}")
+        lines.append(_TASK_HEADER)
         lines.append(intent)
         return "\n".join(lines)
 
@@ -320,20 +445,63 @@ class BaseAgent(ABC):
         data = task.get("input_data", {})
         return data.get("intent") or task.get("title") or task.get("description", fallback)
 
+    def _intent_cache_lookup(self, intent: str, user_id: str | None) -> Any | None:
+        """Return a cached result for the same (normalized) *intent*, if enabled."""
+        if not self.intent_cache_ttl:
+            return None
+        from angie.core.intent_cache import get_intent_cache
+
+        return get_intent_cache().lookup(
+            intent, scope=f"{self.slug}:{user_id}", ttl=self.intent_cache_ttl
+        )
+
+    def _intent_cache_store(self, intent: str, user_id: str | None, result: Any) -> None:
+        if not self.intent_cache_ttl:
+            return
+        from angie.core.intent_cache import get_intent_cache
+
+        get_intent_cache().put(intent, result, scope=f"{self.slug}:{user_id}")
+
+    @staticmethod
+    def _match_text(task: dict[str, Any]) -> str:
+        """Return the lowercased ``"<title> <text>"`` used for keyword scoring.
+
+        The registry builds it once per ``resolve()`` and scores every agent
+        from the keywords found in it.
+        """
+        title = task.get("title", "")
+        text = task.get("input_data", {}).get("text", "")
+        return f"{title} {text}".lower()
+
     def can_handle(self, task: dict[str, Any]) -> bool:
         """Return True if this agent can handle the given task."""
         task_slug = task.get("agent_slug")
         if task_slug:
             return task_slug == self.slug
         # Fallback: check if any capability keyword is in task title
-        title = task.get("title", "").lower()
-        return any(cap.lower() in title for cap in self.capabilities)
+        title = task.get("title")
+        if not title or self._caps_re is None:
+            return False
+        return self._caps_re.search(title.lower()) is not None
 
-    def get_system_prompt(self) -> str:
+    @cached_property
+    def system_prompt(self) -> str:
+        """The composed system prompt; ``slug`` and ``instructions`` are fixed
+        per class, so it is built once per instance and stays byte-identical
+        across calls (a stable prefix for provider prompt caching)."""
         return self.prompt_manager.compose_for_agent(
             self.slug, agent_instructions=self.instructions
         )
 
+    def get_system_prompt(self) -> str:
+        """Return the composed system prompt."""
+        return self.system_prompt
+
+    def invalidate_system_prompt(self) -> None:
+        """Drop the memoized system prompt (and the Agent built from it)."""
+        self.__dict__.pop("system_prompt", None)
+        self._pydantic_agent = None
+
     async def ask_llm(
         self,
         prompt: str,
@@ -345,20 +513,70 @@ class BaseAgent(ABC):
         This helper is for pure text-generation tasks (e.g. drafting an
         email reply).  For tool-driven tasks use ``execute()`` which calls
         ``_get_agent().run()``.
-        """
-        from pydantic_ai import Agent
 
-        from angie.llm import get_llm_model
+        Responses to prompts without a *user_id* are cached in-process per
+        ``response_cache`` so identical (system, prompt, model) calls are
+        answered without another round-trip; identical calls made while one
+        is still in flight wait for its answer instead of issuing their own.
+        """
+        if _pydantic_ai is None or _llm is None:
+            _resolve_llm()
 
         if system is None:
             system = self.get_system_prompt()
 
+        try:
+            model = _llm.get_llm_model()
+        except Exception as exc:
+            self.logger.error("LLM call failed: %s", exc)
+            raise
+        if not self.response_cache.enabled or user_id is not None:
+            return await self._ask_llm_uncached(prompt, system, user_id, model)
+
+        cache_key = _response_key(system, prompt, model)
+        cached = self._cached_response(cache_key)
+        if cached is not None:
+            return cached
+        inflight = _llm_inflight.get(cache_key)
+        if inflight is not None:
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled() or asyncio.current_task().cancelling():
+                    raise
+            # Only the call being waited on was cancelled; start over, which
+            # makes one of its waiters the new leading call
+            return await self.ask_llm(prompt, system, user_id)
+
+        future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        _llm_inflight[cache_key] = future
+        try:
+            output = await self._ask_llm_uncached(prompt, system, user_id, model)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            future.exception()  # retrieved here; waiters re-raise it themselves
+            raise
+        else:
+            self._store_response(cache_key, output)
+            future.set_result(output)
+            return output
+        finally:
+            _llm_inflight.pop(cache_key, None)
+
+    async def _ask_llm_uncached(
+        self, prompt: str, system: str, user_id: str | None, model: Any
+    ) -> str:
         try:
             from angie.core.token_usage import record_usage_fire_and_forget
 
-            model = get_llm_model()
-            agent = Agent(system_prompt=system)
-            result = await agent.run(prompt, model=model)
+            kwargs: dict[str, Any] = {"model": model}
+            model_settings = self._model_settings()
+            if model_settings is not None:
+                kwargs["model_settings"] = model_settings
+            result = await self._get_llm_agent(system).run(prompt, **kwargs)
             record_usage_fire_and_forget(
                 user_id=user_id,
                 agent_slug=self.slug,
@@ -370,6 +588,57 @@ class BaseAgent(ABC):
             self.logger.error("LLM call failed: %s", exc)
             raise
 
+    async def ask_llm_batch(
+        self,
+        prompts: list[str],
+        system: str | None = None,
+        user_id: str | None = None,
+        max_concurrency: int = 4,
+    ) -> list[str]:
+        """Run several independent ``ask_llm()`` prompts concurrently.
+
+        Results are returned in the same order as *prompts*.  At most
+        *max_concurrency* requests are in flight at once to stay inside
+        provider rate limits; the first failure propagates.
+        """
+        if system is None:
+            system = self.get_system_prompt()
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _ask(prompt: str) -> str:
+            async with semaphore:
+                return await self.ask_llm(prompt, system=system, user_id=user_id)
+
+        return list(await asyncio.gather(*(_ask(p) for p in prompts)))
+
+    def _cached_response(self, key: bytes) -> str | None:
+        """Return a live cached ask_llm() response, refreshing its recency."""
+        entry = _llm_responses.pop(key, None)
+        if entry is None or time.monotonic() - entry[0] > self.response_cache.ttl:
+            return None
+        _llm_responses[key] = entry
+        return entry[1]
+
+    def _store_response(self, key: bytes, output: str) -> None:
+        while _llm_responses and len(_llm_responses) >= self.response_cache.maxsize:
+            _llm_responses.pop(next(iter(_llm_responses)))
+        _llm_responses[key] = (time.monotonic(), output)
+
+    def _get_llm_agent(self, system: str) -> Agent:
+        """Return the ask_llm() Agent for *system*, building it on first use.
+
+        Agents are built without a model (it is injected at ``.run()``), so
+        one instance per subclass and system prompt can be reused safely.
+        """
+        cache = type(self)._llm_agents
+        agent = cache.get(system)
+        if agent is None:
+            if len(cache) >= self._llm_agents_max:
+                cache.pop(next(iter(cache)))
+            agent = _pydantic_ai.Agent(system_prompt=system)
+            cache[sys.intern(system)] = agent
+        return agent
+
     async def get_credentials(
         self, user_id: str | None, service_type: str
     ) -> dict[str, str] | None:
@@ -392,5 +661,22 @@ class BaseAgent(ABC):
             self.logger.debug("Connection lookup failed for %s/%s: %s", user_id, service_type, exc)
         return None
 
+    async def _credentials_and_history(
+        self, user_id: str | None, service_type: str, conversation_id: str | None
+    ) -> tuple[dict[str, str] | None, list[dict[str, str]]]:
+        """Load credentials and conversation history concurrently.
+
+        The two are independent DB round-trips, so ``execute()`` overlaps
+        them instead of awaiting one after the other.  History is empty
+        when there is no *conversation_id*.
+        """
+        if not conversation_id:
+            return await self.get_credentials(user_id, service_type), []
+        creds, history = await asyncio.gather(
+            self.get_credentials(user_id, service_type),
+            self.get_conversation_history(conversation_id),
+        )
+        return creds, history
+
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} slug={self.slug!r}>"
@@ -2,16 +2,151 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import logging
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import ModuleType
 from typing import TYPE_CHECKING, Any, ClassVar
 
 from pydantic_ai import RunContext
 
 from angie.agents.base import BaseAgent
+from angie.config import get_settings
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+    from concurrent.futures import Future
+
     from pydantic_ai import Agent
 
+logger = logging.getLogger(__name__)
+
+# PyGithub, imported on first use rather than at agent registration
+_github: ModuleType | None = None
+
+# Most items a list tool returns; also the client's page size, so each list
+# is the first page, fetched with one request via ``get_page(0)``.
+_LIST_LIMIT = 20
+# Characters of each file's patch get_pr_diff passes on to the model
+_PATCH_LIMIT = 2000
+
+# PyGithub is blocking; its tool calls run on a dedicated pool instead of
+# competing with every other sync tool for anyio's shared worker threads.
+# Created on first use, sized by the ``github_pool_size`` setting.
+_github_executor: ThreadPoolExecutor | None = None
+# Independent sub-requests fanned out from inside a tool.  Kept separate from
+# the tool pool so a tool waiting on one can never starve the pool it runs on.
+_SUBCALL_WORKERS = 8
+_GITHUB_SUBCALLS = ThreadPoolExecutor(max_workers=_SUBCALL_WORKERS, thread_name_prefix="github-sub")
+
+
+def _tool_executor() -> ThreadPoolExecutor:
+    """Return the pool GitHub tool calls and background writes run on."""
+    global _github_executor
+    if _github_executor is None:
+        _github_executor = ThreadPoolExecutor(
+            max_workers=get_settings().github_pool_size, thread_name_prefix="github"
+        )
+    return _github_executor
+
+
+def _on_tool_pool(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Turn a blocking PyGithub tool into an async one that runs on ``_tool_executor()``."""
+
+    @functools.wraps(func)
+    async def run(*args: Any, **kwargs: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _tool_executor(), functools.partial(func, *args, **kwargs)
+        )
+
+    return run
+
+
+def _github_module() -> ModuleType:
+    """Import PyGithub once and memoize it; raises ImportError if missing."""
+    global _github
+    if _github is None:
+        import github
+
+        _github = github
+    return _github
+
+
+class _ConditionalRequests:
+    """Revalidate repeated GitHub GETs with ``If-None-Match``.
+
+    Wraps a PyGithub ``Requester.requestJson``.  GitHub answers an unchanged
+    resource with ``304 Not Modified``, which does not count against the
+    rate limit; the body cached with its ETag is replayed in its place.
+    """
+
+    def __init__(self, request_json: Any, maxsize: int = 1024) -> None:
+        self._request_json = request_json
+        self.maxsize = maxsize
+        # (url, parameters, headers) -> (etag, response headers, body)
+        self._entries: dict[tuple[str, str, str], tuple[str, dict[str, Any], Any]] = {}
+
+    def __call__(
+        self,
+        verb: str,
+        url: str,
+        parameters: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        input: Any = None,
+        *args: Any,
+        **kwargs: Any,
+    ) -> tuple[int, dict[str, Any], Any]:
+        if verb != "GET" or input is not None:
+            return self._request_json(verb, url, parameters, headers, input, *args, **kwargs)
+
+        key = (url, repr(sorted((parameters or {}).items())), repr(sorted((headers or {}).items())))
+        cached = self._entries.get(key)
+        if cached is not None:
+            headers = {**(headers or {}), "If-None-Match": cached[0]}
+
+        status, response_headers, body = self._request_json(
+            verb, url, parameters, headers, input, *args, **kwargs
+        )
+        if status == 304 and cached is not None:
+            return 200, cached[1], cached[2]
+        etag = response_headers.get("etag")
+        if status == 200 and etag:
+            if key not in self._entries and len(self._entries) >= self.maxsize:
+                self._entries.pop(next(iter(self._entries), None), None)
+            self._entries[key] = (etag, response_headers, body)
+        return status, response_headers, body
+
+
+@functools.lru_cache(maxsize=32)
+def _github_client(token: str) -> Any:
+    """Return a PyGithub client for *token*, shared across tasks and agents.
+
+    The client keeps a persistent HTTPS session, so reusing it skips the
+    connection and TLS setup a fresh ``Github()`` pays on every task.  Tools
+    call ``get_repo(..., lazy=True)``, which builds the repository from its
+    URL and only fetches it when an unset attribute is read, so tools that
+    just post to or list under a repo don't download it first
+    (``get_issue()``/``get_pull()`` still fetch).  Repeated reads are
+    revalidated by ETag (see ``_ConditionalRequests``).  Pages hold
+    ``_LIST_LIMIT`` items, matching what the list tools return.  The
+    connection pool holds one keep-alive connection per worker thread;
+    PyGithub's default of 10 would close and re-handshake the surplus.
+    """
+    gh_module = _github_module()
+    options = {
+        "lazy": True,
+        "per_page": _LIST_LIMIT,
+        "pool_size": get_settings().github_pool_size + _SUBCALL_WORKERS,
+    }
+    client = gh_module.Github(token, **options) if token else gh_module.Github(**options)
+    requester = client.requester
+    requester.requestJson = _ConditionalRequests(requester.requestJson)
+    return client
+
 
 class GitHubAgent(BaseAgent):
     name: ClassVar[str] = "GitHubAgent"
@@ -41,6 +176,9 @@ class GitHubAgent(BaseAgent):
         "- list_pr_checks: Get CI check status for a PR.\n"
         "- get_pr_diff: Get the diff/changed files for a PR.\n"
         "- search_issues: Search issues and PRs with a query string.\n\n"
+        "comment_on_issue, comment_on_pr and close_issue accept wait=false to run in the "
+        "background and return at once; use it when you only need to confirm the action, "
+        "not report a comment id or link.\n\n"
         "Requires GITHUB_TOKEN environment variable. Repo names must be in 'owner/repo' format.\n\n"
         "Error handling:\n"
         "- If you get a rate limit error (403), inform the user they've hit the GitHub API "
@@ -67,28 +205,35 @@ class GitHubAgent(BaseAgent):
         )
 
         @agent.tool
+        @_on_tool_pool
         def list_repositories(ctx: RunContext[object]) -> list | dict:
             """List the authenticated user's GitHub repositories."""
             try:
                 g = ctx.deps
-                return [
-                    {"name": r.full_name, "private": r.private}
-                    for r in list(g.get_user().get_repos()[:20])
-                ]
+                return _cached_read(
+                    g,
+                    ("list_repositories",),
+                    lambda: [
+                        {"name": r.full_name, "private": r.private}
+                        for r in g.get_user().get_repos().get_page(0)
+                    ],
+                )
             except Exception as exc:
                 return _handle_github_error(exc)
 
         @agent.tool
+        @_on_tool_pool
         def list_pull_requests(
             ctx: RunContext[object], repo: str, state: str = "open"
         ) -> list | dict:
             """List pull requests for a GitHub repository."""
             try:
                 g = ctx.deps
-                repo_obj = g.get_repo(repo)
-                pulls = []
-                for pr in repo_obj.get_pulls(state=state):
-                    pulls.append(
+
+                def fetch() -> list:
+                    if g.requester.auth is not None:
+                        return _list_graphql(g, _PULLS_QUERY, "pullRequests", repo, state)
+                    return [
                         {
                             "number": pr.number,
                             "title": pr.title,
@@ -96,22 +241,24 @@ class GitHubAgent(BaseAgent):
                             "author": pr.user.login,
                             "url": pr.html_url,
                         }
-                    )
-                    if len(pulls) >= 20:
-                        break
-                return pulls
+                        for pr in g.get_repo(repo, lazy=True).get_pulls(state=state).get_page(0)
+                    ]
+
+                return _cached_read(g, ("list_pull_requests", repo, state), fetch)
             except Exception as exc:
                 return _handle_github_error(exc)
 
         @agent.tool
+        @_on_tool_pool
         def list_issues(ctx: RunContext[object], repo: str, state: str = "open") -> list | dict:
             """List issues for a GitHub repository."""
             try:
                 g = ctx.deps
-                repo_obj = g.get_repo(repo)
-                issues = []
-                for i in repo_obj.get_issues(state=state):
-                    issues.append(
+
+                def fetch() -> list:
+                    if g.requester.auth is not None:
+                        return _list_graphql(g, _ISSUES_QUERY, "issues", repo, state)
+                    return [
                         {
                             "number": i.number,
                             "title": i.title,
@@ -119,79 +266,111 @@ class GitHubAgent(BaseAgent):
                             "author": i.user.login,
                             "url": i.html_url,
                         }
-                    )
-                    if len(issues) >= 20:
-                        break
-                return issues
+                        for i in g.get_repo(repo, lazy=True).get_issues(state=state).get_page(0)
+                    ]
+
+                return _cached_read(g, ("list_issues", repo, state), fetch)
             except Exception as exc:
                 return _handle_github_error(exc)
 
         @agent.tool
+        @_on_tool_pool
         def create_issue(ctx: RunContext[object], repo: str, title: str, body: str = "") -> dict:
             """Create a new issue in a GitHub repository."""
             try:
                 g = ctx.deps
-                issue = g.get_repo(repo).create_issue(title=title, body=body)
+                issue = g.get_repo(repo, lazy=True).create_issue(title=title, body=body)
+                _forget_reads(g)
                 return {"created": True, "number": issue.number, "url": issue.html_url}
             except Exception as exc:
                 return _handle_github_error(exc)
 
         @agent.tool
+        @_on_tool_pool
         def get_repository(ctx: RunContext[object], repo: str) -> dict:
             """Get details about a GitHub repository."""
             try:
                 g = ctx.deps
-                r = g.get_repo(repo)
-                return {
-                    "name": r.full_name,
-                    "description": r.description,
-                    "stars": r.stargazers_count,
-                    "forks": r.forks_count,
-                    "open_issues": r.open_issues_count,
-                    "default_branch": r.default_branch,
-                    "url": r.html_url,
-                }
+
+                def fetch() -> dict:
+                    if g.requester.auth is not None:
+                        return _repository_graphql(g, repo)
+                    r = g.get_repo(repo, lazy=True)
+                    return {
+                        "name": r.full_name,
+                        "description": r.description,
+                        "stars": r.stargazers_count,
+                        "forks": r.forks_count,
+                        "open_issues": r.open_issues_count,
+                        "default_branch": r.default_branch,
+                        "url": r.html_url,
+                    }
+
+                return _cached_read(g, ("get_repository", repo), fetch, ttl=_REPO_TTL)
             except Exception as exc:
                 return _handle_github_error(exc)
 
         @agent.tool
-        def comment_on_issue(ctx: RunContext[object], repo: str, number: int, body: str) -> dict:
-            """Add a comment to an existing issue."""
+        @_on_tool_pool
+        def comment_on_issue(
+            ctx: RunContext[object], repo: str, number: int, body: str, wait: bool = True
+        ) -> dict:
+            """Add a comment to an existing issue; wait=False posts it in the background."""
             try:
-                g = ctx.deps
-                issue = g.get_repo(repo).get_issue(number)
-                comment = issue.create_comment(body)
+                repository = ctx.deps.get_repo(repo, lazy=True)
+
+                def post() -> Any:
+                    # get_issue() GETs the issue, so it runs in the background too
+                    return repository.get_issue(number).create_comment(body)
+
+                if not wait:
+                    _submit_mutation("comment_on_issue", post)
+                    return {"queued": True, "issue_number": number}
+                comment = post()
                 return {"commented": True, "comment_id": comment.id, "issue_number": number}
             except Exception as exc:
                 return _handle_github_error(exc)
 
         @agent.tool
-        def comment_on_pr(ctx: RunContext[object], repo: str, number: int, body: str) -> dict:
-            """Add a review comment to a pull request."""
+        @_on_tool_pool
+        def comment_on_pr(
+            ctx: RunContext[object], repo: str, number: int, body: str, wait: bool = True
+        ) -> dict:
+            """Add a review comment to a pull request; wait=False posts it in the background."""
             try:
-                g = ctx.deps
-                pr = g.get_repo(repo).get_pull(number)
-                # Create an issue comment on the PR (general comment, not line-level)
-                comment = pr.create_issue_comment(body)
+                repository = ctx.deps.get_repo(repo, lazy=True)
+
+                def post() -> Any:
+                    # Create an issue comment on the PR (general comment, not line-level)
+                    return repository.get_pull(number).create_issue_comment(body)
+
+                if not wait:
+                    _submit_mutation("comment_on_pr", post)
+                    return {"queued": True, "pr_number": number}
+                comment = post()
                 return {"commented": True, "comment_id": comment.id, "pr_number": number}
             except Exception as exc:
                 return _handle_github_error(exc)
 
         @agent.tool
+        @_on_tool_pool
         def merge_pull_request(
             ctx: RunContext[object], repo: str, number: int, merge_method: str = "merge"
         ) -> dict:
             """Merge a pull request. merge_method: 'merge', 'squash', or 'rebase'."""
             try:
                 g = ctx.deps
-                pr = g.get_repo(repo).get_pull(number)
+                pr = g.get_repo(repo, lazy=True).get_pull(number)
                 if pr.merged:
                     return {"error": f"PR #{number} is already merged."}
-                if not pr.mergeable:
+                # None means GitHub is still computing mergeability; let the merge
+                # request itself decide rather than polling for it first.
+                if pr.mergeable is False:
                     return {
                         "error": f"PR #{number} has merge conflicts that must be resolved first."
                     }
                 result = pr.merge(merge_method=merge_method)
+                _forget_reads(g)
                 return {
                     "merged": result.merged,
                     "message": result.message,
@@ -202,24 +381,41 @@ class GitHubAgent(BaseAgent):
                 return _handle_github_error(exc)
 
         @agent.tool
-        def close_issue(ctx: RunContext[object], repo: str, number: int) -> dict:
-            """Close an open issue."""
+        @_on_tool_pool
+        def close_issue(ctx: RunContext[object], repo: str, number: int, wait: bool = True) -> dict:
+            """Close an open issue; wait=False closes it in the background."""
             try:
                 g = ctx.deps
-                issue = g.get_repo(repo).get_issue(number)
-                issue.edit(state="closed")
+                repository = g.get_repo(repo, lazy=True)
+
+                def close() -> Any:
+                    issue = repository.get_issue(number)
+                    issue.edit(state="closed")
+                    _forget_reads(g)
+                    return issue
+
+                if not wait:
+                    _submit_mutation("close_issue", close)
+                    return {"queued": True, "number": number}
+                issue = close()
                 return {"closed": True, "number": number, "url": issue.html_url}
             except Exception as exc:
                 return _handle_github_error(exc)
 
         @agent.tool
+        @_on_tool_pool
         def list_pr_checks(ctx: RunContext[object], repo: str, number: int) -> dict:
             """Get CI check status for a pull request."""
             try:
                 g = ctx.deps
-                repository = g.get_repo(repo)
+                if g.requester.auth is not None:
+                    # GraphQL needs a token; it answers in one round-trip
+                    return _pr_checks_graphql(g, repo, number)
+                repository = g.get_repo(repo, lazy=True)
                 pr = repository.get_pull(number)
                 commit = repository.get_commit(pr.head.sha)
+                # Both only need the head SHA, so fetch the combined status meanwhile
+                status_future = _GITHUB_SUBCALLS.submit(commit.get_combined_status)
                 checks = []
                 for run in commit.get_check_runs():
                     checks.append(
@@ -230,7 +426,7 @@ class GitHubAgent(BaseAgent):
                             "url": run.html_url,
                         }
                     )
-                combined_status = commit.get_combined_status()
+                combined_status = status_future.result()
                 return {
                     "pr_number": number,
                     "overall_state": combined_status.state,
@@ -240,54 +436,53 @@ class GitHubAgent(BaseAgent):
                 return _handle_github_error(exc)
 
         @agent.tool
+        @_on_tool_pool
         def get_pr_diff(ctx: RunContext[object], repo: str, number: int) -> dict:
             """Get the changed files and diff stats for a pull request."""
             try:
                 g = ctx.deps
-                pr = g.get_repo(repo).get_pull(number)
-                files = []
-                for f in pr.get_files():
-                    files.append(
-                        {
-                            "filename": f.filename,
-                            "status": f.status,
-                            "additions": f.additions,
-                            "deletions": f.deletions,
-                            "changes": f.changes,
-                            "patch": (f.patch or "")[:2000],  # Truncate large patches
-                        }
+                # One request: the diff comes straight from the PR's URL, without
+                # fetching the PR itself
+                try:
+                    _, body = g.requester.requestJsonAndCheck(
+                        "GET",
+                        f"/repos/{repo}/pulls/{number}",
+                        headers={"Accept": "application/vnd.github.diff"},
                     )
+                except _github_module().GithubException as exc:
+                    if exc.status != 406:  # 406: too large to render as one diff
+                        raise
+                    pr = g.get_repo(repo, lazy=True).get_pull(number)
+                    return _pr_diff_from_files(pr, number)
+                files = _parse_unified_diff((body or {}).get("data", ""))
                 return {
                     "pr_number": number,
                     "files_changed": len(files),
-                    "additions": pr.additions,
-                    "deletions": pr.deletions,
+                    "additions": sum(f["additions"] for f in files),
+                    "deletions": sum(f["deletions"] for f in files),
                     "files": files,
                 }
             except Exception as exc:
                 return _handle_github_error(exc)
 
         @agent.tool
+        @_on_tool_pool
         def search_issues(ctx: RunContext[object], repo: str, query: str) -> list | dict:
             """Search issues and PRs in a repo with a query string."""
             try:
                 g = ctx.deps
                 full_query = f"repo:{repo} {query}"
-                results = []
-                for issue in g.search_issues(full_query):
-                    results.append(
-                        {
-                            "number": issue.number,
-                            "title": issue.title,
-                            "state": issue.state,
-                            "is_pr": issue.pull_request is not None,
-                            "author": issue.user.login,
-                            "url": issue.html_url,
-                        }
-                    )
-                    if len(results) >= 20:
-                        break
-                return results
+                return [
+                    {
+                        "number": issue.number,
+                        "title": issue.title,
+                        "state": issue.state,
+                        "is_pr": issue.pull_request is not None,
+                        "author": issue.user.login,
+                        "url": issue.html_url,
+                    }
+                    for issue in g.search_issues(full_query).get_page(0)
+                ]
             except Exception as exc:
                 return _handle_github_error(exc)
 
@@ -295,25 +490,24 @@ class GitHubAgent(BaseAgent):
 
     async def execute(self, task: dict[str, Any]) -> dict[str, Any]:
         try:
-            import github as gh_module
+            _github_module()
         except ImportError:
             return {"error": "PyGithub not installed"}
         self.logger.info("GitHubAgent executing")
         try:
             user_id = task.get("user_id")
-            creds = await self.get_credentials(user_id, "github")
+            conversation_id = task.get("input_data", {}).get("conversation_id")
+            creds, history = await self._credentials_and_history(user_id, "github", conversation_id)
             token = (
                 (creds or {}).get("personal_access_token")
                 or (creds or {}).get("token")
                 or os.environ.get("GITHUB_TOKEN", "")
             )
-            g = gh_module.Github(token) if token else gh_module.Github()
+            g = _github_client(token)
             from angie.llm import get_llm_model
 
             intent = self._extract_intent(task, fallback="list my repositories")
-            conversation_id = task.get("input_data", {}).get("conversation_id")
             if conversation_id:
-                history = await self.get_conversation_history(conversation_id)
                 prompt = self._build_context_prompt(intent, history)
             else:
                 prompt = intent
@@ -331,9 +525,275 @@ class GitHubAgent(BaseAgent):
             return {"summary": f"GitHub error: {exc}", "error": str(exc)}
 
 
+# Short-lived results of read-only tools, keyed by (client, tool, args).  The
+# client is per token, so one user's results are never served to another.
+_READ_TTL = 60.0
+# Repository metadata (stars, forks, default branch) changes slowly.
+_REPO_TTL = 300.0
+_READ_CACHE_MAX = 1024
+_read_cache: dict[tuple[Any, tuple], tuple[float, Any]] = {}
+
+
+def _cached_read(g: Any, key: tuple, fetch: Callable[[], Any], ttl: float = _READ_TTL) -> Any:
+    """Return ``fetch()``, reusing a result from the last *ttl* seconds.
+
+    Exceptions propagate uncached, so errors are always retried.
+    """
+    cache_key = (g, key)
+    now = time.monotonic()
+    hit = _read_cache.get(cache_key)
+    if hit is not None and now - hit[0] < ttl:
+        return hit[1]
+    value = fetch()
+    if cache_key not in _read_cache and len(_read_cache) >= _READ_CACHE_MAX:
+        _read_cache.pop(next(iter(_read_cache), None), None)
+    _read_cache[cache_key] = (now, value)
+    return value
+
+
+def _forget_reads(g: Any) -> None:
+    """Drop cached reads for client *g* after it changes something."""
+    for cache_key in list(_read_cache):
+        if cache_key[0] is g:
+            _read_cache.pop(cache_key, None)
+
+
+def _submit_mutation(action: str, call: Callable[[], Any]) -> Future:
+    """Run a GitHub write on the tool pool without waiting for it.
+
+    The tool has already answered, so a failure can only be logged.
+    """
+
+    def _log_failure(future: Future) -> None:
+        exc = future.exception()
+        if exc is not None:
+            logger.warning("Background GitHub %s failed: %s", action, exc)
+
+    future = _tool_executor().submit(call)
+    future.add_done_callback(_log_failure)
+    return future
+
+
+def _parse_unified_diff(diff: str) -> list[dict]:
+    """Split a unified diff into per-file entries shaped like the REST files API.
+
+    ``patch`` holds only the hunks, as the files API does, and keeps the first
+    ``_PATCH_LIMIT`` characters; the +/- counts still cover every line.
+    """
+    files: list[dict] = []
+    current: dict | None = None
+    size = 0
+    for line in diff.splitlines():
+        if line.startswith("diff --git "):
+            current = {
+                "filename": line.rsplit(" b/", 1)[-1],
+                "status": "modified",
+                "additions": 0,
+                "deletions": 0,
+                "changes": 0,
+                "patch": [],
+            }
+            files.append(current)
+            size = 0
+        elif current is None:
+            continue
+        elif current["patch"] or line.startswith("@@"):
+            if size < _PATCH_LIMIT:
+                current["patch"].append(line)
+                size += len(line) + 1
+            if line.startswith("+"):
+                current["additions"] += 1
+            elif line.startswith("-"):
+                current["deletions"] += 1
+        elif line.startswith("new file mode"):
+            current["status"] = "added"
+        elif line.startswith("deleted file mode"):
+            current["status"] = "removed"
+        elif line.startswith("rename to "):
+            current["status"] = "renamed"
+            current["filename"] = line[len("rename to ") :]
+        elif line.startswith("+++ b/"):
+            current["filename"] = line[len("+++ b/") :]
+
+    for f in files:
+        f["changes"] = f["additions"] + f["deletions"]
+        f["patch"] = "\n".join(f["patch"])[:_PATCH_LIMIT]
+    return files
+
+
+def _pr_diff_from_files(pr: Any, number: int) -> dict:
+    """Page through the PR files API; used when the diff is too large to render."""
+    files = []
+    for f in pr.get_files():
+        files.append(
+            {
+                "filename": f.filename,
+                "status": f.status,
+                "additions": f.additions,
+                "deletions": f.deletions,
+                "changes": f.changes,
+                "patch": (f.patch or "")[:_PATCH_LIMIT],  # Truncate large patches
+            }
+        )
+    return {
+        "pr_number": number,
+        "files_changed": len(files),
+        "additions": pr.additions,
+        "deletions": pr.deletions,
+        "files": files,
+    }
+
+
+# GraphQL selects just the fields the tools return.  The REST list items
+# embed full user objects, and pulls also embed both head and base
+# repositories, which the tools throw away.  GraphQL needs a token, so
+# unauthenticated clients stay on REST.
+_PULLS_QUERY = """
+query($owner: String!, $name: String!, $first: Int!, $states: [PullRequestState!]) {
+  repository(owner: $owner, name: $name) {
+    pullRequests(first: $first, states: $states, orderBy: {field: CREATED_AT, direction: DESC}) {
+      nodes { number title state url author { login } }
+    }
+  }
+}
+"""
+
+_ISSUES_QUERY = """
+query($owner: String!, $name: String!, $first: Int!, $states: [IssueState!]) {
+  repository(owner: $owner, name: $name) {
+    issues(first: $first, states: $states, orderBy: {field: CREATED_AT, direction: DESC}) {
+      nodes { number title state url author { login } }
+    }
+  }
+}
+"""
+
+# REST state filter -> GraphQL states; anything else ("all") lists every state
+_GRAPHQL_STATES = {
+    "pullRequests": {"open": ["OPEN"], "closed": ["CLOSED", "MERGED"]},
+    "issues": {"open": ["OPEN"], "closed": ["CLOSED"]},
+}
+
+_REPOSITORY_QUERY = """
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) {
+    nameWithOwner description stargazerCount forkCount url
+    defaultBranchRef { name }
+    issues(states: OPEN) { totalCount }
+    pullRequests(states: OPEN) { totalCount }
+  }
+}
+"""
+
+
+def _list_graphql(g: Any, query: str, connection: str, repo: str, state: str) -> list[dict]:
+    """List a repo's newest PRs or issues, shaped like the REST list tools."""
+    owner, _, name = repo.partition("/")
+    variables = {
+        "owner": owner,
+        "name": name,
+        "first": _LIST_LIMIT,
+        "states": _GRAPHQL_STATES[connection].get(state),
+    }
+    _, data = g.requester.graphql_query(query, variables)
+    return [
+        {
+            "number": node["number"],
+            "title": node["title"],
+            # REST reports merged pull requests as closed
+            "state": "closed" if node["state"] == "MERGED" else node["state"].lower(),
+            "author": (node["author"] or {}).get("login", "ghost"),
+            "url": node["url"],
+        }
+        for node in data["data"]["repository"][connection]["nodes"]
+    ]
+
+
+def _repository_graphql(g: Any, repo: str) -> dict:
+    """Fetch the get_repository summary in one GraphQL query."""
+    owner, _, name = repo.partition("/")
+    _, data = g.requester.graphql_query(_REPOSITORY_QUERY, {"owner": owner, "name": name})
+    r = data["data"]["repository"]
+    return {
+        "name": r["nameWithOwner"],
+        "description": r["description"],
+        "stars": r["stargazerCount"],
+        "forks": r["forkCount"],
+        # Like REST's open_issues_count, open pull requests count as issues
+        "open_issues": r["issues"]["totalCount"] + r["pullRequests"]["totalCount"],
+        "default_branch": (r["defaultBranchRef"] or {}).get("name"),
+        "url": r["url"],
+    }
+
+
+_PR_CHECKS_QUERY = """
+query($owner: String!, $name: String!, $number: Int!) {
+  repository(owner: $owner, name: $name) {
+    pullRequest(number: $number) {
+      commits(last: 1) {
+        nodes {
+          commit {
+            statusCheckRollup {
+              state
+              contexts(first: 100) {
+                nodes {
+                  __typename
+                  ... on CheckRun { name status conclusion url }
+                  ... on StatusContext { context state targetUrl }
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+def _pr_checks_graphql(g: Any, repo: str, number: int) -> dict:
+    """Fetch a PR's head-commit checks in one GraphQL query.
+
+    Replaces the REST pull → commit → check-runs → combined-status chain.
+    Commit statuses are listed alongside check runs, and ``overall_state``
+    is GitHub's rollup of both.
+    """
+    owner, _, name = repo.partition("/")
+    _, data = g.requester.graphql_query(
+        _PR_CHECKS_QUERY, {"owner": owner, "name": name, "number": number}
+    )
+    commits = data["data"]["repository"]["pullRequest"]["commits"]["nodes"]
+    rollup = commits[0]["commit"]["statusCheckRollup"] if commits else None
+    if rollup is None:
+        return {"pr_number": number, "overall_state": "pending", "checks": []}
+
+    checks = []
+    for node in rollup["contexts"]["nodes"]:
+        if node["__typename"] == "CheckRun":
+            checks.append(
+                {
+                    "name": node["name"],
+                    "status": node["status"].lower(),
+                    "conclusion": node["conclusion"] and node["conclusion"].lower(),
+                    "url": node["url"],
+                }
+            )
+        else:
+            checks.append(
+                {
+                    "name": node["context"],
+                    "status": "completed",
+                    "conclusion": node["state"].lower(),
+                    "url": node["targetUrl"],
+                }
+            )
+    return {"pr_number": number, "overall_state": rollup["state"].lower(), "checks": checks}
+
+
 def _handle_github_error(exc: Exception) -> dict:
     """Return an actionable error dict for common GitHub API failures."""
-    import github as gh_module
+    gh_module = _github_module()
 
     if isinstance(exc, gh_module.RateLimitExceededException):
         return {
@@ -2,21 +2,32 @@
 
 from __future__ import annotations
 
+import contextlib
+import fcntl
+import functools
+import itertools
 import os
 import re
+import shlex
 import shutil
+import signal
 import stat
 import subprocess
 import tempfile
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar
+from urllib.parse import quote, urlsplit
 
 from pydantic_ai import RunContext
 
 from angie.agents.base import BaseAgent
+from angie.agents.dev.github import _GITHUB_SUBCALLS, _github_client, _github_module
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from pydantic_ai import Agent
 
 
@@ -28,10 +39,40 @@ _SHELL_INJECTION = re.compile(
     r"[;`]|\$\(|&&\s*(?:rm|curl|wget|nc|bash|sh\b)|"
     r"\|\s*(?:rm|curl|wget|nc|bash|sh\b)|>\s*/(?:etc|dev|proc)",
 )
+# Both lists in one pattern, so a command is scanned once rather than twice
+_UNSAFE_COMMAND = re.compile(f"(?i:{_BLOCKED_COMMANDS.pattern})|{_SHELL_INJECTION.pattern}")
 _COMMAND_TIMEOUT = 120
+# Seconds to wait for the output readers once the command's group is killed
+_READER_GRACE = 1.0
 _MAX_FILE_SIZE = 100 * 1024  # 100KB
+_READ_LIMIT = 50_000  # bytes returned by read_file
+_MAX_READ_FILE_SIZE = 5 * 1024 * 1024  # 5MB; larger files are lockfiles, bundles, blobs
 _MAX_WORKSPACE_SIZE = 500 * 1024 * 1024  # 500MB
+_LISTING_CACHE_SIZE = 128  # directory listings kept per task
 _BRANCH_NAME_PATTERN = re.compile(r"^[a-zA-Z0-9._/-]+$")
+_GITHUB_HOSTS = frozenset({"github.com", "www.github.com"})
+_ISSUE_URL_RE = re.compile(r"(?:https?://)?github\.com/([^/]+)/([^/]+)/issues/(\d+)")
+_ISSUE_REF_RE = re.compile(r"([^/\s]+)/([^/\s]+)#(\d+)")
+# --force-with-lease rejects the push if the remote branch has diverged.
+# It prints the commit SHA, then the branch name it pushed to.
+_COMMIT_AND_PUSH_SCRIPT = (
+    'git add -A && git commit -m "$1" && '
+    # $2 is the task's local branch prefix (see _task_branch_prefix), which
+    # never reaches GitHub
+    'branch=$(git symbolic-ref --short HEAD) && branch="${branch#"$2"}" && '
+    'git push --force-with-lease -u origin "HEAD:refs/heads/$branch" && '
+    'git rev-parse HEAD && echo "$branch"'
+)
+# Classic (ghp_, gho_, ghu_, ghs_, ghr_) and fine-grained PATs, scrubbed even
+# when they aren't the task's own token
+_GITHUB_TOKEN_SHAPE = r"\bgh[pousr]_[A-Za-z0-9]{36,}|\bgithub_pat_[A-Za-z0-9_]{22,}"
+_SEARCH_GLOBS = ("*.py", "*.ts", "*.tsx", "*.js", "*.jsx", "*.md")
+_SEARCH_LIMIT = 50
+_SEARCH_TIMEOUT = 30
+# ripgrep skips .gitignored paths (node_modules, venvs, build output) and is
+# far faster than grep -r; git grep, then grep, are the fallbacks where it
+# isn't installed.
+_RG = shutil.which("rg")
 
 
 @dataclass
@@ -42,7 +83,14 @@ class SoftwareDevDeps:
     workspace_dir: Path = field(default_factory=lambda: Path(tempfile.mkdtemp()))
     user_id: str = ""
     repo_dir: Path | None = None
+    sparse: bool = False
+    mirror_dir: Path | None = None
+    # Full environment (os.environ plus git auth) for git and shell commands,
+    # built once by clone_repo; empty until then
     _git_env: dict[str, str] = field(default_factory=dict, repr=False)
+    _repos: dict[str, Any] = field(default_factory=dict, repr=False)
+    # (directory, mtime_ns) -> list_directory entries
+    _listings: dict[tuple[str, int], list[dict[str, str]]] = field(default_factory=dict, repr=False)
 
 
 class SoftwareDeveloperAgent(BaseAgent):
@@ -103,30 +151,29 @@ class SoftwareDeveloperAgent(BaseAgent):
         @agent.tool
         def fetch_issue(ctx: RunContext[SoftwareDevDeps], issue_url: str) -> dict:
             """Fetch a GitHub issue by URL. Returns title, body, labels, and comments."""
-            import github as gh_module
-
             try:
                 owner, repo, number = _parse_issue_url(issue_url)
-                g = (
-                    gh_module.Github(ctx.deps.github_token)
-                    if ctx.deps.github_token
-                    else gh_module.Github()
-                )
-                repo_obj = g.get_repo(f"{owner}/{repo}")
-                issue = repo_obj.get_issue(number)
+                repo_obj = _get_repo(ctx.deps, f"{owner}/{repo}")
+                issue = _lazy_issue(repo_obj, number)
+                # Neither the repo nor the issue is fetched yet, so the issue, its
+                # comments and the repo are three independent requests; fetch the
+                # last two while the issue loads.
+                comments_future = _GITHUB_SUBCALLS.submit(issue.get_comments().get_page, 0)
+                branch_future = _GITHUB_SUBCALLS.submit(lambda: repo_obj.default_branch)
+                title, body = issue.title, issue.body or ""
+                labels = [lb.name for lb in issue.labels]
                 comments = [
-                    {"author": c.user.login, "body": c.body}
-                    for _, c in zip(range(10), issue.get_comments(), strict=False)
+                    {"author": c.user.login, "body": c.body} for c in comments_future.result()[:10]
                 ]
                 return {
                     "owner": owner,
                     "repo": repo,
                     "number": number,
-                    "title": issue.title,
-                    "body": issue.body or "",
-                    "labels": [lb.name for lb in issue.labels],
+                    "title": title,
+                    "body": body,
+                    "labels": labels,
                     "comments": comments,
-                    "default_branch": repo_obj.default_branch,
+                    "default_branch": branch_future.result(),
                 }
             except ValueError as exc:
                 return {"error": str(exc)}
@@ -134,26 +181,112 @@ class SoftwareDeveloperAgent(BaseAgent):
                 return {"error": f"Failed to fetch issue: {exc}"}
 
         @agent.tool
-        def clone_repo(ctx: RunContext[SoftwareDevDeps], repo: str, branch: str = "") -> dict:
-            """Clone a GitHub repository into the workspace. ``repo`` is 'owner/name'."""
+        def clone_repo(
+            ctx: RunContext[SoftwareDevDeps],
+            repo: str,
+            branch: str = "",
+            paths: list[str] | None = None,
+        ) -> dict:
+            """Clone a GitHub repository into the workspace. ``repo`` is 'owner/name'.
+
+            For large monorepos pass ``paths`` (directories the issue touches) to
+            check out only those subtrees; other directories are checked out on
+            demand when a file in them is read or written.
+            """
             repo_dir = ctx.deps.workspace_dir / repo.replace("/", "_")
-            git_env = _build_git_env(ctx.deps.github_token, ctx.deps.workspace_dir)
-            ctx.deps._git_env = git_env
+            if not ctx.deps._git_env:
+                ctx.deps._git_env = _build_git_env(ctx.deps.github_token, ctx.deps.workspace_dir)
+            git_env = ctx.deps._git_env
             try:
-                if repo_dir.exists():
-                    _run_git(["git", "pull"], cwd=repo_dir, env=git_env)
+                clone_url = f"https://github.com/{repo}.git"
+                if repo_dir.exists() and ctx.deps.mirror_dir:
+                    tip = _remote_tip(ctx.deps, repo, branch)
+                    with _mirror_lock(ctx.deps.mirror_dir):
+                        start = _fetch_into_mirror(
+                            ctx.deps.mirror_dir, clone_url, branch, git_env, tip
+                        )
+                    # Like the pull below, keep commits the task already made
+                    if branch:
+                        local = _task_branch_prefix(ctx.deps.workspace_dir) + branch
+                        if _local_sha(repo_dir, f"refs/heads/{local}"):
+                            _run_git(["git", "checkout", local], cwd=repo_dir, env=git_env)
+                        else:
+                            _run_git(
+                                ["git", "checkout", "-B", local, start],
+                                cwd=repo_dir,
+                                env=git_env,
+                            )
+                    _run_git(["git", "merge", "--ff-only", start], cwd=repo_dir, env=git_env)
+                elif repo_dir.exists():
+                    # Skip the pull when the upstream branch hasn't moved
+                    sha, tracked = _upstream(repo_dir)
+                    if not tracked or _remote_tip(ctx.deps, repo, tracked) != sha:
+                        _run_git(["git", "pull"], cwd=repo_dir, env=git_env)
+                    if branch:
+                        # The clone tracks a single branch; start tracking this one too
+                        _run_git(
+                            ["git", "remote", "set-branches", "--add", "origin", branch],
+                            cwd=repo_dir,
+                            env=git_env,
+                        )
+                        _run_git(
+                            ["git", "fetch", "--depth=1", "origin", branch],
+                            cwd=repo_dir,
+                            env=git_env,
+                        )
+                        _run_git(["git", "checkout", branch], cwd=repo_dir, env=git_env)
+                    ctx.deps.sparse = (repo_dir / ".git" / "info" / "sparse-checkout").exists()
+                    if paths and ctx.deps.sparse:
+                        _run_git(
+                            ["git", "sparse-checkout", "add", *paths], cwd=repo_dir, env=git_env
+                        )
+                elif paths:
+                    # Only the tip of one branch is needed, and blobs outside the
+                    # sparse cone are fetched only when checked out
+                    clone_cmd = ["git", "clone", "--depth=1", "--single-branch"]
+                    if branch:
+                        clone_cmd += ["--branch", branch]
+                    clone_cmd += ["--filter=blob:none", "--sparse"]
+                    _run_git([*clone_cmd, clone_url, str(repo_dir)], env=git_env)
+                    _run_git(
+                        ["git", "sparse-checkout", "set", "--cone", *paths],
+                        cwd=repo_dir,
+                        env=git_env,
+                    )
+                    ctx.deps.sparse = True
                 else:
-                    clone_url = f"https://github.com/{repo}.git"
-                    _run_git(["git", "clone", clone_url, str(repo_dir)], env=git_env)
+                    # Check out a worktree of the shared mirror, which already
+                    # holds the objects of earlier tasks on this repo.  Branches
+                    # are shared by every worktree, so the task's local branch
+                    # gets a per-task name; another task may have the same
+                    # branch checked out.
+                    mirrors_dir = Path(self.settings.software_dev_mirrors_dir)
+                    mirror_dir = mirrors_dir / f"{repo.replace('/', '_')}.git"
+                    tip = _remote_tip(ctx.deps, repo, branch)
+                    with _mirror_lock(mirror_dir):
+                        start = _fetch_into_mirror(mirror_dir, clone_url, branch, git_env, tip)
+                        checkout = ["--detach"]
+                        if branch:
+                            local = _task_branch_prefix(ctx.deps.workspace_dir) + branch
+                            checkout = ["-B", local]
+                        _run_git(
+                            ["git", "worktree", "add", *checkout, str(repo_dir), start],
+                            cwd=mirror_dir,
+                            env=git_env,
+                        )
+                    ctx.deps.mirror_dir = mirror_dir
                 # Configure git identity for commits
                 _run_git(
                     ["git", "config", "user.email", "angie@angie.bot"], cwd=repo_dir, env=git_env
                 )
                 _run_git(["git", "config", "user.name", "Angie"], cwd=repo_dir, env=git_env)
-                if branch:
-                    _run_git(["git", "checkout", branch], cwd=repo_dir, env=git_env)
                 ctx.deps.repo_dir = repo_dir
-                return {"cloned": True, "repo_dir": str(repo_dir), "branch": branch or "default"}
+                return {
+                    "cloned": True,
+                    "repo_dir": str(repo_dir),
+                    "branch": branch or "default",
+                    "sparse": ctx.deps.sparse,
+                }
             except subprocess.CalledProcessError as exc:
                 err_msg = _sanitize_token(exc.stderr or exc.output or "", ctx.deps.github_token)
                 return {"error": _classify_git_error(exc.returncode, err_msg)}
@@ -170,9 +303,12 @@ class SoftwareDeveloperAgent(BaseAgent):
                         "Use only alphanumeric characters, dots, hyphens, underscores, and slashes."
                     )
                 }
+            local = branch_name
+            if ctx.deps.mirror_dir:
+                local = _task_branch_prefix(ctx.deps.workspace_dir) + branch_name
             try:
                 _run_git(
-                    ["git", "checkout", "-b", branch_name],
+                    ["git", "checkout", "-b", local],
                     cwd=ctx.deps.repo_dir,
                     env=ctx.deps._git_env,
                 )
@@ -187,12 +323,26 @@ class SoftwareDeveloperAgent(BaseAgent):
             if not ctx.deps.repo_dir:
                 return {"error": "No repository cloned yet."}
             file_path = ctx.deps.repo_dir / path
-            if not file_path.is_file():
+            _widen_sparse_checkout(ctx.deps, Path(path).parent)
+            try:
+                st = file_path.stat()
+            except OSError:
+                st = None
+            if st is None or not stat.S_ISREG(st.st_mode):
                 return {"error": f"File not found: {path}"}
+            if st.st_size > _MAX_READ_FILE_SIZE:
+                return {
+                    "error": (
+                        f"File is {st.st_size // (1024 * 1024)}MB, too large to read. "
+                        "Use search_code to find the relevant lines."
+                    )
+                }
             try:
-                content = file_path.read_text(encoding="utf-8", errors="replace")
-                if len(content) > 50_000:
-                    content = content[:50_000] + "\n... (truncated)"
+                with open(file_path, "rb") as fh:
+                    data = fh.read(_READ_LIMIT + 1)
+                content = data[:_READ_LIMIT].decode("utf-8", errors="replace")
+                if len(data) > _READ_LIMIT:
+                    content += "\n... (truncated)"
                 return {"path": path, "content": content}
             except Exception as exc:  # noqa: BLE001
                 return {"error": str(exc)}
@@ -203,47 +353,42 @@ class SoftwareDeveloperAgent(BaseAgent):
             if not ctx.deps.repo_dir:
                 return {"error": "No repository cloned yet."}
             dir_path = ctx.deps.repo_dir / path
-            if not dir_path.is_dir():
+            _widen_sparse_checkout(ctx.deps, Path(path))
+            try:
+                st = dir_path.stat()
+            except OSError:
+                st = None
+            if st is None or not stat.S_ISDIR(st.st_mode):
                 return {"error": f"Directory not found: {path}"}
-            entries = []
-            for entry in sorted(dir_path.iterdir()):
-                if entry.name.startswith("."):
-                    continue
-                entries.append(
-                    {
-                        "name": entry.name,
-                        "type": "dir" if entry.is_dir() else "file",
-                    }
-                )
+            # Adding, removing or renaming an entry bumps the directory's mtime
+            key = (str(dir_path), st.st_mtime_ns)
+            entries = ctx.deps._listings.get(key)
+            if entries is None:
+                with os.scandir(dir_path) as it:
+                    entries = [
+                        {"name": entry.name, "type": "dir" if entry.is_dir() else "file"}
+                        for entry in it
+                        if not entry.name.startswith(".")
+                    ]
+                entries.sort(key=lambda e: e["name"])
+                if len(ctx.deps._listings) >= _LISTING_CACHE_SIZE:
+                    ctx.deps._listings.pop(next(iter(ctx.deps._listings), None), None)
+                ctx.deps._listings[key] = entries
             return {"path": path, "entries": entries}
 
         @agent.tool
         def search_code(ctx: RunContext[SoftwareDevDeps], pattern: str) -> dict:
-            """Search the codebase for a pattern using grep."""
+            """Search the codebase for a regular expression with ripgrep (or git grep / grep)."""
             if not ctx.deps.repo_dir:
                 return {"error": "No repository cloned yet."}
             try:
-                result = subprocess.run(
-                    [
-                        "grep",
-                        "-rn",
-                        "--include=*.py",
-                        "--include=*.ts",
-                        "--include=*.tsx",
-                        "--include=*.js",
-                        "--include=*.jsx",
-                        "--include=*.md",
-                        pattern,
-                    ],
-                    cwd=ctx.deps.repo_dir,
-                    capture_output=True,
-                    text=True,
-                    timeout=30,
-                )
-                lines = result.stdout.strip().split("\n")[:50]
-                return {"pattern": pattern, "matches": [line for line in lines if line]}
+                matches = _search_lines(pattern, ctx.deps.repo_dir)
+                return {"pattern": pattern, "matches": matches}
             except subprocess.TimeoutExpired:
                 return {"error": "Search timed out"}
+            except subprocess.CalledProcessError as exc:
+                err_msg = _sanitize_token(exc.stderr or "", ctx.deps.github_token)
+                return {"error": f"Search failed: {err_msg}"}
 
         @agent.tool
         def write_file(ctx: RunContext[SoftwareDevDeps], path: str, content: str) -> dict:
@@ -267,6 +412,8 @@ class SoftwareDeveloperAgent(BaseAgent):
                     )
                 }
             file_path = ctx.deps.repo_dir / path
+            # Files outside the sparse cone would be skipped by ``git add -A``
+            _widen_sparse_checkout(ctx.deps, Path(path).parent)
             file_path.parent.mkdir(parents=True, exist_ok=True)
             file_path.write_text(content, encoding="utf-8")
             return {"written": True, "path": path, "size": len(content)}
@@ -309,23 +456,21 @@ class SoftwareDeveloperAgent(BaseAgent):
                 else:
                     return {"error": "No test framework detected. Provide a test_command."}
 
-            if _BLOCKED_COMMANDS.search(test_command) or _SHELL_INJECTION.search(test_command):
+            if _is_blocked_command(test_command):
                 return {"error": "Test command blocked for safety reasons."}
 
             try:
-                result = subprocess.run(
+                returncode, stdout, stderr = _run_with_tails(
                     ["sh", "-c", test_command],
                     cwd=repo_dir,
-                    capture_output=True,
-                    text=True,
+                    env=ctx.deps._git_env or None,
                     timeout=300,  # 5 minutes for tests
-                    env={**os.environ, **ctx.deps._git_env},
+                    stdout_limit=5000,
+                    stderr_limit=2000,
                 )
-                stdout = result.stdout[-5000:] if len(result.stdout) > 5000 else result.stdout
-                stderr = result.stderr[-2000:] if len(result.stderr) > 2000 else result.stderr
                 return {
-                    "passed": result.returncode == 0,
-                    "returncode": result.returncode,
+                    "passed": returncode == 0,
+                    "returncode": returncode,
                     "stdout": _sanitize_token(stdout, ctx.deps.github_token),
                     "stderr": _sanitize_token(stderr, ctx.deps.github_token),
                 }
@@ -336,14 +481,7 @@ class SoftwareDeveloperAgent(BaseAgent):
         def check_ci_status(ctx: RunContext[SoftwareDevDeps], repo: str, branch: str) -> dict:
             """Check CI/check status for a branch after pushing."""
             try:
-                import github as gh_module
-
-                g = (
-                    gh_module.Github(ctx.deps.github_token)
-                    if ctx.deps.github_token
-                    else gh_module.Github()
-                )
-                repo_obj = g.get_repo(repo)
+                repo_obj = _get_repo(ctx.deps, repo)
                 branch_obj = repo_obj.get_branch(branch)
                 commit = repo_obj.get_commit(branch_obj.commit.sha)
 
@@ -372,21 +510,19 @@ class SoftwareDeveloperAgent(BaseAgent):
             """Run a shell command in the repository directory. Has a timeout and blocks dangerous commands."""
             if not ctx.deps.repo_dir:
                 return {"error": "No repository cloned yet."}
-            if _BLOCKED_COMMANDS.search(command) or _SHELL_INJECTION.search(command):
+            if _is_blocked_command(command):
                 return {"error": "Command blocked for safety reasons."}
             try:
-                result = subprocess.run(
+                returncode, output, stderr = _run_with_tails(
                     ["sh", "-c", command],
                     cwd=ctx.deps.repo_dir,
-                    capture_output=True,
-                    text=True,
+                    env=ctx.deps._git_env or None,
                     timeout=_COMMAND_TIMEOUT,
-                    env={**os.environ, **ctx.deps._git_env},
+                    stdout_limit=5000,
+                    stderr_limit=2000,
                 )
-                output = result.stdout[-5000:] if len(result.stdout) > 5000 else result.stdout
-                stderr = result.stderr[-2000:] if len(result.stderr) > 2000 else result.stderr
                 return {
-                    "returncode": result.returncode,
+                    "returncode": returncode,
                     "stdout": _sanitize_token(output, ctx.deps.github_token),
                     "stderr": _sanitize_token(stderr, ctx.deps.github_token),
                 }
@@ -401,26 +537,19 @@ class SoftwareDeveloperAgent(BaseAgent):
             cwd = ctx.deps.repo_dir
             git_env = ctx.deps._git_env
             try:
-                _run_git(["git", "add", "-A"], cwd=cwd, env=git_env)
-                _run_git(["git", "commit", "-m", message], cwd=cwd, env=git_env)
-                # Use --force-with-lease for safe push that rejects if remote has diverged
-                _run_git(
-                    ["git", "push", "--force-with-lease", "-u", "origin", "HEAD"],
+                # One shell runs the whole sequence; the message is passed as $1
+                # so it is never interpolated into the script.
+                prefix = _task_branch_prefix(ctx.deps.workspace_dir) if ctx.deps.mirror_dir else ""
+                result = _run_git(
+                    ["sh", "-c", _COMMIT_AND_PUSH_SCRIPT, "sh", message, prefix],
                     cwd=cwd,
                     env=git_env,
                 )
             except subprocess.CalledProcessError as exc:
                 err_msg = _sanitize_token(exc.stderr or exc.output or "", ctx.deps.github_token)
                 return {"error": _classify_git_error(exc.returncode, err_msg)}
-            branch_result = _run_git(
-                ["git", "rev-parse", "--abbrev-ref", "HEAD"], cwd=cwd, env=git_env
-            )
-            sha_result = _run_git(["git", "rev-parse", "HEAD"], cwd=cwd, env=git_env)
-            return {
-                "committed": True,
-                "branch": branch_result.stdout.strip(),
-                "sha": sha_result.stdout.strip(),
-            }
+            sha, branch = result.stdout.splitlines()[-2:]
+            return {"committed": True, "branch": branch, "sha": sha}
 
         @agent.tool
         def create_pull_request(
@@ -432,14 +561,8 @@ class SoftwareDeveloperAgent(BaseAgent):
             issue_number: int = 0,
         ) -> dict:
             """Open a pull request via the GitHub API."""
-            import github as gh_module
-
-            g = (
-                gh_module.Github(ctx.deps.github_token)
-                if ctx.deps.github_token
-                else gh_module.Github()
-            )
-            repo_obj = g.get_repo(repo)
+            gh_module = _github_module()
+            repo_obj = _get_repo(ctx.deps, repo)
 
             if issue_number and f"#{issue_number}" not in body:
                 body += f"\n\nCloses #{issue_number}"
@@ -475,16 +598,18 @@ class SoftwareDeveloperAgent(BaseAgent):
 
     async def execute(self, task: dict[str, Any]) -> dict[str, Any]:
         try:
-            import github as gh_module  # noqa: F401
+            _github_module()
         except ImportError:
             return {"error": "PyGithub not installed"}
 
         self.logger.info("SoftwareDeveloperAgent executing")
         workspace_dir = Path(tempfile.mkdtemp(prefix="angie-workspace-"))
+        deps: SoftwareDevDeps | None = None
 
         try:
             user_id = task.get("user_id")
-            creds = await self.get_credentials(user_id, "github")
+            conversation_id = task.get("input_data", {}).get("conversation_id")
+            creds, history = await self._credentials_and_history(user_id, "github", conversation_id)
             token = ""
             token_source = "none"
 
@@ -521,7 +646,7 @@ class SoftwareDeveloperAgent(BaseAgent):
 
             # Extract issue URL and build an explicit prompt so the LLM
             # doesn't ask the user for it again.
-            issue_match = re.search(r"https?://github\.com/[^/]+/[^/]+/issues/\d+", intent)
+            issue_match = _ISSUE_URL_RE.search(intent)
             if issue_match:
                 issue_url = issue_match.group(0)
                 prompt = (
@@ -532,9 +657,7 @@ class SoftwareDeveloperAgent(BaseAgent):
             else:
                 prompt = intent
 
-            conversation_id = task.get("input_data", {}).get("conversation_id")
             if conversation_id:
-                history = await self.get_conversation_history(conversation_id)
                 prompt = self._build_context_prompt(prompt, history)
 
             result = await self._run_with_tracking(
@@ -556,9 +679,14 @@ class SoftwareDeveloperAgent(BaseAgent):
             safe_msg = _sanitize_token(str(exc), token if "token" in dir() else "")
             return {"summary": f"Software dev error: {safe_msg}", "error": safe_msg}
         finally:
-            # Clean up workspace
-            if workspace_dir.exists():
-                shutil.rmtree(workspace_dir, ignore_errors=True)
+            # Clean up the workspace without holding up the reply; the mirror's
+            # objects are kept for the next task
+            mirror_dir, repo_dir = (deps.mirror_dir, deps.repo_dir) if deps else (None, None)
+            threading.Thread(
+                target=_cleanup_workspace,
+                args=(workspace_dir, mirror_dir, repo_dir),
+                name="angie-workspace-cleanup",
+            ).start()
 
     async def _schedule_ci_followup(self, summary: str, task: dict[str, Any], token: str) -> None:
         """If a PR was created, schedule a follow-up to check CI status."""
@@ -591,17 +719,37 @@ class SoftwareDeveloperAgent(BaseAgent):
 
 def _parse_issue_url(url: str) -> tuple[str, str, int]:
     """Extract (owner, repo, issue_number) from a GitHub issue URL."""
-    # https://github.com/owner/repo/issues/42
-    match = re.search(r"github\.com/([^/]+)/([^/]+)/issues/(\d+)", url)
+    # https://github.com/owner/repo/issues/42 — the common case, no regex needed
+    parts = urlsplit(url)
+    if parts.netloc in _GITHUB_HOSTS:
+        segments = parts.path.lstrip("/").split("/", 4)
+        if (
+            len(segments) >= 4
+            and segments[2] == "issues"
+            and segments[3].isdecimal()
+            and all(segments[:2])
+        ):
+            return segments[0], segments[1], int(segments[3])
+    match = _ISSUE_URL_RE.search(url)
     if match:
         return match.group(1), match.group(2), int(match.group(3))
     # Fallback: try #N format with repo context
-    match = re.search(r"([^/\s]+)/([^/\s]+)#(\d+)", url)
+    match = _ISSUE_REF_RE.search(url)
     if match:
         return match.group(1), match.group(2), int(match.group(3))
     raise ValueError(f"Could not parse GitHub issue URL: {url!r}")
 
 
+@functools.lru_cache(maxsize=256)
+def _is_blocked_command(command: str) -> bool:
+    """Return True if *command* matches the destructive or injection blocklists.
+
+    Memoized because agents re-run the same few commands (``pytest -q``,
+    ``ruff check .``) many times per task.
+    """
+    return _UNSAFE_COMMAND.search(command) is not None
+
+
 def _build_git_env(token: str, workspace_dir: Path) -> dict[str, str]:
     """Build environment dict for git commands using GIT_ASKPASS for auth.
 
@@ -614,8 +762,10 @@ def _build_git_env(token: str, workspace_dir: Path) -> dict[str, str]:
         return env
 
     askpass_script = workspace_dir / ".git-askpass"
-    askpass_script.write_text(f"#!/bin/sh\necho '{token}'\n")
-    askpass_script.chmod(stat.S_IRWXU)
+    # Created executable (owner-only) in one step; the token is shell-quoted
+    fd = os.open(askpass_script, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC, 0o700)
+    with os.fdopen(fd, "w") as fh:
+        fh.write(f"#!/bin/sh\nprintf '%s\\n' {shlex.quote(token)}\n")
 
     env["GIT_ASKPASS"] = str(askpass_script)
     env["GIT_TERMINAL_PROMPT"] = "0"
@@ -643,11 +793,292 @@ def _run_git(
     return result
 
 
+def _widen_sparse_checkout(deps: SoftwareDevDeps, directory: Path) -> None:
+    """Add *directory* to a sparse checkout's cone unless it is already on disk.
+
+    No-op for full clones.  Failures are ignored: the caller's own existence
+    check reports the missing path.
+    """
+    if not deps.sparse or directory == Path(".") or (deps.repo_dir / directory).is_dir():
+        return
+    with contextlib.suppress(subprocess.CalledProcessError, subprocess.TimeoutExpired):
+        _run_git(
+            ["git", "sparse-checkout", "add", directory.as_posix()],
+            cwd=deps.repo_dir,
+            env=deps._git_env,
+        )
+
+
+@contextlib.contextmanager
+def _mirror_lock(mirror_dir: Path) -> Iterator[None]:
+    """Hold an exclusive lock on *mirror_dir* across worker processes."""
+    mirror_dir.parent.mkdir(parents=True, exist_ok=True)
+    with open(mirror_dir.with_suffix(".lock"), "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        yield
+
+
+def _fetch_into_mirror(
+    mirror_dir: Path, url: str, branch: str, env: dict[str, str], tip: str = ""
+) -> str:
+    """Create or update the bare mirror of *url* and return the ref to check out.
+
+    Only the tip of *branch* (or of the default branch) is fetched at first,
+    and later only the commits on top of it, with the caller's credentials,
+    so a task never gets a worktree of a repository its token cannot read.
+    The fetch is skipped when the mirror already holds *tip*, the SHA
+    ``_remote_tip`` read with those same credentials.  Call with
+    ``_mirror_lock`` held.
+    """
+    if branch:
+        ref, refspec = f"origin/{branch}", f"+refs/heads/{branch}:refs/remotes/origin/{branch}"
+    else:
+        ref, refspec = "origin/HEAD", "+HEAD:refs/remotes/origin/HEAD"
+    if mirror_dir.exists():
+        have = _local_sha(mirror_dir, f"refs/remotes/{ref}")
+    else:
+        have = ""
+        _run_git(["git", "init", "--bare", str(mirror_dir)], env=env)
+        _run_git(["git", "remote", "add", "origin", url], cwd=mirror_dir, env=env)
+    if not tip or have != tip:
+        # Unshallow updates, so worktrees already on the ref can fast-forward
+        depth = [] if have else ["--depth=1"]
+        _run_git(["git", "fetch", *depth, "origin", refspec], cwd=mirror_dir, env=env)
+    # Forget worktrees whose task directory is already gone
+    _run_git(["git", "worktree", "prune"], cwd=mirror_dir, env=env)
+    return ref
+
+
+def _get_repo(deps: SoftwareDevDeps, full_name: str) -> Any:
+    """Return the task's PyGithub repository object for *full_name*.
+
+    One lazy object per repository is kept on *deps*, so attributes one tool
+    loads (``default_branch`` in ``fetch_issue``) are already there for the
+    next (``create_pull_request``) instead of being requested again.
+    """
+    key = full_name.lower()
+    repo_obj = deps._repos.get(key)
+    if repo_obj is None:
+        repo_obj = deps._repos[key] = _github_client(deps.github_token).get_repo(
+            full_name, lazy=True
+        )
+    return repo_obj
+
+
+def _lazy_issue(repo_obj: Any, number: int) -> Any:
+    """Return issue *number* of *repo_obj* without fetching it.
+
+    ``Repository.get_issue()`` always GETs the issue; this object only loads
+    when an unset attribute is read, and ``get_comments()`` needs just its URL.
+    """
+    return _github_module().Issue.Issue(
+        repo_obj.requester, url=f"{repo_obj.url}/issues/{number}", completed=False
+    )
+
+
+def _remote_tip(deps: SoftwareDevDeps, repo: str, branch: str) -> str:
+    """Return the SHA at the tip of *branch* on GitHub, or "" if it can't be read.
+
+    An empty *branch* means the default branch.  The lookups go through the
+    shared client, so an unchanged ref is revalidated by ETag and answered
+    with a 304 that costs no rate limit and no ``git-upload-pack`` negotiation.
+    """
+    try:
+        repo_obj = _get_repo(deps, repo)
+        ref = repo_obj.get_git_ref(f"heads/{branch or repo_obj.default_branch}")
+        return ref.object.sha
+    except Exception:  # noqa: BLE001
+        return ""
+
+
+def _local_sha(cwd: Path, rev: str) -> str:
+    """Return the SHA *rev* resolves to in *cwd*, or "" if it doesn't exist."""
+    try:
+        return _run_git(["git", "rev-parse", "--verify", "-q", rev], cwd=cwd).stdout.strip()
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
+        return ""
+
+
+def _upstream(repo_dir: Path) -> tuple[str, str]:
+    """Return the SHA and remote branch name HEAD tracks, or ("", "") if none."""
+    try:
+        result = _run_git(["git", "rev-parse", "@{u}", "--abbrev-ref", "@{u}"], cwd=repo_dir)
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
+        return "", ""
+    sha, tracked = result.stdout.split()
+    return sha, tracked.removeprefix("origin/")
+
+
+def _task_branch_prefix(workspace_dir: Path) -> str:
+    """Return the prefix of a task's local branch names in a shared mirror.
+
+    A branch can be checked out in only one worktree, and every worktree of
+    the mirror sees the same branches, so each task names its local branches
+    ``angie-task/<workspace>/<branch>``.  Pushes strip the prefix again.
+    """
+    return f"angie-task/{workspace_dir.name}/"
+
+
+def _remove_worktree(mirror_dir: Path, repo_dir: Path, branch_prefix: str) -> None:
+    """Detach *repo_dir* from its mirror and drop the task's local branches."""
+    with (
+        _mirror_lock(mirror_dir),
+        contextlib.suppress(subprocess.CalledProcessError, subprocess.TimeoutExpired),
+    ):
+        _run_git(["git", "worktree", "remove", "--force", str(repo_dir)], cwd=mirror_dir)
+        refs = _run_git(
+            ["git", "for-each-ref", "--format=%(refname)", f"refs/heads/{branch_prefix}"],
+            cwd=mirror_dir,
+        ).stdout.split()
+        for ref in refs:
+            _run_git(["git", "update-ref", "-d", ref], cwd=mirror_dir)
+
+
+def _cleanup_workspace(workspace_dir: Path, mirror_dir: Path | None, repo_dir: Path | None) -> None:
+    """Remove a finished task's worktree (if any) and its workspace directory."""
+    if mirror_dir and repo_dir:
+        _remove_worktree(mirror_dir, repo_dir, _task_branch_prefix(workspace_dir))
+    shutil.rmtree(workspace_dir, ignore_errors=True)
+
+
+def _search_lines(pattern: str, cwd: Path) -> list[str]:
+    """Return the first ``_SEARCH_LIMIT`` ``path:line:text`` matches for *pattern*.
+
+    *pattern* is an extended regular expression, which ripgrep and the
+    ``-E`` fallbacks read alike.  Output is read as it streams and the search
+    is stopped once enough lines arrive, so a broad pattern never buffers
+    every match in the repository.  Raises ``subprocess.TimeoutExpired``
+    after ``_SEARCH_TIMEOUT`` seconds and ``subprocess.CalledProcessError``
+    when the search fails (exit code 2 or more, e.g. an invalid pattern).
+    """
+    if _RG:
+        cmd = [_RG, "--line-number", "--no-heading", "--color=never"]
+        cmd += [f"--glob={glob}" for glob in _SEARCH_GLOBS]
+        cmd += ["-e", pattern]
+    elif (cwd / ".git").exists():
+        # Searches tracked files only, so ignored trees are skipped as with rg
+        cmd = ["git", "grep", "-n", "-I", "-E", "--no-color", "-e", pattern]
+        cmd += ["--", *_SEARCH_GLOBS]
+    else:
+        cmd = ["grep", "-rnE", *(f"--include={glob}" for glob in _SEARCH_GLOBS)]
+        cmd += ["-e", pattern]
+
+    # stderr goes to a file, so an error message can't fill a pipe nobody reads
+    with tempfile.TemporaryFile("w+", encoding="utf-8", errors="replace") as stderr:
+        proc = subprocess.Popen(
+            cmd,
+            cwd=cwd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=stderr,
+            encoding="utf-8",
+            errors="replace",
+        )
+        timed_out = threading.Event()
+
+        def _expire() -> None:
+            timed_out.set()
+            proc.kill()
+
+        timer = threading.Timer(_SEARCH_TIMEOUT, _expire)
+        timer.start()
+        try:
+            lines = [line.rstrip("\n") for line in itertools.islice(proc.stdout, _SEARCH_LIMIT)]
+            if len(lines) < _SEARCH_LIMIT:
+                # The output ended on its own; collect the exit code
+                proc.wait()
+        finally:
+            timer.cancel()
+            proc.kill()
+            proc.wait()
+            proc.stdout.close()
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, _SEARCH_TIMEOUT)
+        if proc.returncode >= 2:
+            stderr.seek(0)
+            raise subprocess.CalledProcessError(proc.returncode, cmd, stderr=stderr.read())
+    return [line for line in lines if line]
+
+
+def _run_with_tails(
+    cmd: list[str],
+    cwd: Path,
+    env: dict[str, str] | None,
+    timeout: float,
+    stdout_limit: int,
+    stderr_limit: int,
+) -> tuple[int, str, str]:
+    """Run *cmd* and return its exit code and the last bytes of stdout/stderr.
+
+    Each pipe is drained by a thread into a buffer trimmed to its limit, so
+    memory stays bounded however much the command prints.  The command runs
+    in its own process group, which is killed once it exits, so a background
+    child still holding the pipes can't keep the call waiting.  Raises
+    ``subprocess.TimeoutExpired`` (after killing the group) if it outlives
+    *timeout*.
+    """
+    proc = subprocess.Popen(
+        cmd,
+        cwd=cwd,
+        env=env,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        start_new_session=True,
+    )
+    tails = [bytearray(), bytearray()]
+
+    def _drain(pipe: Any, tail: bytearray, limit: int) -> None:
+        with pipe:
+            for chunk in iter(lambda: pipe.read1(65536), b""):
+                tail += chunk
+                del tail[:-limit]
+
+    readers = [
+        threading.Thread(target=_drain, args=(proc.stdout, tails[0], stdout_limit), daemon=True),
+        threading.Thread(target=_drain, args=(proc.stderr, tails[1], stderr_limit), daemon=True),
+    ]
+    for reader in readers:
+        reader.start()
+    try:
+        returncode = proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        _kill_group(proc.pid)
+        proc.wait()
+        raise
+    finally:
+        # Leftover background children are killed with the group, closing
+        # their ends of the pipes.  One that escaped the group (setsid) is
+        # not waited for; its reader exits and closes the pipe when it does.
+        _kill_group(proc.pid)
+        for reader in readers:
+            reader.join(timeout=_READER_GRACE)
+    stdout, stderr = (bytes(tail).decode("utf-8", errors="replace") for tail in tails)
+    return returncode, stdout, stderr
+
+
+def _kill_group(pgid: int) -> None:
+    """SIGKILL every process left in process group *pgid*, if any."""
+    with contextlib.suppress(ProcessLookupError, PermissionError):
+        os.killpg(pgid, signal.SIGKILL)
+
+
 def _sanitize_token(text: str, token: str) -> str:
     """Remove the GitHub PAT from any string to prevent leakage."""
-    if not token or not text:
+    if not text:
         return text
-    return text.replace(token, "***")
+    return _secret_pattern(token).sub("***", text)
+
+
+@functools.lru_cache(maxsize=32)
+def _secret_pattern(token: str) -> re.Pattern[str]:
+    """Compile one pattern matching *token*, its URL-encoded form and any GitHub token.
+
+    Everything ``_sanitize_token`` scrubs is matched in a single pass.
+    """
+    forms = {token, quote(token, safe="")} - {""}
+    literals = [re.escape(form) for form in sorted(forms, key=len, reverse=True)]
+    return re.compile("|".join([*literals, _GITHUB_TOKEN_SHAPE]))
 
 
 def _get_dir_size(path: Path) -> int:
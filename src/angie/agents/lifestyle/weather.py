@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import logging
 import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any, ClassVar
 
 import httpx
@@ -16,6 +18,22 @@ logger = logging.getLogger(__name__)
 _OWM_BASE = "https://api.openweathermap.org"
 
 
+@asynccontextmanager
+async def _owm_client(deps: dict[str, Any]) -> AsyncIterator[httpx.AsyncClient]:
+    """Yield the run's shared HTTP client, or a one-off client outside execute().
+
+    ``execute()`` opens one client per run so every tool call reuses its
+    pooled keep-alive connection to OpenWeatherMap instead of a fresh TLS
+    handshake per call.
+    """
+    client = deps.get("http")
+    if client is not None:
+        yield client
+        return
+    async with httpx.AsyncClient(timeout=10.0) as client:
+        yield client
+
+
 class WeatherAgent(BaseAgent):
     name: ClassVar[str] = "WeatherAgent"
     slug: ClassVar[str] = "weather"
@@ -44,6 +62,8 @@ class WeatherAgent(BaseAgent):
         "- Use natural, conversational language.\n"
         "- If the user doesn't specify units, default to metric (Celsius).\n"
     )
+    # Conditions change slowly; reuse answers to repeated questions briefly
+    intent_cache_ttl: ClassVar[float] = 600.0
 
     def build_pydantic_agent(self):
         from pydantic_ai import Agent
@@ -67,7 +87,7 @@ class WeatherAgent(BaseAgent):
                        or "standard" (Kelvin). Defaults to metric.
             """
             api_key = ctx.deps["api_key"]
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with _owm_client(ctx.deps) as client:
                 resp = await client.get(
                     f"{_OWM_BASE}/data/2.5/weather",
                     params={"q": location, "appid": api_key, "units": units},
@@ -112,7 +132,7 @@ class WeatherAgent(BaseAgent):
             api_key = ctx.deps["api_key"]
             days = max(1, min(5, days))
 
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with _owm_client(ctx.deps) as client:
                 resp = await client.get(
                     f"{_OWM_BASE}/data/2.5/forecast",
                     params={"q": location, "appid": api_key, "units": units},
@@ -190,7 +210,7 @@ class WeatherAgent(BaseAgent):
             api_key = ctx.deps["api_key"]
 
             # First geocode the location to get lat/lon
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with _owm_client(ctx.deps) as client:
                 geo_resp = await client.get(
                     f"{_OWM_BASE}/geo/1.0/direct",
                     params={"q": location, "limit": 1, "appid": api_key},
@@ -251,7 +271,10 @@ class WeatherAgent(BaseAgent):
         self.logger.info("WeatherAgent executing")
         try:
             user_id = task.get("user_id")
-            creds = await self.get_credentials(user_id, "openweathermap")
+            conversation_id = task.get("input_data", {}).get("conversation_id")
+            creds, history = await self._credentials_and_history(
+                user_id, "openweathermap", conversation_id
+            )
             api_key = (creds or {}).get("api_key") or os.environ.get("OPENWEATHERMAP_API_KEY", "")
 
             if not api_key:
@@ -266,22 +289,28 @@ class WeatherAgent(BaseAgent):
             from angie.llm import get_llm_model
 
             intent = self._extract_intent(task, fallback="what's the weather like?")
-            conversation_id = task.get("input_data", {}).get("conversation_id")
             if conversation_id:
-                history = await self.get_conversation_history(conversation_id)
                 prompt = self._build_context_prompt(intent, history)
             else:
+                # Without history the answer depends only on the intent
+                cached = self._intent_cache_lookup(intent, user_id)
+                if cached is not None:
+                    return cached
                 prompt = intent
-            deps: dict[str, Any] = {"api_key": api_key}
-            result = await self._run_with_tracking(
-                prompt,
-                model=get_llm_model(),
-                deps=deps,
-                user_id=user_id,
-                task_id=task.get("task_id"),
-                conversation_id=conversation_id,
-            )
-            return {"summary": str(result.output)}
+            async with httpx.AsyncClient(timeout=10.0) as http:
+                deps: dict[str, Any] = {"api_key": api_key, "http": http}
+                result = await self._run_with_tracking(
+                    prompt,
+                    model=get_llm_model(),
+                    deps=deps,
+                    user_id=user_id,
+                    task_id=task.get("task_id"),
+                    conversation_id=conversation_id,
+                )
+            response = {"summary": str(result.output)}
+            if not conversation_id:
+                self._intent_cache_store(intent, user_id, response)
+            return response
 
         except Exception as exc:  # noqa: BLE001
             self.logger.exception("WeatherAgent error")
@@ -13,7 +13,7 @@ from urllib.parse import urlparse
 import httpx
 from pydantic_ai import RunContext
 
-from angie.agents.base import BaseAgent
+from angie.agents.base import BaseAgent, CachingConfig
 
 if TYPE_CHECKING:
     from pydantic_ai import Agent
@@ -86,6 +86,8 @@ class WebAgent(BaseAgent):
         "you MUST include that EXACT markdown image in your response. "
         "Never replace the /api/v1/media/ URL with the original page URL.\n"
     )
+    # Page summaries depend only on the extracted text
+    response_cache: ClassVar[CachingConfig] = CachingConfig()
 
     def build_pydantic_agent(self) -> Agent:
         from pydantic_ai import Agent
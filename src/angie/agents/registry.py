@@ -29,11 +29,66 @@ class AgentRegistry:
     def __init__(self) -> None:
         self._agents: dict[str, BaseAgent] = {}
         self._loaded = False
+        # Routing dispatch table, rebuilt lazily after any register()
+        self._by_keyword: dict[str, list[str]] | None = None
+        self._custom_scorers: set[str] = set()
+        # LLM routing: the router agent and the agent list it is prompted with
+        self._router: Any = None
+        self._agent_descriptions: str | None = None
 
     def register(self, agent: BaseAgent) -> None:
         self._agents[agent.slug] = agent
+        self._by_keyword = None
+        self._agent_descriptions = None
         logger.debug("Registered agent: %s", agent.slug)
 
+    def _dispatch_table(self) -> dict[str, list[str]]:
+        """Return the inverted ``{capability keyword: [slug, ...]}`` index.
+
+        Agents that override ``confidence()`` can score on anything, so they
+        are also kept in ``_custom_scorers`` and always evaluated.
+        """
+        if self._by_keyword is None:
+            by_keyword: dict[str, list[str]] = {}
+            custom: set[str] = set()
+            for slug, agent in self._agents.items():
+                if type(agent).confidence is not BaseAgent.confidence:
+                    custom.add(slug)
+                for keyword in type(agent)._caps_lower:
+                    by_keyword.setdefault(keyword, []).append(slug)
+            self._by_keyword, self._custom_scorers = by_keyword, custom
+        return self._by_keyword
+
+    def _candidates(self, task: dict[str, Any]) -> tuple[list[BaseAgent], set[str] | None]:
+        """Return the agents that can score above zero for *task*, and its keywords.
+
+        With the default ``confidence()`` an explicit ``agent_slug`` only
+        matches that agent, and otherwise an agent needs at least one
+        capability keyword in the task text.  Each distinct keyword is
+        checked once, however many agents share it, and the set of matches
+        is returned (``None`` when an ``agent_slug`` was given) so agents are
+        scored from it instead of rescanning the text.  Registration order is
+        preserved so ties resolve exactly as a full scan would.
+        """
+        by_keyword = self._dispatch_table()
+        task_slug = task.get("agent_slug")
+        matched: set[str] | None = None
+        if task_slug:
+            hits = {task_slug}
+        else:
+            combined = BaseAgent._match_text(task)
+            matched = {kw for kw in by_keyword if kw in combined}
+            hits = {slug for kw in matched for slug in by_keyword[kw]}
+        hits |= self._custom_scorers
+        agents = [agent for slug, agent in self._agents.items() if slug in hits]
+        return agents, matched
+
+    def _score(self, agent: BaseAgent, task: dict[str, Any], matched: set[str] | None) -> float:
+        """Return *agent*'s confidence for *task*, reusing the keyword matches."""
+        if matched is None or agent.slug in self._custom_scorers:
+            return agent.confidence(task)
+        return agent._keyword_confidence(matched)
+
     def load_all(self) -> None:
         """Import all known agent modules and register any BaseAgent subclasses found."""
         if self._loaded:
@@ -64,8 +119,9 @@ class AgentRegistry:
         """Find the best agent by confidence score. Falls back to LLM routing."""
         self.load_all()
 
-        # Confidence scoring
-        scored = [(agent, agent.confidence(task)) for agent in self._agents.values()]
+        # Confidence scoring, restricted to agents that can score at all
+        candidates, matched = self._candidates(task)
+        scored = [(agent, self._score(agent, task, matched)) for agent in candidates]
         scored.sort(key=lambda x: x[1], reverse=True)
 
         if scored and scored[0][1] >= 0.5:
@@ -99,24 +155,26 @@ class AgentRegistry:
         if not is_llm_configured():
             return None
 
-        agent_descriptions = "\n".join(
-            f"- {a.slug}: {a.description} (capabilities: {', '.join(a.capabilities)})"
-            for a in self._agents.values()
-        )
+        if self._agent_descriptions is None:
+            self._agent_descriptions = "\n".join(
+                f"- {a.slug}: {a.description} (capabilities: {', '.join(a.capabilities)})"
+                for a in self._agents.values()
+            )
         prompt = (
             f"Given this task: {task.get('title', '')}\n"
             f"User text: {task.get('input_data', {}).get('text', '')}\n\n"
-            f"Available agents:\n{agent_descriptions}\n\n"
+            f"Available agents:\n{self._agent_descriptions}\n\n"
             f"Which agent slug should handle this? Reply with just the slug, "
             f"or 'none' if no agent fits."
         )
         try:
-            from pydantic_ai import Agent
+            if self._router is None:
+                from pydantic_ai import Agent
 
-            agent = Agent(
-                system_prompt="You are a task router. Reply with only an agent slug or 'none'."
-            )
-            result = await agent.run(prompt, model=get_llm_model())
+                self._router = Agent(
+                    system_prompt="You are a task router. Reply with only an agent slug or 'none'."
+                )
+            result = await self._router.run(prompt, model=get_llm_model())
             slug = str(result.output).strip().lower()
 
             from angie.core.token_usage import record_usage_fire_and_forget
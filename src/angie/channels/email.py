@@ -39,12 +39,13 @@ class EmailChannel(BaseChannel):
         """Periodically check IMAP inbox for new messages addressed to Angie."""
         while True:
             try:
-                await asyncio.get_event_loop().run_in_executor(None, self._check_inbox)
+                await asyncio.to_thread(self._check_inbox, asyncio.get_running_loop())
             except Exception as exc:
                 logger.warning("Email IMAP poll error: %s", exc)
             await asyncio.sleep(POLL_INTERVAL)
 
-    def _check_inbox(self) -> None:
+    def _check_inbox(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Fetch unseen mail (runs in a worker thread) and dispatch it on *loop*."""
         s = self.settings
         try:
             conn = imaplib.IMAP4_SSL(s.email_imap_host, s.email_imap_port)
@@ -64,7 +65,7 @@ class EmailChannel(BaseChannel):
                 # Fire event (sync → schedule on event loop)
                 asyncio.run_coroutine_threadsafe(
                     self._dispatch_event(sender, subject, body),
-                    asyncio.get_event_loop(),
+                    loop,
                 )
                 # Mark as seen
                 conn.store(mid, "+FLAGS", "\\Seen")
@@ -108,7 +109,7 @@ class EmailChannel(BaseChannel):
         msg["From"] = s.email_username
         msg["To"] = user_id
 
-        await asyncio.get_event_loop().run_in_executor(None, self._smtp_send, msg, user_id)
+        await asyncio.to_thread(self._smtp_send, msg, user_id)
 
     def _smtp_send(self, msg: MIMEText, to: str) -> None:
         s = self.settings
@@ -27,10 +27,10 @@ def daemon():
     """Start the Angie daemon (event loop)."""
     import asyncio
 
-    from angie.core.loop import run_daemon
+    from angie.core.loop import event_loop_factory, run_daemon
 
     click.echo("Starting Angie daemon...")
-    asyncio.run(run_daemon())
+    asyncio.run(run_daemon(), loop_factory=event_loop_factory())
 
 
 @cli.command()
@@ -115,6 +115,8 @@ class Settings(BaseSettings):
 
     # GitHub
     github_pat: str | None = None
+    # Threads the GitHub agent runs its blocking PyGithub tool calls on
+    github_pool_size: int = 32
 
     # Web/Screenshot agent
     web_playwright_headless: bool = True
@@ -126,6 +128,11 @@ class Settings(BaseSettings):
         default_factory=lambda: str(Path.cwd() / "data" / "screenshots")
     )
 
+    # Software developer agent: persistent bare mirrors that task worktrees share
+    software_dev_mirrors_dir: str = Field(
+        default_factory=lambda: str(Path.home() / ".cache" / "angie" / "mirrors")
+    )
+
     # Celery
     celery_broker_url: str | None = None
     celery_result_backend: str | None = None
@@ -171,17 +171,22 @@ class CronEngine:
             self._jobs.pop(job_id, None)
             logger.info("Removed stale cron job %s", job_id)
 
-        # Add or update jobs from DB
+        # Add or update jobs from DB, judging every @once job against one clock
+        now = datetime.now(UTC)
         for job_id, job_record in db_jobs.items():
             existing = self._jobs.get(job_id)
             if existing and existing.get("expression") == job_record.cron_expression:
                 continue  # unchanged
-            self._register_job(job_record)
+            self._register_job(job_record, now=now)
 
         logger.debug("CronEngine sync complete: %d active jobs", len(self._jobs))
 
-    def _register_job(self, job_record: Any) -> None:
-        """Register a single ScheduledJob with APScheduler."""
+    def _register_job(self, job_record: Any, now: datetime | None = None) -> None:
+        """Register a single ScheduledJob with APScheduler.
+
+        *now* lets a batch of registrations share one timestamp; it defaults
+        to the current time.
+        """
         job_id = job_record.id
         is_once = job_record.cron_expression.strip() == "@once"
 
@@ -191,7 +196,8 @@ class CronEngine:
                 logger.warning("@once job %s has no next_run_at, skipping", job_id)
                 return
             # Skip if the fire time has already passed
-            now = datetime.now(UTC)
+            if now is None:
+                now = datetime.now(UTC)
             if run_at.tzinfo is None:
                 run_at = run_at.replace(tzinfo=UTC)
             if run_at <= now:
@@ -0,0 +1,71 @@
+"""Intent cache — reuse agent results for trivially rephrased intents.
+
+Intents are normalized (lowercased, punctuation dropped, whitespace
+collapsed) and matched exactly, so "Weather in Paris today?" and "weather
+in paris today" resolve to the same entry without another LLM round-trip.
+Word order and every word still count: "is it warmer in Paris than London"
+and "is it warmer in London than Paris" are different questions and never
+share an answer.  Entries are scoped (typically by agent slug and user) so
+results never leak between agents or users, and expire after a TTL.
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from typing import Any
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def _normalize(text: str) -> str:
+    """Return *text* lowercased, with only its words, single-space separated."""
+    return " ".join(_WORD_RE.findall(text.lower()))
+
+
+class NormalizedIntentCache:
+    """In-process cache keyed by normalized natural-language text."""
+
+    def __init__(self, ttl: float = 600.0, maxsize: int = 256) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        # scope -> {normalized text: (stored_at, value)}, oldest first
+        self._entries: dict[str, dict[str, tuple[float, Any]]] = {}
+
+    def lookup(self, text: str, *, scope: str, ttl: float | None = None) -> Any | None:
+        """Return the value cached for *text* in *scope*, if any."""
+        entries = self._entries.get(scope)
+        if not entries:
+            return None
+        key = _normalize(text)
+        if not key:
+            return None
+        cutoff = time.monotonic() - (self.ttl if ttl is None else ttl)
+        for stale in [k for k, (stored_at, _) in entries.items() if stored_at < cutoff]:
+            del entries[stale]
+        hit = entries.get(key)
+        return hit[1] if hit is not None else None
+
+    def put(self, text: str, value: Any, *, scope: str) -> None:
+        """Store *value* for *text* in *scope*, evicting the oldest entry if full."""
+        key = _normalize(text)
+        if not key:
+            return
+        entries = self._entries.setdefault(scope, {})
+        entries.pop(key, None)
+        if len(entries) >= self.maxsize:
+            del entries[next(iter(entries))]
+        entries[key] = (time.monotonic(), value)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+_cache: NormalizedIntentCache | None = None
+
+
+def get_intent_cache() -> NormalizedIntentCache:
+    global _cache
+    if _cache is None:
+        _cache = NormalizedIntentCache()
+    return _cache
@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import signal
 import time
+from collections.abc import Callable
 
 import structlog
 
@@ -221,9 +222,22 @@ class AngieLoop:
         self._running = False
 
 
+def event_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return uvloop's loop factory when available, else None (stock asyncio).
+
+    uvloop ships with ``uvicorn[standard]`` on Linux/macOS; pass the result
+    as ``asyncio.run(..., loop_factory=...)`` for the long-running daemon.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
 async def run_daemon() -> None:
     loop_obj = AngieLoop()
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
     for sig in (signal.SIGTERM, signal.SIGINT):
         loop.add_signal_handler(sig, lambda s=sig: loop_obj.handle_signal(s))
     await loop_obj.start()
@@ -0,0 +1,44 @@
+"""Request-scoped cache — share identical DB reads within one task run.
+
+A worker calls ``reset_request_cache()`` at the start of each task; until
+the next reset, concurrent and repeated callers asking for the same
+conversation history are coalesced onto a single query (single-flight).
+Outside a request scope every call goes straight to the loader.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+
+History = list[dict[str, str]]
+
+_history: ContextVar[dict[tuple[str, int], asyncio.Future[History]] | None] = ContextVar(
+    "angie_history_cache", default=None
+)
+
+
+def reset_request_cache() -> None:
+    """Start a fresh request scope in the current context."""
+    _history.set({})
+
+
+async def get_history_cached(
+    conversation_id: str,
+    limit: int,
+    loader: Callable[[str, int], Awaitable[History]],
+) -> History:
+    """Return ``loader(conversation_id, limit)``, shared within the request scope."""
+    cache = _history.get()
+    if cache is None:
+        return await loader(conversation_id, limit)
+
+    key = (conversation_id, limit)
+    future = cache.get(key)
+    if future is None:
+        future = asyncio.ensure_future(loader(conversation_id, limit))
+        cache[key] = future
+    # Shield so one cancelled caller doesn't cancel the shared query; copy so
+    # callers can't mutate each other's result.
+    return list(await asyncio.shield(future))
@@ -3,8 +3,14 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
-from typing import Any
+import weakref
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
 
 logger = logging.getLogger(__name__)
 
@@ -92,6 +98,37 @@ def _get_provider_and_model() -> tuple[str, str]:
     return provider, model
 
 
+def _usage_row(
+    *,
+    user_id: str | None,
+    agent_slug: str | None,
+    usage: Any,
+    source: str,
+    task_id: str | None = None,
+    conversation_id: str | None = None,
+) -> dict[str, Any]:
+    """Build the TokenUsage column values for one pydantic-ai ``Usage``."""
+    input_tokens = getattr(usage, "input_tokens", 0) or 0
+    output_tokens = getattr(usage, "output_tokens", 0) or 0
+    provider, model = _get_provider_and_model()
+    return {
+        "user_id": user_id,
+        "agent_slug": agent_slug,
+        "provider": provider,
+        "model": model,
+        "input_tokens": input_tokens,
+        "output_tokens": output_tokens,
+        "total_tokens": getattr(usage, "total_tokens", 0) or 0,
+        "request_count": getattr(usage, "requests", 0) or 0,
+        # pydantic-ai Usage doesn't expose tool_call_count directly
+        "tool_call_count": 0,
+        "estimated_cost_usd": estimate_cost(provider, model, input_tokens, output_tokens),
+        "source": source,
+        "task_id": task_id,
+        "conversation_id": conversation_id,
+    }
+
+
 async def record_usage(
     *,
     user_id: str | None,
@@ -111,59 +148,178 @@ async def record_usage(
         from angie.db.session import get_session_factory
         from angie.models.token_usage import TokenUsage
 
-        input_tokens = getattr(usage, "input_tokens", 0) or 0
-        output_tokens = getattr(usage, "output_tokens", 0) or 0
-        total_tokens = getattr(usage, "total_tokens", 0) or 0
-        request_count = getattr(usage, "requests", 0) or 0
-
-        # pydantic-ai Usage doesn't expose tool_call_count directly
-        tool_call_count = 0
-
-        provider, model = _get_provider_and_model()
-        cost = estimate_cost(provider, model, input_tokens, output_tokens)
+        row = _usage_row(
+            user_id=user_id,
+            agent_slug=agent_slug,
+            usage=usage,
+            source=source,
+            task_id=task_id,
+            conversation_id=conversation_id,
+        )
 
         async with get_session_factory()() as session:
-            record = TokenUsage(
-                user_id=user_id,
-                agent_slug=agent_slug,
-                provider=provider,
-                model=model,
-                input_tokens=input_tokens,
-                output_tokens=output_tokens,
-                total_tokens=total_tokens,
-                request_count=request_count,
-                tool_call_count=tool_call_count,
-                estimated_cost_usd=cost,
-                source=source,
-                task_id=task_id,
-                conversation_id=conversation_id,
-            )
-            session.add(record)
+            session.add(TokenUsage(**row))
             await session.commit()
 
         logger.debug(
             "Recorded token usage: source=%s agent=%s tokens=%d cost=$%.6f",
             source,
             agent_slug,
-            total_tokens,
-            cost,
+            row["total_tokens"],
+            row["estimated_cost_usd"],
         )
     except Exception:
         logger.warning("Failed to record token usage", exc_info=True)
 
 
+async def _write_rows(rows: list[dict[str, Any]]) -> None:
+    """Persist *rows* with a single multi-row INSERT; failures are logged."""
+    try:
+        from sqlalchemy import insert
+
+        from angie.db.session import get_session_factory
+        from angie.models.token_usage import TokenUsage
+
+        async with get_session_factory()() as session:
+            await session.execute(insert(TokenUsage), rows)
+            await session.commit()
+
+        logger.debug("Recorded %d token usage rows", len(rows))
+    except Exception:
+        logger.warning("Failed to record %d token usage rows", len(rows), exc_info=True)
+
+
+class UsageBatcher:
+    """Buffer one event loop's usage rows and write them in batches.
+
+    Rows are flushed ``interval`` seconds after the first one arrives, or as
+    soon as ``batch_size`` are pending, whichever comes first.  Once
+    ``maxsize`` rows are waiting, further rows are written one by one.  A
+    batcher serves a single loop (see :func:`get_usage_batcher`), which must
+    ``flush()`` before it closes; :func:`batched_usage` does that.
+    """
+
+    def __init__(self, batch_size: int = 256, interval: float = 0.1, maxsize: int = 4096) -> None:
+        self.batch_size = batch_size
+        self.interval = interval
+        self.maxsize = maxsize
+        self._rows: list[dict[str, Any]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._writes: set[asyncio.Task[None]] = set()
+
+    def submit(self, row: dict[str, Any]) -> None:
+        """Queue *row* for the next batch; raises RuntimeError without a running loop."""
+        loop = asyncio.get_running_loop()
+        if len(self._rows) >= self.maxsize:
+            self._write([row])
+            return
+        self._rows.append(row)
+        if len(self._rows) >= self.batch_size:
+            self._start_write()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.interval, self._start_write)
+
+    def _start_write(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        rows, self._rows = self._rows, []
+        if rows:
+            self._write(rows)
+
+    def _write(self, rows: list[dict[str, Any]]) -> None:
+        # Tracked, so flush() waits for it
+        task = asyncio.get_running_loop().create_task(_write_rows(rows))
+        self._writes.add(task)
+        task.add_done_callback(self._writes.discard)
+
+    async def flush(self) -> None:
+        """Write every pending row and wait for in-flight batches to finish."""
+        self._start_write()
+        if self._writes:
+            await asyncio.gather(*self._writes)
+
+
+# One batcher per event loop: timers and write tasks can't outlive or move
+# between loops, and a loop in another thread must not touch this one's rows.
+_batchers: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, UsageBatcher] = (
+    weakref.WeakKeyDictionary()
+)
+# Set inside batched_usage(), whose exit guarantees a flush; elsewhere rows
+# are written directly so nothing is left behind when the loop closes.
+_batching: ContextVar[bool] = ContextVar("usage_batching", default=False)
+
+
+def get_usage_batcher() -> UsageBatcher:
+    """Return the running loop's batcher; raises RuntimeError without one."""
+    loop = asyncio.get_running_loop()
+    batcher = _batchers.get(loop)
+    if batcher is None:
+        batcher = _batchers[loop] = UsageBatcher()
+    return batcher
+
+
+async def flush_usage() -> None:
+    """Write the running loop's buffered usage rows."""
+    await get_usage_batcher().flush()
+
+
+@contextlib.asynccontextmanager
+async def batched_usage() -> AsyncIterator[None]:
+    """Batch usage rows recorded inside the block and flush them on exit.
+
+    Wrap a short-lived loop's whole run in it (as the Celery workers do) so
+    every buffered row is written before ``asyncio.run()`` closes the loop.
+    """
+    token = _batching.set(True)
+    try:
+        yield
+    finally:
+        _batching.reset(token)
+        await flush_usage()
+
+
+async def track_usage(**kwargs: Any) -> None:
+    """Record usage, buffering it inside :func:`batched_usage`.
+
+    Outside a batching block the row is written before returning, so
+    callers whose loop ends right after (CLI commands) don't lose it.
+    """
+    if not _batching.get():
+        await record_usage(**kwargs)
+        return
+    try:
+        row = _usage_row(**kwargs)
+    except Exception:
+        logger.warning("Failed to record token usage", exc_info=True)
+        return
+    get_usage_batcher().submit(row)
+
+
 def record_usage_fire_and_forget(**kwargs: Any) -> None:
-    """Schedule record_usage without blocking the caller.
+    """Record usage without blocking the caller.
 
-    Uses asyncio.create_task() when an event loop is running (async context),
-    falls back to asyncio.run() for sync contexts (e.g. Celery workers).
+    Inside :func:`batched_usage` the row goes to the loop's
+    :class:`UsageBatcher`; in any other running loop it is written by a
+    background task.  Without a loop (sync contexts) it falls back to
+    asyncio.run().
     """
     try:
         loop = asyncio.get_running_loop()
-        loop.create_task(record_usage(**kwargs))
     except RuntimeError:
         # No running event loop — run synchronously
         try:
             asyncio.run(record_usage(**kwargs))
         except Exception:
             logger.warning("Failed to record token usage (sync fallback)", exc_info=True)
+        return
+
+    if not _batching.get():
+        loop.create_task(record_usage(**kwargs))
+        return
+    try:
+        row = _usage_row(**kwargs)
+    except Exception:
+        logger.warning("Failed to record token usage", exc_info=True)
+        return
+    get_usage_batcher().submit(row)
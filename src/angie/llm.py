@@ -14,6 +14,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from pydantic_ai.models import Model
+    from pydantic_ai.settings import ModelSettings
 
     from angie.config import Settings
 
@@ -91,6 +92,21 @@ def _build_anthropic(settings: Settings) -> tuple[Model, float]:
     return AnthropicModel(settings.anthropic_model, provider=provider), float("inf")
 
 
+def prompt_cache_settings() -> ModelSettings | None:
+    """Return per-run model settings that enable provider prompt caching.
+
+    Anthropic only caches blocks explicitly marked with ``cache_control``, so
+    the system prompt and tool definitions are flagged as a cacheable prefix.
+    OpenAI-compatible providers cache stable prefixes automatically and need
+    no settings, so ``None`` is returned for them.
+    """
+    from angie.config import get_settings
+
+    if get_settings().llm_provider != "anthropic":
+        return None
+    return {"anthropic_cache_instructions": True, "anthropic_cache_tool_definitions": True}
+
+
 def is_llm_configured() -> bool:
     """Return True if at least one LLM provider is configured."""
     from angie.config import get_settings
@@ -2,7 +2,7 @@
 
 import asyncio
 
-from angie.core.loop import run_daemon
+from angie.core.loop import event_loop_factory, run_daemon
 
 if __name__ == "__main__":
-    asyncio.run(run_daemon())
+    asyncio.run(run_daemon(), loop_factory=event_loop_factory())
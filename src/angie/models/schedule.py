@@ -9,6 +9,7 @@ from sqlalchemy import (
     Boolean,
     DateTime,
     ForeignKey,
+    Index,
     String,
     Text,
     UniqueConstraint,
@@ -21,18 +22,22 @@ from angie.models.base import TimestampMixin, new_uuid
 
 class ScheduledJob(Base, TimestampMixin):
     __tablename__ = "scheduled_jobs"
-    __table_args__ = (UniqueConstraint("user_id", "name", name="uq_scheduled_job_user_name"),)
+    __table_args__ = (
+        UniqueConstraint("user_id", "name", name="uq_scheduled_job_user_name"),
+        Index("ix_scheduled_jobs_due", "is_enabled", "next_run_at"),
+        Index("ix_scheduled_jobs_user_enabled", "user_id", "is_enabled"),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=new_uuid)
     user_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
+        String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[str | None] = mapped_column(Text)
     cron_expression: Mapped[str] = mapped_column(String(50), nullable=False)
     agent_slug: Mapped[str | None] = mapped_column(String(100))
     task_payload: Mapped[dict] = mapped_column(JSON, default=dict)
-    is_enabled: Mapped[bool] = mapped_column(Boolean, default=True, index=True)
+    is_enabled: Mapped[bool] = mapped_column(Boolean, default=True)
     last_run_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     next_run_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     conversation_id: Mapped[str | None] = mapped_column(
@@ -8,6 +8,8 @@ from typing import Any
 
 from celery import shared_task
 
+from angie.core.request_cache import reset_request_cache
+from angie.core.token_usage import batched_usage
 from angie.db.session import reset_engine
 
 logger = logging.getLogger(__name__)
@@ -149,7 +151,13 @@ async def _send_reply(
 async def _run_task(task_dict: dict[str, Any]) -> dict[str, Any]:
     """Run agent, persist results, and deliver reply — all in one event loop."""
     reset_engine()
+    reset_request_cache()
+    # Buffered token usage must be written before asyncio.run() closes the loop.
+    async with batched_usage():
+        return await _run_agent(task_dict)
 
+
+async def _run_agent(task_dict: dict[str, Any]) -> dict[str, Any]:
     task_id = task_dict.get("id")
     source_channel = task_dict.get("source_channel")
     user_id = task_dict.get("user_id")
@@ -333,6 +341,11 @@ def execute_task(self, task_dict: dict[str, Any]) -> dict[str, Any]:
         raise self.retry(exc=exc, countdown=2**self.request.retries) from exc
 
 
+async def _run_workflow(executor: Any, workflow_id: str, task_dict: dict[str, Any]) -> Any:
+    async with batched_usage():
+        return await executor.run(workflow_id, task_dict)
+
+
 @shared_task(bind=True, name="angie.queue.workers.execute_workflow", max_retries=1)
 def execute_workflow(self, workflow_id: str, task_dict: dict[str, Any]) -> dict[str, Any]:
     """Execute a multi-step workflow (D4: loads steps from DB)."""
@@ -341,7 +354,7 @@ def execute_workflow(self, workflow_id: str, task_dict: dict[str, Any]) -> dict[
     logger.info("Executing workflow %s", workflow_id)
     try:
         executor = WorkflowExecutor()
-        result = asyncio.run(executor.run(workflow_id, task_dict))
+        result = asyncio.run(_run_workflow(executor, workflow_id, task_dict))
         return {"status": "success", "result": result, "workflow_id": workflow_id}
     except Exception as exc:
         logger.exception("Workflow %s failed: %s", workflow_id, exc)
@@ -6,3 +6,22 @@ import pytest
 @pytest.fixture
 def anyio_backend():
     return "asyncio"
+
+
+@pytest.fixture(autouse=True)
+def _clear_llm_response_cache():
+    """Keep cached results and buffered usage rows from leaking between tests."""
+    from angie.agents import base
+    from angie.agents.dev import github
+    from angie.core import token_usage
+    from angie.core.intent_cache import get_intent_cache
+
+    base._llm_responses.clear()
+    github._read_cache.clear()
+    get_intent_cache().clear()
+    token_usage._batchers.clear()
+    yield
+    base._llm_responses.clear()
+    github._read_cache.clear()
+    get_intent_cache().clear()
+    token_usage._batchers.clear()
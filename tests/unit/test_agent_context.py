@@ -94,6 +94,33 @@ def test_build_context_prompt_assistant_no_slug(mock_pm, mock_gs):
     assert "[ASSISTANT]: Hello!" in result
 
 
+@patch("angie.config.get_settings")
+@patch("angie.core.prompts.get_prompt_manager")
+def test_build_context_prompt_history_is_stable_prefix(mock_pm, mock_gs):
+    mock_gs.return_value = MagicMock()
+    mock_pm.return_value = MagicMock()
+
+    from angie.agents.base import BaseAgent
+
+    class DummyAgent(BaseAgent):
+        name = "Dummy"
+        slug = "dummy"
+        description = "test"
+
+        async def execute(self, task):
+            return {}
+
+    agent = DummyAgent()
+    first = {"role": "user", "content": "hi  ", "agent_slug": ""}
+    second = {"role": "assistant", "content": "hello", "agent_slug": ""}
+
+    short = agent._build_context_prompt("a", [first])
+    longer = agent._build_context_prompt("b", [first, second])
+
+    assert short == "## Conversation Context\n[USER]: hi\n---\n## Your Task\na"
+    assert longer.startswith("## Conversation Context\n[USER]: hi\n")
+
+
 # ── get_conversation_history tests ────────────────────────────────────────────
 
 
@@ -116,21 +143,19 @@ async def test_get_conversation_history_returns_messages(mock_pm, mock_gs):
 
     agent = DummyAgent()
 
-    # Mock the DB query
-    mock_msg1 = MagicMock()
-    mock_msg1.role.value = "user"
-    mock_msg1.content = "hello"
-    mock_msg1.agent_slug = None
-
-    mock_msg2 = MagicMock()
-    mock_msg2.role.value = "assistant"
-    mock_msg2.content = "world"
-    mock_msg2.agent_slug = "weather"
+    # Mock the DB query, which returns (role, content, agent_slug) rows
+    user_role = MagicMock()
+    user_role.value = "user"
+    assistant_role = MagicMock()
+    assistant_role.value = "assistant"
 
     # The query now uses DESC order so the DB returns newest-first.
-    # Simulate that here: mock_msg2 (assistant, newer) comes before mock_msg1 (user, older).
+    # Simulate that here: the assistant row (newer) comes before the user row (older).
     mock_result = MagicMock()
-    mock_result.scalars.return_value.all.return_value = [mock_msg2, mock_msg1]
+    mock_result.all.return_value = [
+        (assistant_role, "world", "weather"),
+        (user_role, "hello", None),
+    ]
 
     mock_session = AsyncMock()
     mock_session.execute = AsyncMock(return_value=mock_result)
@@ -172,3 +197,30 @@ async def test_get_conversation_history_db_error_returns_empty(mock_pm, mock_gs)
         history = await agent.get_conversation_history("conv-123")
 
     assert history == []
+
+
+@pytest.mark.asyncio
+@patch("angie.config.get_settings")
+@patch("angie.core.prompts.get_prompt_manager")
+async def test_get_conversation_history_without_conversation_skips_db(mock_pm, mock_gs):
+    mock_gs.return_value = MagicMock()
+    mock_pm.return_value = MagicMock()
+
+    from angie.agents.base import BaseAgent
+
+    class DummyAgent(BaseAgent):
+        name = "Dummy"
+        slug = "dummy"
+        description = "test"
+
+        async def execute(self, task):
+            return {}
+
+    agent = DummyAgent()
+
+    with patch("angie.db.session.get_session_factory") as mock_factory:
+        assert await agent.get_conversation_history(None) == []
+        assert await agent.get_conversation_history("") == []
+        assert await agent.get_conversation_history("conv-123", limit=0) == []
+
+    mock_factory.assert_not_called()
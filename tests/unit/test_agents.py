@@ -50,6 +50,62 @@ def test_registry_resolve_by_capability():
     assert agent.slug == "mock"
 
 
+def test_registry_candidates_use_keyword_index():
+    class OtherAgent(MockAgent):
+        slug = "other"
+        capabilities = ["weather"]
+
+    class CustomAgent(MockAgent):
+        slug = "custom"
+
+        def confidence(self, task):
+            return 0.9
+
+    registry = AgentRegistry()
+    registry.register(MockAgent())
+    registry.register(OtherAgent())
+    registry.register(CustomAgent())
+
+    task = {"title": "run a mock test", "input_data": {}}
+    candidates, matched = registry._candidates(task)
+    assert [a.slug for a in candidates] == ["mock", "custom"]
+    assert matched == {"mock", "test"}
+    assert "_cap_matches" not in task
+    assert registry._score(candidates[0], task, matched) == MockAgent().confidence(task)
+    assert registry._score(candidates[1], task, matched) == 0.9
+
+    by_slug, matched = registry._candidates({"agent_slug": "other", "input_data": {}})
+    assert [a.slug for a in by_slug] == ["other", "custom"]
+    assert matched is None
+
+
+async def test_registry_llm_route_reuses_router():
+    class OtherAgent(MockAgent):
+        slug = "other"
+        capabilities = ["weather"]
+
+    registry = AgentRegistry()
+    registry.register(MockAgent())
+
+    mock_result = MagicMock()
+    mock_result.output = " Mock\n"
+    with (
+        patch("angie.llm.is_llm_configured", return_value=True),
+        patch("angie.llm.get_llm_model", return_value=MagicMock()),
+        patch("pydantic_ai.Agent") as mock_agent_cls,
+        patch("angie.core.token_usage.record_usage_fire_and_forget"),
+    ):
+        mock_agent_cls.return_value.run = AsyncMock(return_value=mock_result)
+        task = {"title": "something vague", "input_data": {}}
+        assert (await registry._llm_route(task)).slug == "mock"
+        registry.register(OtherAgent())
+        assert (await registry._llm_route(task)).slug == "mock"
+
+    mock_agent_cls.assert_called_once()
+    prompt = mock_agent_cls.return_value.run.call_args[0][0]
+    assert "- other: " in prompt
+
+
 def test_registry_resolve_no_match():
     registry = AgentRegistry()
     registry.register(MockAgent())
@@ -48,12 +48,28 @@ def test_base_agent_can_handle_by_capability():
     assert agent_obj.can_handle({"title": "do something else"}) is False
 
 
+def test_base_agent_can_handle_escapes_capability_keywords():
+    class PlusAgent(DummyAgent):
+        capabilities: ClassVar[list[str]] = ["C++", "a.b"]
+
+    agent_obj = PlusAgent()
+    assert agent_obj.can_handle({"title": "Review my c++ code"}) is True
+    assert agent_obj.can_handle({"title": "axb"}) is False
+    assert agent_obj.can_handle({}) is False
+
+
 def test_base_agent_repr():
     agent_obj = DummyAgent()
     assert "DummyAgent" in repr(agent_obj)
     assert "dummy" in repr(agent_obj)
 
 
+def test_base_agent_logger_bound_per_subclass():
+    first, second = DummyAgent(), DummyAgent()
+    assert first.logger is second.logger
+    assert first.logger.name == "angie.agents.dummy"
+
+
 def test_base_agent_get_system_prompt():
     agent_obj = DummyAgent()
     mock_pm = MagicMock()
@@ -66,6 +82,20 @@ def test_base_agent_get_system_prompt():
     mock_pm.compose_for_agent.assert_called_once_with("dummy", agent_instructions="")
 
 
+def test_base_agent_get_system_prompt_memoized_until_invalidated():
+    agent_obj = DummyAgent()
+    mock_pm = MagicMock()
+    mock_pm.compose_for_agent.side_effect = ["first", "second"]
+
+    with patch.object(agent_obj, "prompt_manager", mock_pm):
+        assert agent_obj.get_system_prompt() == "first"
+        assert agent_obj.system_prompt == "first"
+        agent_obj.invalidate_system_prompt()
+        assert agent_obj.get_system_prompt() == "second"
+
+    assert mock_pm.compose_for_agent.call_count == 2
+
+
 @pytest.mark.asyncio
 async def test_base_agent_ask_llm():
     agent_obj = DummyAgent()
@@ -106,6 +136,169 @@ async def test_base_agent_ask_llm_with_auto_system_prompt():
     assert response == "response"
 
 
+@pytest.mark.asyncio
+async def test_base_agent_ask_llm_reuses_agent_per_system_prompt():
+    DummyAgent._llm_agents.clear()
+    agent_obj = DummyAgent()
+
+    mock_result = MagicMock()
+    mock_result.output = "ok"
+    mock_ai_agent = AsyncMock()
+    mock_ai_agent.run.return_value = mock_result
+
+    with (
+        patch("angie.llm.get_llm_model", return_value=MagicMock()),
+        patch("pydantic_ai.Agent", return_value=mock_ai_agent) as mock_cls,
+    ):
+        await agent_obj.ask_llm("one", system="reuse me")
+        await DummyAgent().ask_llm("two", system="reuse me")
+        await agent_obj.ask_llm("three", system="something else")
+
+    assert mock_cls.call_count == 2
+    assert mock_ai_agent.run.await_count == 3
+    DummyAgent._llm_agents.clear()
+
+
+@pytest.mark.asyncio
+async def test_base_agent_ask_llm_passes_prompt_cache_settings():
+    DummyAgent._llm_agents.clear()
+    agent_obj = DummyAgent()
+
+    mock_result = MagicMock()
+    mock_result.output = "ok"
+    mock_ai_agent = AsyncMock()
+    mock_ai_agent.run.return_value = mock_result
+    cache_settings = {"anthropic_cache_instructions": True}
+
+    with (
+        patch("angie.llm.get_llm_model", return_value=MagicMock()),
+        patch("angie.llm.prompt_cache_settings", return_value=cache_settings),
+        patch("pydantic_ai.Agent", return_value=mock_ai_agent),
+    ):
+        await agent_obj.ask_llm("Hello", system="cached")
+        with patch.object(DummyAgent, "use_prompt_caching", False):
+            await agent_obj.ask_llm("Hello again", system="cached")
+
+    first, second = mock_ai_agent.run.call_args_list
+    assert first.kwargs["model_settings"] == cache_settings
+    assert "model_settings" not in second.kwargs
+    DummyAgent._llm_agents.clear()
+
+
+@pytest.mark.asyncio
+async def test_base_agent_ask_llm_caches_responses():
+    from angie.agents.base import CachingConfig
+
+    DummyAgent._llm_agents.clear()
+    agent_obj = DummyAgent()
+
+    mock_result = MagicMock()
+    mock_result.output = "cached answer"
+    mock_ai_agent = AsyncMock()
+    mock_ai_agent.run.return_value = mock_result
+
+    with (
+        patch("angie.llm.get_llm_model", return_value=MagicMock(model_name="m1")),
+        patch("pydantic_ai.Agent", return_value=mock_ai_agent),
+    ):
+        # Off by default: agents opt in when their prompts are pure
+        await agent_obj.ask_llm("Same", system="sys")
+        assert mock_ai_agent.run.await_count == 1
+
+        with patch.object(DummyAgent, "response_cache", CachingConfig()):
+            assert await agent_obj.ask_llm("Same", system="sys") == "cached answer"
+            assert await agent_obj.ask_llm("Same", system="sys") == "cached answer"
+            # Personalized calls always reach the model
+            await agent_obj.ask_llm("Same", system="sys", user_id="u1")
+        assert mock_ai_agent.run.await_count == 3
+
+    DummyAgent._llm_agents.clear()
+
+
+@pytest.mark.asyncio
+async def test_base_agent_ask_llm_coalesces_concurrent_duplicates():
+    import asyncio
+
+    from angie.agents.base import CachingConfig
+
+    DummyAgent._llm_agents.clear()
+    agent_obj = DummyAgent()
+    release = asyncio.Event()
+
+    async def slow_run(prompt, **kwargs):
+        await release.wait()
+        return MagicMock(output=f"answer:{prompt}")
+
+    mock_ai_agent = AsyncMock()
+    mock_ai_agent.run.side_effect = slow_run
+
+    with (
+        patch("angie.llm.get_llm_model", return_value=MagicMock(model_name="m1")),
+        patch("pydantic_ai.Agent", return_value=mock_ai_agent),
+        patch.object(DummyAgent, "response_cache", CachingConfig()),
+    ):
+        pending = [asyncio.ensure_future(agent_obj.ask_llm("Same", system="sys")) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*pending)
+
+    assert results == ["answer:Same"] * 3
+    assert mock_ai_agent.run.await_count == 1
+    DummyAgent._llm_agents.clear()
+
+
+@pytest.mark.asyncio
+async def test_base_agent_ask_llm_waiters_survive_cancelled_leader():
+    import asyncio
+
+    from angie.agents.base import CachingConfig
+
+    DummyAgent._llm_agents.clear()
+    agent_obj = DummyAgent()
+    release = asyncio.Event()
+
+    async def slow_run(prompt, **kwargs):
+        await release.wait()
+        return MagicMock(output=f"answer:{prompt}")
+
+    mock_ai_agent = AsyncMock()
+    mock_ai_agent.run.side_effect = slow_run
+
+    with (
+        patch("angie.llm.get_llm_model", return_value=MagicMock(model_name="m1")),
+        patch("pydantic_ai.Agent", return_value=mock_ai_agent),
+        patch.object(DummyAgent, "response_cache", CachingConfig()),
+    ):
+        leader = asyncio.ensure_future(agent_obj.ask_llm("Same", system="sys"))
+        await asyncio.sleep(0)
+        waiters = [asyncio.ensure_future(agent_obj.ask_llm("Same", system="sys")) for _ in range(2)]
+        await asyncio.sleep(0)
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*waiters)
+
+    assert leader.cancelled()
+    assert results == ["answer:Same"] * 2
+    # The waiters coalesce again behind one new call
+    assert mock_ai_agent.run.await_count == 2
+    DummyAgent._llm_agents.clear()
+
+
+@pytest.mark.asyncio
+async def test_base_agent_ask_llm_batch_preserves_order():
+    agent_obj = DummyAgent()
+
+    async def fake_ask(prompt, system=None, user_id=None):
+        return f"{system}:{prompt}"
+
+    with patch.object(agent_obj, "ask_llm", side_effect=fake_ask) as mock_ask:
+        results = await agent_obj.ask_llm_batch(["a", "b", "c"], system="sys", max_concurrency=2)
+
+    assert results == ["sys:a", "sys:b", "sys:c"]
+    assert mock_ask.call_count == 3
+
+
 @pytest.mark.asyncio
 async def test_base_agent_ask_llm_raises():
     agent_obj = DummyAgent()
@@ -121,6 +314,29 @@ async def test_base_agent_ask_llm_raises():
             await agent_obj.ask_llm("Hello", system="sys")
 
 
+@pytest.mark.asyncio
+async def test_base_agent_credentials_and_history():
+    agent_obj = DummyAgent()
+    history = [{"role": "user", "content": "hi", "agent_slug": ""}]
+
+    with (
+        patch.object(agent_obj, "get_credentials", AsyncMock(return_value={"token": "t"})),
+        patch.object(
+            agent_obj, "get_conversation_history", AsyncMock(return_value=history)
+        ) as mock_history,
+    ):
+        assert await agent_obj._credentials_and_history("u1", "github", "c1") == (
+            {"token": "t"},
+            history,
+        )
+        assert await agent_obj._credentials_and_history("u1", "github", None) == (
+            {"token": "t"},
+            [],
+        )
+
+    mock_history.assert_awaited_once_with("c1")
+
+
 @pytest.mark.asyncio
 async def test_base_agent_execute():
     agent_obj = DummyAgent()
@@ -37,6 +37,18 @@ async def test_github_import_error():
     assert result.get("error") == "PyGithub not installed"
 
 
+@pytest.mark.asyncio
+async def test_software_dev_import_error():
+    from angie.agents.dev.software_dev import SoftwareDeveloperAgent
+
+    with patch(
+        "angie.agents.dev.software_dev._github_module", side_effect=ImportError("no github")
+    ):
+        result = await SoftwareDeveloperAgent().execute(_task("fix"))
+
+    assert result.get("error") == "PyGithub not installed"
+
+
 # ── Registry module load exception ────────────────────────────────────────────
 
 
@@ -168,7 +168,7 @@ def test_email_check_inbox_with_imaplib_error():
     ch._poll_task = None
 
     with patch("imaplib.IMAP4_SSL", side_effect=OSError("connection refused")):
-        ch._check_inbox()  # Should not raise
+        ch._check_inbox(MagicMock())  # Should not raise
 
 
 def test_email_extract_body_multipart():
@@ -358,17 +358,14 @@ async def test_email_poll_inbox():
         sleep_calls.append(n)
         raise _asyncio.CancelledError()
 
-    async def fake_run_in_executor(executor, fn):
-        raise RuntimeError("imap fail")
-
     with (
         patch("angie.channels.email.asyncio.sleep", side_effect=fake_sleep),
-        patch("asyncio.get_event_loop") as mock_loop,
+        patch(
+            "angie.channels.email.asyncio.to_thread",
+            new_callable=AsyncMock,
+            side_effect=RuntimeError("imap fail"),
+        ),
     ):
-        mock_loop_obj = MagicMock()
-        mock_loop_obj.run_in_executor = AsyncMock(side_effect=RuntimeError("fail"))
-        mock_loop.return_value = mock_loop_obj
-
         try:
             await ch._poll_inbox()
         except _asyncio.CancelledError:
@@ -401,11 +398,12 @@ def test_email_check_inbox_imaplib():
 
     with (
         patch("angie.channels.email.imaplib.IMAP4_SSL", return_value=mock_conn),
-        patch("asyncio.get_event_loop", return_value=mock_loop),
         patch.object(ch, "_dispatch_event", new_callable=AsyncMock),
     ):
-        ch._check_inbox()
+        ch._check_inbox(mock_loop)
 
+    # The event is handed to the caller's loop, not looked up from the thread
+    mock_loop.call_soon_threadsafe.assert_called_once()
     mock_conn.login.assert_called_once()
     mock_conn.logout.assert_called_once()
 
@@ -423,7 +421,7 @@ def test_email_check_inbox_exception():
 
     with patch("angie.channels.email.imaplib.IMAP4_SSL", side_effect=OSError("connection refused")):
         # Should not raise — exception is caught and logged
-        ch._check_inbox()
+        ch._check_inbox(MagicMock())
 
 
 # ── Slack _listen method ────────────────────────────────────────────────────────
@@ -740,7 +738,7 @@ def test_email_check_inbox_null_raw():
     mock_conn.fetch.return_value = ("OK", [(b"1", None)])
 
     with patch("angie.channels.email.imaplib.IMAP4_SSL", return_value=mock_conn):
-        ch._check_inbox()
+        ch._check_inbox(MagicMock())
 
     # Should complete without dispatching any events
     mock_conn.logout.assert_called_once()
@@ -1,7 +1,7 @@
 """Tests for angie.core.cron (CronEngine)."""
 
 from datetime import UTC, datetime, timedelta
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -180,7 +180,7 @@ async def test_sync_from_db_adds_new_jobs():
         with patch("angie.db.session.get_session_factory", return_value=mock_factory):
             await engine.sync_from_db()
 
-        engine._register_job.assert_called_once_with(mock_job_record)
+        engine._register_job.assert_called_once_with(mock_job_record, now=ANY)
 
 
 @pytest.mark.asyncio
@@ -272,7 +272,7 @@ async def test_sync_from_db_updates_changed_jobs():
         with patch("angie.db.session.get_session_factory", return_value=mock_factory):
             await engine.sync_from_db()
 
-        engine._register_job.assert_called_once_with(mock_job_record)
+        engine._register_job.assert_called_once_with(mock_job_record, now=ANY)
 
 
 # ------------------------------------------------------------------
@@ -452,3 +452,27 @@ async def test_register_job_conversation_id_in_event():
         event = mock_router.dispatch.call_args[0][0]
         assert event.payload["conversation_id"] == "conv-1"
         assert event.source_channel == "cron"
+
+
+def test_register_job_once_uses_given_clock():
+    """A passed-in ``now`` decides whether an @once job is already due."""
+    from angie.core.cron import CronEngine
+
+    run_at = datetime(2030, 1, 1, 12, tzinfo=UTC)
+    mock_job_record = MagicMock()
+    mock_job_record.id = "once-2"
+    mock_job_record.cron_expression = "@once"
+    mock_job_record.next_run_at = run_at
+
+    with (
+        patch("angie.core.cron.AsyncIOScheduler") as mock_sched_cls,
+        patch.object(CronEngine, "_disable_once_job", new_callable=MagicMock) as disable,
+        patch("asyncio.create_task"),
+    ):
+        mock_sched = MagicMock()
+        mock_sched_cls.return_value = mock_sched
+        engine = CronEngine()
+        engine._register_job(mock_job_record, now=run_at + timedelta(seconds=1))
+
+    disable.assert_called_once_with("once-2")
+    mock_sched.add_job.assert_not_called()
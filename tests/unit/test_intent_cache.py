@@ -0,0 +1,55 @@
+"""Tests for angie.core.intent_cache."""
+
+from unittest.mock import patch
+
+from angie.core.intent_cache import NormalizedIntentCache
+
+
+def test_lookup_ignores_case_punctuation_and_spacing():
+    cache = NormalizedIntentCache()
+    cache.put("Weather in Paris today?", {"summary": "sunny"}, scope="weather:u1")
+
+    assert cache.lookup("weather  in paris, today", scope="weather:u1") == {"summary": "sunny"}
+    assert cache.lookup("weather in London today", scope="weather:u1") is None
+
+
+def test_lookup_respects_word_order_and_negation():
+    cache = NormalizedIntentCache()
+    cache.put("is it warmer in Paris than London", "Paris", scope="s")
+    cache.put("will it rain today", "yes", scope="s")
+
+    assert cache.lookup("is it warmer in London than Paris", scope="s") is None
+    assert cache.lookup("will it not rain today", scope="s") is None
+
+
+def test_lookup_is_scoped():
+    cache = NormalizedIntentCache()
+    cache.put("weather in Paris", "sunny", scope="weather:u1")
+
+    assert cache.lookup("weather in Paris", scope="weather:u2") is None
+    assert cache.lookup("weather in Paris", scope="github:u1") is None
+
+
+def test_lookup_expires_entries():
+    cache = NormalizedIntentCache(ttl=60.0)
+    with patch("angie.core.intent_cache.time.monotonic", return_value=100.0):
+        cache.put("weather in Paris", "sunny", scope="s")
+    with patch("angie.core.intent_cache.time.monotonic", return_value=200.0):
+        assert cache.lookup("weather in Paris", scope="s") is None
+        assert cache._entries["s"] == {}
+
+
+def test_put_evicts_oldest_when_full():
+    cache = NormalizedIntentCache(maxsize=2)
+    cache.put("first entry", 1, scope="s")
+    cache.put("second entry", 2, scope="s")
+    cache.put("third entry", 3, scope="s")
+
+    assert cache.lookup("first entry", scope="s") is None
+    assert cache.lookup("third entry", scope="s") == 3
+
+
+def test_empty_text_is_ignored():
+    cache = NormalizedIntentCache()
+    cache.put("???", "x", scope="s")
+    assert cache.lookup("???", scope="s") is None
@@ -219,3 +219,17 @@ def test_is_llm_configured_anthropic_no_key():
     mock_settings = _mock_settings(llm_provider="anthropic")
     with patch("angie.config.get_settings", return_value=mock_settings):
         assert llm_mod.is_llm_configured() is False
+
+
+def test_prompt_cache_settings_anthropic_only():
+    import angie.llm as llm_mod
+
+    with patch("angie.config.get_settings", return_value=_mock_settings(llm_provider="anthropic")):
+        settings = llm_mod.prompt_cache_settings()
+    assert settings == {
+        "anthropic_cache_instructions": True,
+        "anthropic_cache_tool_definitions": True,
+    }
+
+    with patch("angie.config.get_settings", return_value=_mock_settings(llm_provider="openai")):
+        assert llm_mod.prompt_cache_settings() is None
@@ -102,6 +102,17 @@ async def test_loop_shutdown_with_channel_manager():
     mock_channel_manager.stop_all.assert_called_once()
 
 
+def test_event_loop_factory_prefers_uvloop():
+    from angie.core.loop import event_loop_factory
+
+    fake_uvloop = MagicMock()
+    with patch.dict("sys.modules", {"uvloop": fake_uvloop}):
+        assert event_loop_factory() is fake_uvloop.new_event_loop
+
+    with patch.dict("sys.modules", {"uvloop": None}):
+        assert event_loop_factory() is None
+
+
 def test_loop_handle_signal():
     from angie.core.loop import AngieLoop
 
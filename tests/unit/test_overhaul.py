@@ -408,6 +408,17 @@ def test_confidence_no_match():
     assert score == 0.0
 
 
+def test_confidence_leaves_task_untouched():
+    """confidence() scores the current task text without storing anything on it."""
+    agent = MockAgent()
+    task = {"title": "Run a MOCK Test", "input_data": {"text": "Please"}}
+    assert agent.confidence(task) > 0.0
+    assert task == {"title": "Run a MOCK Test", "input_data": {"text": "Please"}}
+
+    task["title"] = "unrelated"
+    assert agent.confidence(task) == 0.0
+
+
 def test_confidence_no_capabilities():
     """confidence() returns 0.0 for agent with no capabilities."""
 
@@ -475,6 +486,7 @@ async def test_run_task_no_agent_graceful():
         patch("angie.queue.workers._send_reply", new_callable=AsyncMock) as mock_reply,
         patch("angie.queue.workers._update_task_in_db", new_callable=AsyncMock),
         patch("angie.queue.workers.reset_engine"),
+        patch("angie.core.token_usage.flush_usage", new_callable=AsyncMock) as mock_flush,
     ):
         result = await _run_task(
             {
@@ -489,6 +501,7 @@ async def test_run_task_no_agent_graceful():
     assert result["status"] == "no_agent"
     assert "couldn't find a suitable agent" in result["error"].lower()
     mock_reply.assert_called_once()
+    mock_flush.assert_awaited_once()
 
 
 # ── Phase 3: BaseAgent Autonomous Methods ────────────────────────────────────
@@ -530,6 +543,33 @@ async def test_schedule_followup():
     mock_session.commit.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_schedule_followups_single_commit():
+    """schedule_followups writes every job in one session and one commit."""
+    agent = MockAgent()
+
+    mock_session = AsyncMock()
+    mock_session.__aenter__ = AsyncMock(return_value=mock_session)
+    mock_session.__aexit__ = AsyncMock(return_value=False)
+    mock_session.add = MagicMock()
+    mock_session.commit = AsyncMock()
+
+    mock_factory = MagicMock(return_value=mock_session)
+
+    with patch("angie.db.session.get_session_factory", return_value=mock_factory):
+        job_ids = await agent.schedule_followups(
+            [
+                {"user_id": "u1", "delay_seconds": 60, "title": "a", "intent": "x"},
+                {"user_id": "u1", "delay_seconds": 120, "title": "b", "intent": "y"},
+            ]
+        )
+
+    assert job_ids is not None and len(set(job_ids)) == 2
+    assert mock_session.add.call_count == 2
+    mock_factory.assert_called_once()
+    mock_session.commit.assert_called_once()
+
+
 # ── Phase 2.2: GitHub Agent Tools ────────────────────────────────────────────
 
 
@@ -599,6 +639,512 @@ def test_github_agent_has_new_tools():
     assert expected_tools.issubset(tool_names), f"Missing tools: {expected_tools - tool_names}"
 
 
+@pytest.mark.asyncio
+async def test_github_agent_tools_run_on_dedicated_pool():
+    """Blocking PyGithub tool calls run on the GitHub thread pool."""
+    import threading
+
+    from angie.agents.dev.github import GitHubAgent
+
+    tool = GitHubAgent().build_pydantic_agent()._function_toolset.tools["search_issues"]
+    thread_names = []
+
+    def search_issues(query):
+        thread_names.append(threading.current_thread().name)
+        return MagicMock(get_page=MagicMock(return_value=[]))
+
+    g = MagicMock()
+    g.search_issues.side_effect = search_issues
+
+    assert await tool.function(MagicMock(deps=g), "o/r", "bug") == []
+    assert thread_names[0].startswith("github")
+
+
+def test_github_tool_pool_sized_by_settings():
+    from angie.agents.dev import github
+
+    with (
+        patch.object(github, "_github_executor", None),
+        patch.object(github, "get_settings", return_value=MagicMock(github_pool_size=4)),
+    ):
+        pool = github._tool_executor()
+        assert pool._max_workers == 4
+        assert github._tool_executor() is pool
+    pool.shutdown()
+
+
+def test_github_client_reused_per_token():
+    """_github_client builds one PyGithub client per token."""
+    from angie.agents.dev.github import _github_client
+
+    _github_client.cache_clear()
+    mock_gh = MagicMock()
+    mock_gh.Github.side_effect = lambda *args, **kwargs: MagicMock()
+    with patch("angie.agents.dev.github._github_module", return_value=mock_gh):
+        first = _github_client("tok-a")
+        assert _github_client("tok-a") is first
+        assert _github_client("tok-b") is not first
+    _github_client.cache_clear()
+
+    assert mock_gh.Github.call_count == 2
+    mock_gh.Github.assert_called_with("tok-b", lazy=True, per_page=20, pool_size=40)
+
+
+def test_github_client_skips_repo_fetch():
+    """Tools that only act under a repo don't GET the repository first."""
+    from angie.agents.dev.github import _github_client
+
+    _github_client.cache_clear()
+    g = _github_client("tok")
+    _github_client.cache_clear()
+
+    with patch.object(
+        g._Github__requester, "requestJsonAndCheck", side_effect=AssertionError("fetched")
+    ):
+        issues = g.get_repo("owner/repo", lazy=True).get_issues(state="open")
+
+    assert issues._PaginatedList__firstUrl.endswith("/repos/owner/repo/issues")
+
+
+def test_github_conditional_requests_replay_304():
+    """A repeated GET revalidates with If-None-Match and replays the body on 304."""
+    from angie.agents.dev.github import _ConditionalRequests
+
+    request_json = MagicMock(
+        side_effect=[
+            (200, {"etag": '"abc"'}, '{"name": "repo"}'),
+            (304, {"etag": '"abc"'}, ""),
+        ]
+    )
+    conditional = _ConditionalRequests(request_json)
+
+    first = conditional("GET", "/repos/o/r", None, {"Accept": "application/json"}, None)
+    second = conditional("GET", "/repos/o/r", None, {"Accept": "application/json"}, None)
+
+    assert first == second == (200, {"etag": '"abc"'}, '{"name": "repo"}')
+    assert request_json.call_args_list[1][0][3] == {
+        "Accept": "application/json",
+        "If-None-Match": '"abc"',
+    }
+
+
+def test_github_conditional_requests_skip_writes():
+    from angie.agents.dev.github import _ConditionalRequests
+
+    request_json = MagicMock(return_value=(201, {"etag": '"x"'}, "{}"))
+    conditional = _ConditionalRequests(request_json)
+
+    conditional("POST", "/repos/o/r/issues", None, None, {"title": "t"})
+    conditional("GET", "/repos/o/r", {"page": 2}, None, None)
+
+    assert conditional._entries == {}
+    request_json.assert_called_with("GET", "/repos/o/r", {"page": 2}, None, None)
+
+
+async def test_github_list_pr_checks_fetches_status_concurrently():
+    """list_pr_checks overlaps the combined-status request with the check runs."""
+    import threading
+
+    from angie.agents.dev.github import GitHubAgent
+
+    tool = GitHubAgent().build_pydantic_agent()._function_toolset.tools["list_pr_checks"]
+
+    status_started = threading.Event()
+    run = MagicMock(status="completed", conclusion="success", html_url="https://x")
+    run.name = "ci"
+    commit = MagicMock()
+
+    def get_check_runs():
+        # Only returns once the status fetch is already in flight
+        assert status_started.wait(timeout=5)
+        return [run]
+
+    def get_combined_status():
+        status_started.set()
+        return MagicMock(state="success")
+
+    commit.get_check_runs.side_effect = get_check_runs
+    commit.get_combined_status.side_effect = get_combined_status
+    g = MagicMock()
+    g.requester.auth = None
+    g.get_repo.return_value.get_commit.return_value = commit
+
+    result = await tool.function(MagicMock(deps=g), "owner/repo", 7)
+
+    assert result["overall_state"] == "success"
+    assert result["checks"] == [
+        {"name": "ci", "status": "completed", "conclusion": "success", "url": "https://x"}
+    ]
+
+
+async def test_github_list_pr_checks_graphql():
+    """With a token, list_pr_checks answers from one GraphQL query."""
+    from angie.agents.dev.github import GitHubAgent
+
+    tool = GitHubAgent().build_pydantic_agent()._function_toolset.tools["list_pr_checks"]
+    rollup = {
+        "state": "FAILURE",
+        "contexts": {
+            "nodes": [
+                {
+                    "__typename": "CheckRun",
+                    "name": "tests",
+                    "status": "COMPLETED",
+                    "conclusion": "FAILURE",
+                    "url": "https://github.com/o/r/runs/1",
+                },
+                {
+                    "__typename": "StatusContext",
+                    "context": "ci/legacy",
+                    "state": "SUCCESS",
+                    "targetUrl": "https://ci.example/1",
+                },
+            ]
+        },
+    }
+    data = {
+        "data": {
+            "repository": {
+                "pullRequest": {"commits": {"nodes": [{"commit": {"statusCheckRollup": rollup}}]}}
+            }
+        }
+    }
+    g = MagicMock()
+    g.requester.graphql_query.return_value = ({}, data)
+
+    result = await tool.function(MagicMock(deps=g), "o/r", 3)
+
+    assert g.requester.graphql_query.call_args[0][1] == {"owner": "o", "name": "r", "number": 3}
+    g.get_repo.assert_not_called()
+    assert result == {
+        "pr_number": 3,
+        "overall_state": "failure",
+        "checks": [
+            {
+                "name": "tests",
+                "status": "completed",
+                "conclusion": "failure",
+                "url": "https://github.com/o/r/runs/1",
+            },
+            {
+                "name": "ci/legacy",
+                "status": "completed",
+                "conclusion": "success",
+                "url": "https://ci.example/1",
+            },
+        ],
+    }
+
+
+async def test_github_merge_pull_request_unknown_mergeability():
+    """A PR whose mergeability is still being computed goes straight to merge."""
+    from angie.agents.dev.github import GitHubAgent
+
+    tool = GitHubAgent().build_pydantic_agent()._function_toolset.tools["merge_pull_request"]
+    g = MagicMock()
+    pr = g.get_repo.return_value.get_pull.return_value
+    pr.merged = False
+    pr.mergeable = None
+    pr.merge.return_value = MagicMock(merged=True, message="Merged", sha="abc")
+
+    result = await tool.function(MagicMock(deps=g), "o/r", 4, "squash")
+
+    pr.merge.assert_called_once_with(merge_method="squash")
+    assert result == {"merged": True, "message": "Merged", "sha": "abc", "pr_number": 4}
+
+    pr.mergeable = False
+    result = await tool.function(MagicMock(deps=g), "o/r", 4)
+    assert "merge conflicts" in result["error"]
+    pr.merge.assert_called_once()
+
+
+_SAMPLE_DIFF = """diff --git a/src/app.py b/src/app.py
+index 1111111..2222222 100644
+--- a/src/app.py
++++ b/src/app.py
+@@ -1,2 +1,2 @@
+ keep
+-old
++new
+diff --git a/gone.txt b/gone.txt
+deleted file mode 100644
+index 3333333..0000000
+--- a/gone.txt
++++ /dev/null
+@@ -1 +0,0 @@
+-bye
+"""
+
+
+async def test_github_get_pr_diff_single_request():
+    """get_pr_diff fetches the unified diff once and splits it per file."""
+    from angie.agents.dev.github import GitHubAgent
+
+    tool = GitHubAgent().build_pydantic_agent()._function_toolset.tools["get_pr_diff"]
+    g = MagicMock()
+    g.requester.requestJsonAndCheck.return_value = ({}, {"data": _SAMPLE_DIFF})
+
+    result = await tool.function(MagicMock(deps=g), "o/r", 9)
+
+    g.requester.requestJsonAndCheck.assert_called_once_with(
+        "GET", "/repos/o/r/pulls/9", headers={"Accept": "application/vnd.github.diff"}
+    )
+    g.get_repo.return_value.get_pull.assert_not_called()
+    assert result["files_changed"] == 2
+    assert (result["additions"], result["deletions"]) == (1, 2)
+    assert result["files"][0] == {
+        "filename": "src/app.py",
+        "status": "modified",
+        "additions": 1,
+        "deletions": 1,
+        "changes": 2,
+        "patch": "@@ -1,2 +1,2 @@\n keep\n-old\n+new",
+    }
+    assert result["files"][1]["filename"] == "gone.txt"
+    assert result["files"][1]["status"] == "removed"
+
+
+def test_github_parse_unified_diff_truncates_patch():
+    from angie.agents.dev.github import _PATCH_LIMIT, _parse_unified_diff
+
+    added = "\n".join(f"+line {i}" for i in range(1000))
+    diff = f"diff --git a/big.txt b/big.txt\n@@ -0,0 +1,1000 @@\n{added}\n"
+
+    [entry] = _parse_unified_diff(diff)
+
+    assert entry["additions"] == 1000
+    assert len(entry["patch"]) == _PATCH_LIMIT
+
+
+async def test_github_get_pr_diff_too_large_falls_back_to_files():
+    import github as gh_module
+
+    from angie.agents.dev.github import GitHubAgent
+
+    tool = GitHubAgent().build_pydantic_agent()._function_toolset.tools["get_pr_diff"]
+    g = MagicMock()
+    g.requester.requestJsonAndCheck.side_effect = gh_module.GithubException(
+        406, {"message": "diff too large"}, {}
+    )
+    pr = g.get_repo.return_value.get_pull.return_value
+    pr.get_files.return_value = [
+        MagicMock(
+            filename="a.py", status="modified", additions=3, deletions=1, changes=4, patch="x"
+        )
+    ]
+    pr.additions, pr.deletions = 3, 1
+
+    result = await tool.function(MagicMock(deps=g), "o/r", 9)
+
+    assert result["files"] == [
+        {
+            "filename": "a.py",
+            "status": "modified",
+            "additions": 3,
+            "deletions": 1,
+            "changes": 4,
+            "patch": "x",
+        }
+    ]
+    assert (result["additions"], result["deletions"]) == (3, 1)
+
+
+async def test_github_comment_on_issue_background():
+    """wait=False returns before the issue is fetched or the comment posted."""
+    import threading
+
+    from angie.agents.dev.github import GitHubAgent
+
+    tool = GitHubAgent().build_pydantic_agent()._function_toolset.tools["comment_on_issue"]
+    release, posted = threading.Event(), threading.Event()
+    g = MagicMock()
+    issue = MagicMock()
+
+    def get_issue(number):
+        assert release.wait(timeout=5)
+        return issue
+
+    g.get_repo.return_value.get_issue.side_effect = get_issue
+    issue.create_comment.side_effect = lambda body: posted.set()
+
+    result = await tool.function(MagicMock(deps=g), "o/r", 12, "LGTM", wait=False)
+
+    assert result == {"queued": True, "issue_number": 12}
+    assert not posted.is_set()
+    release.set()
+    assert posted.wait(timeout=5)
+    issue.create_comment.assert_called_once_with("LGTM")
+
+
+def test_github_background_mutation_failure_logged(caplog):
+    import threading
+
+    from angie.agents.dev.github import _submit_mutation
+
+    def fail():
+        raise RuntimeError("boom")
+
+    logged = threading.Event()
+    with caplog.at_level("WARNING", logger="angie.agents.dev.github"):
+        future = _submit_mutation("close_issue", fail)
+        # Callbacks run in registration order, so this fires after the logging one
+        future.add_done_callback(lambda _: logged.set())
+        assert logged.wait(timeout=5)
+
+    assert "Background GitHub close_issue failed: boom" in caplog.text
+
+
+async def test_github_get_repository_cached_until_mutation():
+    """get_repository reuses a recent result until the client writes."""
+    from angie.agents.dev.github import GitHubAgent
+
+    tools = GitHubAgent().build_pydantic_agent()._function_toolset.tools
+    g = MagicMock()
+    g.requester.auth = None
+    g.get_repo.return_value.full_name = "o/r"
+    ctx = MagicMock(deps=g)
+
+    first = await tools["get_repository"].function(ctx, "o/r")
+    assert await tools["get_repository"].function(ctx, "o/r") == first
+    assert g.get_repo.call_count == 1
+
+    # Another client (another token) never sees this client's results
+    other = MagicMock()
+    other.requester.auth = None
+    await tools["get_repository"].function(MagicMock(deps=other), "o/r")
+    assert g.get_repo.call_count == 1
+
+    await tools["create_issue"].function(ctx, "o/r", "bug")
+    await tools["get_repository"].function(ctx, "o/r")
+    assert g.get_repo.call_count == 3  # create_issue + refetch
+
+
+def test_github_cached_read_skips_errors():
+    from angie.agents.dev.github import _cached_read
+
+    g = object()
+    fetch = MagicMock(side_effect=[RuntimeError("503"), ["ok"]])
+
+    with pytest.raises(RuntimeError):
+        _cached_read(g, ("list_repositories",), fetch)
+    assert _cached_read(g, ("list_repositories",), fetch) == ["ok"]
+    assert _cached_read(g, ("list_repositories",), fetch) == ["ok"]
+    assert fetch.call_count == 2
+
+
+async def test_github_list_pull_requests_graphql():
+    """With a token, list_pull_requests is one GraphQL query with REST-shaped rows."""
+    from angie.agents.dev.github import GitHubAgent
+
+    tool = GitHubAgent().build_pydantic_agent()._function_toolset.tools["list_pull_requests"]
+    nodes = [
+        {"number": 2, "title": "Fix", "state": "MERGED", "url": "u2", "author": {"login": "a"}},
+        {"number": 1, "title": "Old", "state": "CLOSED", "url": "u1", "author": None},
+    ]
+    g = MagicMock()
+    g.requester.graphql_query.return_value = (
+        {},
+        {"data": {"repository": {"pullRequests": {"nodes": nodes}}}},
+    )
+
+    result = await tool.function(MagicMock(deps=g), "o/r", "closed")
+
+    variables = g.requester.graphql_query.call_args[0][1]
+    assert variables == {"owner": "o", "name": "r", "first": 20, "states": ["CLOSED", "MERGED"]}
+    g.get_repo.assert_not_called()
+    assert result == [
+        {"number": 2, "title": "Fix", "state": "closed", "author": "a", "url": "u2"},
+        {"number": 1, "title": "Old", "state": "closed", "author": "ghost", "url": "u1"},
+    ]
+
+
+async def test_github_list_issues_rest_reads_first_page():
+    """Without a token the REST listing is one get_page(0), not an iterator."""
+    from angie.agents.dev.github import GitHubAgent
+
+    tool = GitHubAgent().build_pydantic_agent()._function_toolset.tools["list_issues"]
+    issue = MagicMock(number=1, title="Bug", state="open", html_url="u1")
+    issue.user.login = "a"
+    g = MagicMock()
+    g.requester.auth = None
+    listing = g.get_repo.return_value.get_issues.return_value
+    listing.get_page.return_value = [issue]
+
+    result = await tool.function(MagicMock(deps=g), "o/r")
+
+    listing.get_page.assert_called_once_with(0)
+    listing.__iter__.assert_not_called()
+    assert result == [{"number": 1, "title": "Bug", "state": "open", "author": "a", "url": "u1"}]
+
+
+async def test_github_listings_cached_until_issue_created():
+    """Issue listings are reused per (repo, state) until the client creates an issue."""
+    from angie.agents.dev.github import GitHubAgent
+
+    tools = GitHubAgent().build_pydantic_agent()._function_toolset.tools
+    g = MagicMock()
+    g.requester.graphql_query.return_value = (
+        {},
+        {"data": {"repository": {"issues": {"nodes": []}}}},
+    )
+    ctx = MagicMock(deps=g)
+
+    await tools["list_issues"].function(ctx, "o/r")
+    await tools["list_issues"].function(ctx, "o/r")
+    assert g.requester.graphql_query.call_count == 1
+    await tools["list_issues"].function(ctx, "o/r", "closed")
+    assert g.requester.graphql_query.call_count == 2
+
+    await tools["create_issue"].function(ctx, "o/r", "New")
+    await tools["list_issues"].function(ctx, "o/r")
+    assert g.requester.graphql_query.call_count == 3
+
+
+def test_github_get_repository_uses_longer_ttl():
+    from angie.agents.dev import github
+
+    fetch = MagicMock(return_value={"name": "o/r"})
+    g = object()
+    with patch("angie.agents.dev.github.time.monotonic", return_value=1000.0):
+        github._cached_read(g, ("get_repository", "o/r"), fetch, ttl=github._REPO_TTL)
+    with patch("angie.agents.dev.github.time.monotonic", return_value=1000.0 + 120):
+        github._cached_read(g, ("get_repository", "o/r"), fetch, ttl=github._REPO_TTL)
+        assert fetch.call_count == 1
+        github._cached_read(g, ("list_issues", "o/r"), fetch)
+        github._cached_read(g, ("list_issues", "o/r"), fetch)
+        assert fetch.call_count == 2
+
+
+async def test_github_get_repository_graphql():
+    from angie.agents.dev.github import GitHubAgent
+
+    tool = GitHubAgent().build_pydantic_agent()._function_toolset.tools["get_repository"]
+    repository = {
+        "nameWithOwner": "o/r",
+        "description": "d",
+        "stargazerCount": 5,
+        "forkCount": 2,
+        "url": "https://github.com/o/r",
+        "defaultBranchRef": {"name": "main"},
+        "issues": {"totalCount": 3},
+        "pullRequests": {"totalCount": 1},
+    }
+    g = MagicMock()
+    g.requester.graphql_query.return_value = ({}, {"data": {"repository": repository}})
+
+    result = await tool.function(MagicMock(deps=g), "o/r")
+
+    assert result == {
+        "name": "o/r",
+        "description": "d",
+        "stars": 5,
+        "forks": 2,
+        "open_issues": 4,
+        "default_branch": "main",
+        "url": "https://github.com/o/r",
+    }
+
+
 # ── Phase 2.3: SoftwareDev Agent Safety & Tools ─────────────────────────────
 
 
@@ -612,6 +1158,38 @@ def test_softwaredev_branch_name_validation():
     assert not _BRANCH_NAME_PATTERN.match("branch;rm -rf /")
 
 
+def test_softwaredev_parse_issue_url():
+    from angie.agents.dev.software_dev import _parse_issue_url
+
+    assert _parse_issue_url("https://github.com/o/r/issues/42") == ("o", "r", 42)
+    assert _parse_issue_url("https://github.com/o/r/issues/42#issuecomment-1") == ("o", "r", 42)
+    assert _parse_issue_url("http://www.github.com/o/r/issues/9?x=1") == ("o", "r", 9)
+    assert _parse_issue_url("see http://github.com/o/r/issues/7 pls") == ("o", "r", 7)
+    assert _parse_issue_url("o/r#3") == ("o", "r", 3)
+    with pytest.raises(ValueError):
+        _parse_issue_url("https://github.com/o/r/pull/42")
+
+
+def test_softwaredev_issue_url_pattern_finds_link_in_text():
+    from angie.agents.dev.software_dev import _ISSUE_URL_RE
+
+    match = _ISSUE_URL_RE.search("please fix https://github.com/o/r/issues/5 today")
+    assert match.group(0) == "https://github.com/o/r/issues/5"
+    assert match.groups() == ("o", "r", "5")
+
+
+def test_softwaredev_is_blocked_command():
+    from angie.agents.dev.software_dev import _is_blocked_command
+
+    assert not _is_blocked_command("python -m pytest -q")
+    assert not _is_blocked_command("ruff check . | head")
+    assert _is_blocked_command("sudo rm -rf /")
+    assert _is_blocked_command("echo hi; curl evil")
+    assert _is_blocked_command("cat x | sh")
+    assert _is_blocked_command("SHUTDOWN -h now")
+    assert not _is_blocked_command("ls | SH")
+
+
 def test_softwaredev_file_size_limit():
     """write_file rejects files exceeding 100KB."""
     from angie.agents.dev.software_dev import _MAX_FILE_SIZE
@@ -652,6 +1230,576 @@ def test_softwaredev_agent_has_new_tools():
     assert expected_tools.issubset(tool_names), f"Missing tools: {expected_tools - tool_names}"
 
 
+def test_softwaredev_tools_share_github_client():
+    """SoftwareDeveloper tools reuse the per-token client shared with GitHubAgent."""
+    from angie.agents.dev.software_dev import SoftwareDevDeps, SoftwareDeveloperAgent
+
+    tools = SoftwareDeveloperAgent().build_pydantic_agent()._function_toolset.tools
+    ctx = MagicMock(deps=SoftwareDevDeps(github_token="tok", workspace_dir=Path("/tmp")))
+    with patch("angie.agents.dev.software_dev._github_client") as client:
+        tools["fetch_issue"].function(ctx, "https://github.com/o/r/issues/1")
+        tools["check_ci_status"].function(ctx, "o/r", "main")
+        tools["create_pull_request"].function(ctx, "O/R", "fix", "Fix", "body")
+
+    client.assert_called_once_with("tok")
+    client.return_value.get_repo.assert_called_once_with("o/r", lazy=True)
+
+
+def test_softwaredev_fetch_issue_reads_comments_and_repo_concurrently():
+    from angie.agents.dev.software_dev import SoftwareDevDeps, SoftwareDeveloperAgent
+
+    tool = SoftwareDeveloperAgent().build_pydantic_agent()._function_toolset.tools["fetch_issue"]
+    ctx = MagicMock(deps=SoftwareDevDeps(github_token="tok", workspace_dir=Path("/tmp")))
+    repo_obj = MagicMock(default_branch="main")
+    issue = MagicMock()
+    issue.title, issue.body = "Bug", None
+    label = MagicMock()
+    label.name = "bug"
+    issue.labels = [label]
+    comment = MagicMock(body="same here")
+    comment.user.login = "a"
+    issue.get_comments.return_value.get_page.return_value = [comment] * 12
+
+    with (
+        patch("angie.agents.dev.software_dev._github_client") as client,
+        patch("angie.agents.dev.software_dev._lazy_issue", return_value=issue) as lazy_issue,
+    ):
+        client.return_value.get_repo.return_value = repo_obj
+        result = tool.function(ctx, "https://github.com/o/r/issues/7")
+
+    lazy_issue.assert_called_once_with(repo_obj, 7)
+    issue.get_comments.return_value.get_page.assert_called_once_with(0)
+    assert result == {
+        "owner": "o",
+        "repo": "r",
+        "number": 7,
+        "title": "Bug",
+        "body": "",
+        "labels": ["bug"],
+        "comments": [{"author": "a", "body": "same here"}] * 10,
+        "default_branch": "main",
+    }
+
+
+def test_softwaredev_lazy_issue_skips_fetch():
+    """_lazy_issue builds the issue and its comments URL without a request."""
+    from angie.agents.dev.github import _github_client
+    from angie.agents.dev.software_dev import _lazy_issue
+
+    _github_client.cache_clear()
+    g = _github_client("tok")
+    _github_client.cache_clear()
+
+    with patch.object(
+        g._Github__requester, "requestJsonAndCheck", side_effect=AssertionError("fetched")
+    ):
+        issue = _lazy_issue(g.get_repo("owner/repo", lazy=True), 5)
+        comments = issue.get_comments()
+
+    assert issue.url == "/repos/owner/repo/issues/5"
+    assert comments._PaginatedList__firstUrl == "/repos/owner/repo/issues/5/comments"
+
+
+def test_softwaredev_clone_repo_is_shallow(tmp_path):
+    """clone_repo fetches only the tip of the requested branch into the shared mirror."""
+    from angie.agents.dev.software_dev import SoftwareDevDeps, SoftwareDeveloperAgent
+
+    agent = SoftwareDeveloperAgent()
+    agent.settings = MagicMock(software_dev_mirrors_dir=str(tmp_path / "mirrors"))
+    tool = agent.build_pydantic_agent()._function_toolset.tools["clone_repo"]
+    ctx = MagicMock(deps=SoftwareDevDeps(github_token="tok", workspace_dir=tmp_path))
+    with (
+        patch("angie.agents.dev.software_dev._run_git") as run_git,
+        patch("angie.agents.dev.software_dev._remote_tip", return_value="") as remote_tip,
+    ):
+        result = tool.function(ctx, "o/r", "dev")
+
+    remote_tip.assert_called_once_with(ctx.deps, "o/r", "dev")
+    mirror = tmp_path / "mirrors" / "o_r.git"
+    assert result["cloned"] is True
+    assert ctx.deps.mirror_dir == mirror
+    assert [c.args[0] for c in run_git.call_args_list[:5]] == [
+        ["git", "init", "--bare", str(mirror)],
+        ["git", "remote", "add", "origin", "https://github.com/o/r.git"],
+        ["git", "fetch", "--depth=1", "origin", "+refs/heads/dev:refs/remotes/origin/dev"],
+        ["git", "worktree", "prune"],
+        [
+            "git",
+            "worktree",
+            "add",
+            "-B",
+            f"angie-task/{tmp_path.name}/dev",
+            str(tmp_path / "o_r"),
+            "origin/dev",
+        ],
+    ]
+
+
+def test_softwaredev_mirror_worktree_roundtrip(tmp_path):
+    """Worktrees share the mirror's objects and are removed with their branch."""
+    import shutil
+    import subprocess
+
+    from angie.agents.dev.software_dev import (
+        _fetch_into_mirror,
+        _mirror_lock,
+        _remove_worktree,
+        _run_git,
+    )
+
+    remote, seed = tmp_path / "remote.git", tmp_path / "seed"
+    git = ["git", "-c", "user.email=a@b.c", "-c", "user.name=A"]
+    subprocess.run(["git", "init", "-q", "--bare", str(remote)], check=True)
+    subprocess.run(["git", "clone", "-q", str(remote), str(seed)], check=True)
+    subprocess.run([*git, "commit", "-q", "--allow-empty", "-m", "one"], cwd=seed, check=True)
+    subprocess.run(["git", "push", "-q", "origin", "HEAD:main"], cwd=seed, check=True)
+    subprocess.run(["git", "symbolic-ref", "HEAD", "refs/heads/main"], cwd=remote, check=True)
+
+    mirror, work = tmp_path / "mirrors" / "o_r.git", tmp_path / "work"
+    env = dict(os.environ)
+    with _mirror_lock(mirror):
+        ref = _fetch_into_mirror(mirror, f"file://{remote}", "", env)
+        _run_git(["git", "worktree", "add", "--detach", str(work), ref], cwd=mirror, env=env)
+    subprocess.run([*git, "checkout", "-q", "-b", "task-1/angie/issue-1"], cwd=work, check=True)
+    subprocess.run([*git, "branch", "task-2/main"], cwd=work, check=True)
+
+    assert (work / ".git").is_file()
+    _remove_worktree(mirror, work, "task-1/")
+
+    assert not work.exists()
+    branches = _run_git(["git", "branch", "--list"], cwd=mirror).stdout
+    assert "task-1/angie/issue-1" not in branches
+    assert "task-2/main" in branches
+
+    # The mirror already holds the remote tip, so no fetch (and no remote) is needed
+    tip = _run_git(["git", "rev-parse", ref], cwd=mirror).stdout.strip()
+    shutil.rmtree(remote)
+    with _mirror_lock(mirror):
+        assert _fetch_into_mirror(mirror, f"file://{remote}", "", env, tip) == ref
+
+
+def test_softwaredev_concurrent_tasks_share_branch_names(tmp_path):
+    """Two tasks on one mirror can check out, create and push the same branches."""
+    import subprocess
+
+    from angie.agents.dev.software_dev import (
+        SoftwareDevDeps,
+        SoftwareDeveloperAgent,
+        _cleanup_workspace,
+    )
+
+    remote, seed = tmp_path / "remote.git", tmp_path / "seed"
+    git = ["git", "-c", "user.email=a@b.c", "-c", "user.name=A"]
+    subprocess.run(["git", "init", "-q", "--bare", str(remote)], check=True)
+    subprocess.run(["git", "clone", "-q", str(remote), str(seed)], check=True)
+    subprocess.run([*git, "commit", "-q", "--allow-empty", "-m", "one"], cwd=seed, check=True)
+    subprocess.run(["git", "push", "-q", "origin", "HEAD:main"], cwd=seed, check=True)
+
+    agent = SoftwareDeveloperAgent()
+    agent.settings = MagicMock(software_dev_mirrors_dir=str(tmp_path / "mirrors"))
+    tools = agent.build_pydantic_agent()._function_toolset.tools
+    env = {**os.environ, "GIT_CONFIG_COUNT": "1"}
+    env.update(GIT_CONFIG_KEY_0=f"url.file://{remote}.insteadOf")
+    env.update(GIT_CONFIG_VALUE_0="https://github.com/o/r.git")
+    tasks = []
+    for name in ("task-a", "task-b"):
+        (tmp_path / name).mkdir()
+        deps = SoftwareDevDeps(workspace_dir=tmp_path / name, _git_env=env)
+        tasks.append(deps)
+        with patch("angie.agents.dev.software_dev._remote_tip", return_value=""):
+            assert tools["clone_repo"].function(MagicMock(deps=deps), "o/r", "main")["cloned"]
+        ctx = MagicMock(deps=deps)
+        assert tools["create_branch"].function(ctx, "fix")["created"]
+        (deps.repo_dir / f"{name}.txt").write_text(name)
+        result = tools["commit_and_push"].function(ctx, name)
+        assert result["branch"] == "fix", result
+
+    pushed = subprocess.run(
+        ["git", "log", "-1", "--format=%s", "fix"], cwd=remote, capture_output=True, text=True
+    )
+    assert pushed.stdout == "task-b\n"
+    for deps in tasks:
+        _cleanup_workspace(deps.workspace_dir, deps.mirror_dir, deps.repo_dir)
+    branches = subprocess.run(
+        ["git", "branch", "--list"], cwd=tmp_path / "mirrors" / "o_r.git", capture_output=True
+    )
+    assert branches.stdout == b""
+
+
+def test_softwaredev_clone_repo_again_keeps_task_commits(tmp_path):
+    """Cloning into an existing mirror worktree fast-forwards it without losing work."""
+    import subprocess
+
+    from angie.agents.dev.software_dev import SoftwareDevDeps, SoftwareDeveloperAgent
+
+    remote, seed = tmp_path / "remote.git", tmp_path / "seed"
+    git = ["git", "-c", "user.email=a@b.c", "-c", "user.name=A"]
+    subprocess.run(["git", "init", "-q", "--bare", str(remote)], check=True)
+    subprocess.run(["git", "clone", "-q", str(remote), str(seed)], check=True)
+    subprocess.run([*git, "commit", "-q", "--allow-empty", "-m", "one"], cwd=seed, check=True)
+    subprocess.run(["git", "push", "-q", "origin", "HEAD:main"], cwd=seed, check=True)
+
+    agent = SoftwareDeveloperAgent()
+    agent.settings = MagicMock(software_dev_mirrors_dir=str(tmp_path / "mirrors"))
+    clone = agent.build_pydantic_agent()._function_toolset.tools["clone_repo"].function
+    env = {**os.environ, "GIT_CONFIG_COUNT": "1"}
+    env.update(GIT_CONFIG_KEY_0=f"url.file://{remote}.insteadOf")
+    env.update(GIT_CONFIG_VALUE_0="https://github.com/o/r.git")
+    (tmp_path / "task").mkdir()
+    deps = SoftwareDevDeps(workspace_dir=tmp_path / "task", _git_env=env)
+    ctx = MagicMock(deps=deps)
+
+    def subjects() -> list[str]:
+        log = ["git", "log", "--format=%s"]
+        return subprocess.run(log, cwd=deps.repo_dir, capture_output=True, text=True).stdout.split()
+
+    with patch("angie.agents.dev.software_dev._remote_tip", return_value=""):
+        assert clone(ctx, "o/r", "main")["cloned"]
+        subprocess.run([*git, "commit", "-q", "--allow-empty", "-m", "two"], cwd=seed, check=True)
+        subprocess.run(["git", "push", "-q", "origin", "HEAD:main"], cwd=seed, check=True)
+        assert clone(ctx, "o/r", "main")["cloned"]
+        assert subjects() == ["two", "one"]
+        subprocess.run([*git, "commit", "-q", "--allow-empty", "-m", "mine"], cwd=deps.repo_dir)
+        assert clone(ctx, "o/r", "main")["cloned"]
+    assert subjects() == ["mine", "two", "one"]
+
+
+def test_softwaredev_clone_repo_sparse_paths(tmp_path):
+    """clone_repo with paths checks out only those directories, widening on demand."""
+    from angie.agents.dev.software_dev import SoftwareDevDeps, SoftwareDeveloperAgent
+
+    tools = SoftwareDeveloperAgent().build_pydantic_agent()._function_toolset.tools
+    ctx = MagicMock(deps=SoftwareDevDeps(github_token="tok", workspace_dir=tmp_path))
+    with patch("angie.agents.dev.software_dev._run_git") as run_git:
+        result = tools["clone_repo"].function(ctx, "o/r", paths=["pkg/api"])
+        (tmp_path / "o_r" / "pkg" / "api").mkdir(parents=True)
+        tools["read_file"].function(ctx, "pkg/api/app.py")
+        tools["read_file"].function(ctx, "pkg/web/index.ts")
+
+    assert result["sparse"] is True
+    cmds = [c.args[0] for c in run_git.call_args_list]
+    assert cmds[0][-4:] == [
+        "--filter=blob:none",
+        "--sparse",
+        "https://github.com/o/r.git",
+        str(tmp_path / "o_r"),
+    ]
+    assert cmds[1] == ["git", "sparse-checkout", "set", "--cone", "pkg/api"]
+    assert cmds[-1] == ["git", "sparse-checkout", "add", "pkg/web"]
+    assert ["git", "sparse-checkout", "add", "pkg/api"] not in cmds
+
+
+def test_softwaredev_commit_and_push_reports_branch_and_sha(tmp_path):
+    import subprocess
+
+    from angie.agents.dev.software_dev import SoftwareDevDeps, SoftwareDeveloperAgent
+
+    remote, repo = tmp_path / "remote.git", tmp_path / "repo"
+    subprocess.run(["git", "init", "-q", "--bare", str(remote)], check=True)
+    subprocess.run(["git", "clone", "-q", str(remote), str(repo)], check=True)
+    for key, value in (("user.email", "a@b.c"), ("user.name", "A")):
+        subprocess.run(["git", "config", key, value], cwd=repo, check=True)
+    (repo / "f.txt").write_text("hi")
+    tool = (
+        SoftwareDeveloperAgent().build_pydantic_agent()._function_toolset.tools["commit_and_push"]
+    )
+    deps = SoftwareDevDeps(workspace_dir=tmp_path, repo_dir=repo, _git_env=dict(os.environ))
+    ctx = MagicMock(deps=deps)
+
+    result = tool.function(ctx, 'fix: "quoted" $HOME `msg`')
+
+    head = subprocess.run(
+        ["git", "log", "-1", "--format=%H %s"], cwd=repo, capture_output=True, text=True
+    ).stdout.split(" ", 1)
+    branch = subprocess.run(
+        ["git", "branch", "--show-current"], cwd=repo, capture_output=True, text=True
+    ).stdout.strip()
+    assert result == {"committed": True, "branch": branch, "sha": head[0]}
+    assert head[1] == 'fix: "quoted" $HOME `msg`\n'
+    assert "error" in tool.function(ctx, "nothing to commit")
+
+
+def test_softwaredev_read_file_truncates_at_limit(tmp_path):
+    from angie.agents.dev.software_dev import SoftwareDevDeps, SoftwareDeveloperAgent
+
+    (tmp_path / "big.log").write_bytes(b"x" * 60_000)
+    (tmp_path / "small.txt").write_bytes(b"y" * 50_000)
+    tool = SoftwareDeveloperAgent().build_pydantic_agent()._function_toolset.tools["read_file"]
+    ctx = MagicMock(deps=SoftwareDevDeps(workspace_dir=tmp_path, repo_dir=tmp_path))
+
+    assert tool.function(ctx, "big.log")["content"] == "x" * 50_000 + "\n... (truncated)"
+    assert tool.function(ctx, "small.txt")["content"] == "y" * 50_000
+
+    with open(tmp_path / "bundle.js", "wb") as fh:
+        fh.truncate(6 * 1024 * 1024)
+    assert "too large" in tool.function(ctx, "bundle.js")["error"]
+    assert "not found" in tool.function(ctx, "missing.py")["error"]
+
+
+def test_softwaredev_list_directory_sorted_without_dotfiles(tmp_path):
+    from angie.agents.dev.software_dev import SoftwareDevDeps, SoftwareDeveloperAgent
+
+    (tmp_path / "src").mkdir()
+    (tmp_path / ".git").mkdir()
+    (tmp_path / "README.md").write_text("hi")
+    (tmp_path / "Makefile").write_text("")
+    tool = SoftwareDeveloperAgent().build_pydantic_agent()._function_toolset.tools["list_directory"]
+    ctx = MagicMock(deps=SoftwareDevDeps(workspace_dir=tmp_path, repo_dir=tmp_path))
+
+    assert tool.function(ctx)["entries"] == [
+        {"name": "Makefile", "type": "file"},
+        {"name": "README.md", "type": "file"},
+        {"name": "src", "type": "dir"},
+    ]
+
+
+def test_softwaredev_list_directory_cached_until_dir_changes(tmp_path):
+    from angie.agents.dev.software_dev import SoftwareDevDeps, SoftwareDeveloperAgent
+
+    (tmp_path / "a.py").write_text("")
+    tool = SoftwareDeveloperAgent().build_pydantic_agent()._function_toolset.tools["list_directory"]
+    ctx = MagicMock(deps=SoftwareDevDeps(workspace_dir=tmp_path, repo_dir=tmp_path))
+
+    first = tool.function(ctx)["entries"]
+    with patch("angie.agents.dev.software_dev.os.scandir") as scandir:
+        assert tool.function(ctx)["entries"] is first
+    scandir.assert_not_called()
+
+    (tmp_path / "b.py").write_text("")
+    os.utime(tmp_path, ns=(0, tmp_path.stat().st_mtime_ns + 1))
+    assert [e["name"] for e in tool.function(ctx)["entries"]] == ["a.py", "b.py"]
+
+
+def test_softwaredev_search_lines_stops_at_limit(tmp_path):
+    """_search_lines returns the first 50 matches and ignores other file types."""
+    from angie.agents.dev.software_dev import _search_lines
+
+    (tmp_path / "big.py").write_text("needle\n" * 500)
+    (tmp_path / "notes.txt").write_text("needle\n")
+
+    with patch("angie.agents.dev.software_dev._RG", None):
+        matches = _search_lines("needle", tmp_path)
+
+    assert len(matches) == 50
+    assert matches[0] == "big.py:1:needle"
+
+
+def test_softwaredev_search_lines_reads_extended_regex(tmp_path):
+    """Every search path reads the pattern as ripgrep does, and reports bad ones."""
+    import subprocess
+
+    from angie.agents.dev.software_dev import _search_lines
+
+    (tmp_path / "app.py").write_text("def foo(x):\n    return bar(x)\n")
+
+    with patch("angie.agents.dev.software_dev._RG", None):
+        assert _search_lines("foo|bar", tmp_path) == [
+            "app.py:1:def foo(x):",
+            "app.py:2:    return bar(x)",
+        ]
+        with pytest.raises(subprocess.CalledProcessError) as exc_info:
+            _search_lines("def foo(", tmp_path)
+    assert exc_info.value.returncode == 2
+    assert exc_info.value.stderr
+
+
+def test_softwaredev_search_code_reports_failed_search(tmp_path):
+    import subprocess
+
+    from angie.agents.dev.software_dev import SoftwareDevDeps, SoftwareDeveloperAgent
+
+    tool = SoftwareDeveloperAgent().build_pydantic_agent()._function_toolset.tools["search_code"]
+    ctx = MagicMock(deps=SoftwareDevDeps(workspace_dir=tmp_path, repo_dir=tmp_path))
+    error = subprocess.CalledProcessError(2, ["rg"], stderr="regex parse error\n")
+    with patch("angie.agents.dev.software_dev._search_lines", side_effect=error):
+        result = tool.function(ctx, "def foo(")
+
+    assert result == {"error": "Search failed: regex parse error\n"}
+
+
+def test_softwaredev_search_lines_git_grep_skips_untracked(tmp_path):
+    """Without ripgrep, git checkouts are searched with git grep."""
+    import subprocess
+
+    from angie.agents.dev.software_dev import _search_lines
+
+    subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+    (tmp_path / ".gitignore").write_text("node_modules/\n")
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "app.py").write_text("x = 1\nneedle = 2\n")
+    (tmp_path / "node_modules").mkdir()
+    (tmp_path / "node_modules" / "dep.js").write_text("needle\n")
+    subprocess.run(["git", "add", "-A"], cwd=tmp_path, check=True)
+
+    with patch("angie.agents.dev.software_dev._RG", None):
+        matches = _search_lines("needle", tmp_path)
+        assert _search_lines("x|needle", tmp_path) == ["pkg/app.py:1:x = 1", *matches]
+        with pytest.raises(subprocess.CalledProcessError):
+            _search_lines("needle(", tmp_path)
+
+    assert matches == ["pkg/app.py:2:needle = 2"]
+
+
+def test_softwaredev_search_lines_timeout(tmp_path):
+    import subprocess
+
+    from angie.agents.dev.software_dev import _search_lines
+
+    with (
+        patch("angie.agents.dev.software_dev._RG", None),
+        patch("angie.agents.dev.software_dev._SEARCH_TIMEOUT", 0.01),
+        patch("angie.agents.dev.software_dev._SEARCH_GLOBS", ()),
+        patch("angie.agents.dev.software_dev.subprocess.Popen") as popen,
+    ):
+        popen.return_value.stdout = _SlowLines()
+        popen.return_value.kill.side_effect = popen.return_value.stdout.close
+        with pytest.raises(subprocess.TimeoutExpired):
+            _search_lines("x", tmp_path)
+
+
+class _SlowLines:
+    """A pipe that yields nothing until it's closed."""
+
+    def __init__(self) -> None:
+        import threading
+
+        self._closed = threading.Event()
+
+    def __iter__(self):
+        self._closed.wait(5)
+        return iter(())
+
+    def close(self) -> None:
+        self._closed.set()
+
+
+def test_softwaredev_run_with_tails_keeps_only_the_end(tmp_path):
+    from angie.agents.dev.software_dev import _run_with_tails
+
+    returncode, stdout, stderr = _run_with_tails(
+        ["sh", "-c", "seq 1 100000; echo oops >&2; exit 3"],
+        cwd=tmp_path,
+        env=dict(os.environ),
+        timeout=30,
+        stdout_limit=13,
+        stderr_limit=2000,
+    )
+
+    assert returncode == 3
+    assert stdout == "99999\n100000\n"
+    assert stderr == "oops\n"
+
+
+def test_softwaredev_run_tests_returns_output_tail(tmp_path):
+    from angie.agents.dev.software_dev import SoftwareDevDeps, SoftwareDeveloperAgent
+
+    tool = SoftwareDeveloperAgent().build_pydantic_agent()._function_toolset.tools["run_tests"]
+    ctx = MagicMock(deps=SoftwareDevDeps(workspace_dir=tmp_path, repo_dir=tmp_path))
+
+    result = tool.function(ctx, "seq 1 100000 && false")
+
+    assert result["passed"] is False
+    assert len(result["stdout"]) == 5000
+    assert result["stdout"].endswith("99999\n100000\n")
+
+
+def test_softwaredev_run_with_tails_timeout(tmp_path):
+    import subprocess
+
+    from angie.agents.dev.software_dev import _run_with_tails
+
+    with pytest.raises(subprocess.TimeoutExpired):
+        _run_with_tails(
+            ["sleep", "5"],
+            cwd=tmp_path,
+            env=dict(os.environ),
+            timeout=0.1,
+            stdout_limit=10,
+            stderr_limit=10,
+        )
+
+
+def test_softwaredev_run_with_tails_ignores_background_children(tmp_path):
+    """A backgrounded child holding the output pipes doesn't hold up the call."""
+    import subprocess
+    import time
+
+    from angie.agents.dev.software_dev import _run_with_tails
+
+    started = time.monotonic()
+    returncode, stdout, _ = _run_with_tails(
+        ["sh", "-c", "sleep 30 & echo done"],
+        cwd=tmp_path,
+        env=dict(os.environ),
+        timeout=10,
+        stdout_limit=100,
+        stderr_limit=100,
+    )
+    assert (returncode, stdout) == (0, "done\n")
+
+    with pytest.raises(subprocess.TimeoutExpired):
+        _run_with_tails(
+            ["sh", "-c", "sleep 30 & sleep 20"],
+            cwd=tmp_path,
+            env=dict(os.environ),
+            timeout=0.5,
+            stdout_limit=10,
+            stderr_limit=10,
+        )
+    assert time.monotonic() - started < 10
+
+
+@pytest.mark.asyncio
+async def test_softwaredev_execute_cleans_up_in_background():
+    """execute hands workspace removal to a thread instead of deleting inline."""
+    import threading
+
+    from angie.agents.dev.software_dev import SoftwareDeveloperAgent
+
+    agent = SoftwareDeveloperAgent()
+    agent._credentials_and_history = AsyncMock(return_value=(None, []))
+    with (
+        patch.dict(os.environ, {"GITHUB_TOKEN": ""}),
+        patch("angie.agents.dev.software_dev._github_module"),
+        patch("angie.agents.dev.software_dev._cleanup_workspace") as cleanup,
+    ):
+        result = await agent.execute({"user_id": "u1", "input_data": {}})
+        for thread in threading.enumerate():
+            if thread.name == "angie-workspace-cleanup":
+                thread.join()
+
+    assert "No GitHub credentials" in result["error"]
+    workspace_dir, mirror_dir, repo_dir = cleanup.call_args.args
+    assert workspace_dir.name.startswith("angie-workspace-")
+    assert (mirror_dir, repo_dir) == (None, None)
+    workspace_dir.rmdir()
+
+
+def test_softwaredev_askpass_prints_token_verbatim(tmp_path):
+    import subprocess
+
+    from angie.agents.dev.software_dev import _build_git_env
+
+    token = "it's $HOME `x`"
+    env = _build_git_env(token, tmp_path)
+    script = Path(env["GIT_ASKPASS"])
+
+    assert script.stat().st_mode & 0o777 == 0o700
+    assert subprocess.run([script], capture_output=True, text=True).stdout == token + "\n"
+
+
+def test_softwaredev_sanitize_token_scrubs_all_forms():
+    from angie.agents.dev.software_dev import _sanitize_token
+
+    token = "tok/with+chars"
+    other = "ghp_" + "a" * 36
+    text = f"x-access-token:{token}@github.com tok%2Fwith%2Bchars leaked {other} ok"
+
+    assert _sanitize_token(text, token) == "x-access-token:***@github.com *** leaked *** ok"
+    assert _sanitize_token(f"see {other}", "") == "see ***"
+    assert _sanitize_token("", token) == ""
+
+
 def test_softwaredev_get_dir_size():
     """_get_dir_size calculates directory size."""
     import tempfile
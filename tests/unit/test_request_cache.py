@@ -0,0 +1,45 @@
+"""Tests for angie.core.request_cache."""
+
+import asyncio
+import contextvars
+from unittest.mock import AsyncMock
+
+from angie.core.request_cache import get_history_cached, reset_request_cache
+
+
+async def _in_fresh_context(coro_fn):
+    ctx = contextvars.copy_context()
+    return await asyncio.get_running_loop().create_task(coro_fn(), context=ctx)
+
+
+async def test_get_history_cached_without_scope_calls_loader():
+    loader = AsyncMock(return_value=[{"role": "user", "content": "hi"}])
+
+    async def run():
+        await get_history_cached("c1", 5, loader)
+        await get_history_cached("c1", 5, loader)
+
+    await _in_fresh_context(run)
+    assert loader.await_count == 2
+
+
+async def test_get_history_cached_coalesces_within_scope():
+    calls = 0
+
+    async def loader(conversation_id, limit):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        return [{"role": "user", "content": f"{conversation_id}:{limit}"}]
+
+    async def run():
+        reset_request_cache()
+        results = await asyncio.gather(*(get_history_cached("c1", 5, loader) for _ in range(3)))
+        other = await get_history_cached("c1", 20, loader)
+        return results, other
+
+    results, other = await _in_fresh_context(run)
+    assert calls == 2
+    assert all(r == [{"role": "user", "content": "c1:5"}] for r in results)
+    assert results[0] is not results[1]
+    assert other == [{"role": "user", "content": "c1:20"}]
@@ -209,10 +209,10 @@ def test_get_provider_and_model_non_anthropic():
 
 
 def test_record_usage_fire_and_forget_with_running_loop():
-    """Covers the asyncio.create_task() branch."""
+    """Inside batched_usage() the rows are buffered and written in one batch."""
     import asyncio
 
-    from angie.core.token_usage import record_usage_fire_and_forget
+    from angie.core.token_usage import batched_usage, record_usage_fire_and_forget
 
     mock_usage = MagicMock()
     mock_usage.input_tokens = 10
@@ -220,22 +220,131 @@ def test_record_usage_fire_and_forget_with_running_loop():
     mock_usage.total_tokens = 15
     mock_usage.requests = 1
 
-    with patch("angie.core.token_usage.record_usage", new_callable=AsyncMock) as mock_record:
-        mock_record.return_value = None
+    with (
+        patch("angie.core.token_usage._write_rows", new_callable=AsyncMock) as mock_write,
+        patch("angie.core.token_usage._get_provider_and_model", return_value=("openai", "gpt-4o")),
+    ):
 
         async def _run():
-            record_usage_fire_and_forget(
-                user_id="u1",
-                agent_slug="test",
-                usage=mock_usage,
-                source="test",
-            )
-            # Let the event loop process the created task
-            await asyncio.sleep(0.05)
+            async with batched_usage():
+                for _ in range(3):
+                    record_usage_fire_and_forget(
+                        user_id="u1",
+                        agent_slug="test",
+                        usage=mock_usage,
+                        source="test",
+                    )
+                mock_write.assert_not_called()
+                # Let the batch interval elapse
+                await asyncio.sleep(0.15)
 
         asyncio.run(_run())
 
-    mock_record.assert_called_once()
+    mock_write.assert_called_once()
+    rows = mock_write.call_args[0][0]
+    assert len(rows) == 3
+    assert rows[0]["agent_slug"] == "test"
+    assert rows[0]["total_tokens"] == 15
+    assert rows[0]["estimated_cost_usd"] > 0
+
+
+def test_record_usage_fire_and_forget_buffer_full_writes_directly():
+    import asyncio
+
+    from angie.core.token_usage import UsageBatcher, batched_usage, record_usage_fire_and_forget
+
+    with (
+        patch("angie.core.token_usage._write_rows", new_callable=AsyncMock) as mock_write,
+        patch("angie.core.token_usage._get_provider_and_model", return_value=("openai", "gpt-4o")),
+        patch(
+            "angie.core.token_usage.get_usage_batcher",
+            return_value=UsageBatcher(maxsize=0),
+        ),
+    ):
+
+        async def _run():
+            async with batched_usage():
+                record_usage_fire_and_forget(
+                    user_id="u1", agent_slug="test", usage=MagicMock(), source="test"
+                )
+
+        asyncio.run(_run())
+
+    mock_write.assert_called_once()
+    assert len(mock_write.call_args[0][0]) == 1
+
+
+async def test_usage_batcher_flushes_at_batch_size():
+    from angie.core.token_usage import UsageBatcher
+
+    batcher = UsageBatcher(batch_size=2, interval=60.0)
+    with patch("angie.core.token_usage._write_rows", new_callable=AsyncMock) as mock_write:
+        batcher.submit({"n": 1})
+        batcher.submit({"n": 2})
+        batcher.submit({"n": 3})
+        await batcher.flush()
+
+    assert [call.args[0] for call in mock_write.call_args_list] == [
+        [{"n": 1}, {"n": 2}],
+        [{"n": 3}],
+    ]
+
+
+def test_usage_batcher_is_per_loop():
+    """Each event loop buffers and flushes its own rows."""
+    import asyncio
+
+    from angie.core.token_usage import get_usage_batcher
+
+    async def _batcher():
+        return get_usage_batcher()
+
+    first, second = asyncio.run(_batcher()), asyncio.run(_batcher())
+    assert first is not second
+
+
+async def test_batched_usage_flushes_on_exit():
+    from angie.core.token_usage import batched_usage, track_usage
+
+    with (
+        patch("angie.core.token_usage._write_rows", new_callable=AsyncMock) as mock_write,
+        patch("angie.core.token_usage._get_provider_and_model", return_value=("openai", "gpt-4o")),
+    ):
+        async with batched_usage():
+            await track_usage(user_id="u1", agent_slug="a", usage=MagicMock(), source="test")
+            mock_write.assert_not_called()
+
+    mock_write.assert_awaited_once()
+
+
+async def test_track_usage_writes_directly_outside_batching():
+    """Without batched_usage() (e.g. CLI runs) the row is written before returning."""
+    from angie.core.token_usage import track_usage
+
+    with patch("angie.core.token_usage.record_usage", new_callable=AsyncMock) as mock_record:
+        await track_usage(user_id="u1", agent_slug="a", usage=MagicMock(), source="test")
+
+    mock_record.assert_awaited_once_with(
+        user_id="u1", agent_slug="a", usage=mock_record.await_args.kwargs["usage"], source="test"
+    )
+
+
+async def test_write_rows_single_insert():
+    from angie.core.token_usage import _write_rows
+
+    mock_session = AsyncMock()
+    mock_context = AsyncMock()
+    mock_context.__aenter__ = AsyncMock(return_value=mock_session)
+    mock_context.__aexit__ = AsyncMock(return_value=False)
+    mock_factory = MagicMock(return_value=mock_context)
+
+    rows = [{"source": "test"}, {"source": "test"}]
+    with patch("angie.db.session.get_session_factory", return_value=mock_factory):
+        await _write_rows(rows)
+
+    mock_session.execute.assert_awaited_once()
+    assert mock_session.execute.call_args[0][1] == rows
+    mock_session.commit.assert_awaited_once()
 
 
 def test_record_usage_fire_and_forget_no_loop():
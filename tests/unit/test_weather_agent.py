@@ -73,6 +73,30 @@ async def test_get_current_weather_success():
     assert "65%" in result["humidity"]
 
 
+@pytest.mark.anyio
+async def test_get_current_weather_reuses_run_client():
+    agent = WeatherAgent()
+    pa = agent.build_pydantic_agent()
+    tool = pa._function_toolset.tools["get_current_weather"]
+
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = {"name": "Toronto", "main": {"temp": 20}}
+    shared = AsyncMock()
+    shared.get = AsyncMock(return_value=mock_response)
+
+    mock_ctx = MagicMock()
+    mock_ctx.deps = {"api_key": "test-key", "http": shared}
+
+    with patch("angie.agents.lifestyle.weather.httpx.AsyncClient") as client_cls:
+        result = await tool.function(mock_ctx, location="Toronto")
+
+    client_cls.assert_not_called()
+    shared.get.assert_awaited_once()
+    shared.__aexit__.assert_not_called()
+    assert result["location"] == "Toronto"
+
+
 @pytest.mark.anyio
 async def test_get_current_weather_api_error():
     agent = WeatherAgent()
@@ -293,3 +317,29 @@ async def test_execute_with_credentials():
         )
 
     assert result["summary"] == "It's 22°C and sunny in Toronto."
+
+
+@pytest.mark.anyio
+async def test_execute_reuses_result_for_repeated_intent():
+    agent = WeatherAgent()
+    mock_run = AsyncMock()
+    mock_run.return_value.output = "It's 22°C and sunny in Toronto."
+
+    with (
+        patch.object(
+            agent, "get_credentials", new_callable=AsyncMock, return_value={"api_key": "k"}
+        ),
+        patch.object(agent, "_get_agent") as mock_agent,
+        patch("angie.llm.get_llm_model", return_value="test-model"),
+    ):
+        mock_agent.return_value.run = mock_run
+        first = await agent.execute(
+            {"user_id": "u1", "input_data": {"intent": "weather in Toronto"}}
+        )
+        second = await agent.execute(
+            {"user_id": "u1", "input_data": {"intent": "Weather in Toronto?"}}
+        )
+        await agent.execute({"user_id": "u2", "input_data": {"intent": "weather in Toronto"}})
+
+    assert first == second
+    assert mock_run.await_count == 2
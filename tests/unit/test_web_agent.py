@@ -23,6 +23,8 @@ def test_web_agent_classvars():
     assert "screenshot" in agent.capabilities
     assert "browse" in agent.capabilities
     assert "summarize" in agent.capabilities
+    # Page summaries are pure, so ask_llm() answers are cached
+    assert agent.response_cache.enabled
 
 
 def test_web_agent_description():
@@ -197,6 +197,7 @@ def test_execute_workflow_runs_steps():
 
     with (
         patch("angie.core.workflows.WorkflowExecutor") as mock_cls,
+        patch("angie.queue.workers._run_workflow", MagicMock()),
         patch("asyncio.run", return_value={"done": True}),
     ):
         mock_executor = MagicMock()
@@ -216,6 +217,7 @@ def test_execute_workflow_exception_path():
 
     with (
         patch("angie.core.workflows.WorkflowExecutor") as mock_cls,
+        patch("angie.queue.workers._run_workflow", MagicMock()),
         patch("asyncio.run", side_effect=RuntimeError("db dead")),
     ):
         mock_executor = MagicMock()